@@ -0,0 +1,127 @@
+"""
+Record Memory Benchmark for DuPont Tedlar Lead Generation
+
+Compares the memory held by N qualified companies stored as plain dicts
+(the pipeline's JSON shape) and as the slotted records in src.models, and
+times their JSON round trip. Each representation is measured in its own
+process with tracemalloc, counting only the containers: the field values
+come from a shared pool, as they would after string interning.
+
+Usage:
+    python -m benchmarks.record_memory [--companies 1000000] [--stakeholders 0]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from src.models import Company
+
+EVENTS = [("ISA Sign Expo", "2025-04-23"), ("FESPA Global Print Expo", "2025-05-14"),
+          ("SGIA Expo", "2025-09-12"), ("Graphics of the Americas", "2025-02-27")]
+ASSOCIATIONS = ["International Sign Association (ISA)", "Printing Industries of America (PIA)",
+                "Association of Plastic Film Manufacturers"]
+TITLES = ["VP of Product Development", "Director of Innovation", "Head of R&D"]
+
+def make_company(i: int, stakeholders: int) -> dict:
+    """Synthetic qualified company in the pipeline's dict shape."""
+    company = {
+        'name': f"Company {i}",
+        'website': f"https://www.company{i}.com",
+        'industry': "Vehicle Wraps",
+        'events': [
+            {'event_name': name, 'event_date': date, 'booth_number': "#664", 'sponsorship': bool(i & 1)}
+            for name, date in EVENTS
+        ],
+        'associations': [
+            {'association_name': name, 'membership_level': "Silver", 'years_member': 11,
+             'committee_participation': False}
+            for name in ASSOCIATIONS
+        ],
+        'estimated_revenue': "$100M - $500M",
+        'employee_count': 4674,
+        'keywords': ["durable graphics", "vehicle wraps"],
+        'industry_score': 10.0,
+        'size_score': 9.0,
+        'keyword_score': 6.0,
+        'engagement_score': 8.5,
+        'overall_score': 8.6,
+        'is_qualified': True,
+        'qualification_rationale': "Strong industry alignment (Vehicle Wraps)."
+    }
+    if stakeholders:
+        company['stakeholders'] = [
+            {'name': "Mary Smith", 'title': TITLES[j % len(TITLES)], 'department': "R&D",
+             'years_at_company': 5, 'location': "Boston, MA",
+             'linkedin_url': "https://www.linkedin.com/in/mary-smith", 'relevance_score': 9.1,
+             'email': "mary.smith@company.com", 'title_match_score': 10.0, 'seniority_score': 9.0,
+             'overall_score': 9.7, 'interest_areas': ["material innovation"]}
+            for j in range(stakeholders)
+        ]
+    return company
+
+def measure(variant: str, count: int, stakeholders: int) -> dict:
+    """Build `count` companies in one representation and report their memory and round-trip time."""
+    template = make_company(0, stakeholders)
+
+    def fresh() -> dict:
+        # Rebuild the containers around the shared values, as json.load would
+        company = {key: value for key, value in template.items()}
+        for key in ('events', 'associations', 'stakeholders'):
+            if key in company:
+                company[key] = [dict(item) for item in company[key]]
+        return company
+
+    tracemalloc.start()
+    if variant == 'dict':
+        companies = [fresh() for _ in range(count)]
+    else:
+        companies = [Company.from_dict(fresh()) for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sample = companies[:min(count, 100000)]
+    start = time.perf_counter()
+    if variant == 'dict':
+        text = json.dumps(sample)
+        json.loads(text)
+    else:
+        text = json.dumps([company.to_dict() for company in sample])
+        [Company.from_dict(company) for company in json.loads(text)]
+    round_trip = time.perf_counter() - start
+
+    return {'variant': variant, 'bytes': current, 'round_trip_seconds': round_trip, 'sample': len(sample)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--companies', type=int, default=1000000)
+    parser.add_argument('--stakeholders', type=int, default=0, help="Stakeholders per company")
+    parser.add_argument('--variant', choices=['dict', 'record'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(measure(args.variant, args.companies, args.stakeholders)))
+        return
+
+    results = {}
+    for variant in ('dict', 'record'):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.record_memory', '--companies', str(args.companies),
+             '--stakeholders', str(args.stakeholders), '--variant', variant],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results[variant] = json.loads(output)
+
+    print(f"{args.companies:,} companies, {args.stakeholders} stakeholders each")
+    for variant, result in results.items():
+        print(f"  {variant:<7} {result['bytes'] / 2**20:10.1f} MiB  "
+              f"{result['bytes'] / args.companies:7.0f} B/company  "
+              f"JSON round trip {result['round_trip_seconds']:.2f}s per {result['sample']:,}")
+    saved = 1 - results['record']['bytes'] / results['dict']['bytes']
+    print(f"  records use {saved:.0%} less memory")
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,10 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import streamlit as st
 
-from src.utils import load_json
+from src.email_sender import EmailSender
+from src.normalized_data import NormalizedCompanies, load_normalized_companies
+from src.outreach_journal import OutreachJournal
+from src.utils import load_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,22 +29,71 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def load_lead_data(data_path: str = 'data/leads_with_outreach.json') -> List[Dict]:
+def load_lead_data(data_path: str = 'data/leads_with_outreach.json',
+                   config_path: str = 'config.yaml') -> NormalizedCompanies:
     """
     Load lead data from JSON file.
+    While personalization is running, the leads it has finished so far are read from its journal.
     
     Args:
         data_path: Path to the lead data file
+        config_path: Path to the configuration file (for the personalization journal)
         
     Returns:
-        List[Dict]: Lead data
+        NormalizedCompanies: Leads, with events and associations as ids into shared tables
     """
+    journal = OutreachJournal.from_config(load_config(config_path))
+    
+    # A journal newer than the saved output belongs to a run that has not saved yet; an older
+    # one was left behind by a run that was interrupted before the output was last saved
+    if journal and os.path.exists(journal.path) and (
+            not os.path.exists(data_path) or os.path.getmtime(journal.path) > os.path.getmtime(data_path)):
+        partial_leads = journal.read()
+        st.info(f"Outreach generation in progress (or interrupted): showing the {len(partial_leads)} leads "
+                "finished so far. Refresh the page to see more.")
+        return NormalizedCompanies.from_companies(partial_leads)
+    
     if not os.path.exists(data_path):
         st.error(f"Data file not found: {data_path}")
         st.info("Please run the lead generation pipeline first with: python main.py")
-        return []
+        return NormalizedCompanies()
+    
+    return load_normalized_companies(data_path)
+
+@st.cache_resource
+def get_email_sender(config_path: str = 'config.yaml') -> Optional[EmailSender]:
+    """
+    Get the email sender, shared across reruns so its SMTP connections are reused.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Optional[EmailSender]: Sender, or None if no SMTP server is configured
+    """
+    return EmailSender.from_config(load_config(config_path))
+
+def send_outreach(stakeholders: List[Dict]) -> None:
+    """
+    Send stakeholders' outreach and show the outcome.
     
-    return load_json(data_path)
+    Args:
+        stakeholders: Stakeholders with email, subject line and outreach message
+    """
+    sender = get_email_sender()
+    if sender is None:
+        st.warning("Email sending is not configured. Set email.smtp_host in config.yaml.")
+        return
+    
+    with st.spinner(f"Sending {len(stakeholders)} emails..."):
+        summary = sender.send(stakeholders)
+    
+    if summary['sent']:
+        st.success(f"Sent {summary['sent']} emails.")
+    if summary['skipped']:
+        st.info(f"Skipped {summary['skipped']} emails (no address or message, or already sent).")
+    if summary['failed']:
+        st.error(f"{summary['failed']} emails could not be delivered; they are kept in the dead-letter queue.")
 
 def dashboard():
     """Main dashboard function."""
@@ -53,7 +105,10 @@ def dashboard():
     st.sidebar.header("Filters")
     
     # Load data
-    leads_data = load_lead_data()
+    leads = load_lead_data()
+    leads_data = leads.companies
+    events_table = leads.tables['events']
+    associations_table = leads.tables['associations']
     
     if not leads_data:
         st.warning("No lead data available. Please run the lead generation pipeline first.")
@@ -71,10 +126,7 @@ def dashboard():
     )
     
     # Event filter
-    all_events = set()
-    for lead in leads_data:
-        for event in lead.get('events', []):
-            all_events.add(event['event_name'])
+    all_events = {event['event_name'] for event in events_table.rows}
     
     selected_events = st.sidebar.multiselect(
         "Filter by Event:",
@@ -83,10 +135,7 @@ def dashboard():
     )
     
     # Association filter
-    all_associations = set()
-    for lead in leads_data:
-        for assoc in lead.get('associations', []):
-            all_associations.add(assoc['association_name'])
+    all_associations = {assoc['association_name'] for assoc in associations_table.rows}
     
     selected_associations = st.sidebar.multiselect(
         "Filter by Association:",
@@ -109,16 +158,19 @@ def dashboard():
     if selected_companies:
         filtered_leads = [lead for lead in filtered_leads if lead['name'] in selected_companies]
     
+    # Event and association filters intersect integer id sets
     if selected_events:
+        event_ids = events_table.ids_where('event_name', selected_events)
         filtered_leads = [
             lead for lead in filtered_leads 
-            if any(event['event_name'] in selected_events for event in lead.get('events', []))
+            if not event_ids.isdisjoint(leads.member_ids(lead, 'events'))
         ]
     
     if selected_associations:
+        association_ids = associations_table.ids_where('association_name', selected_associations)
         filtered_leads = [
             lead for lead in filtered_leads 
-            if any(assoc['association_name'] in selected_associations for assoc in lead.get('associations', []))
+            if not association_ids.isdisjoint(leads.member_ids(lead, 'associations'))
         ]
     
     filtered_leads = [lead for lead in filtered_leads if lead.get('overall_score', 0) >= min_score]
@@ -157,14 +209,22 @@ def dashboard():
             "Industry": lead.get('industry', 'N/A'),
             "Revenue": lead.get('estimated_revenue', 'N/A'),
             "Lead Score": f"{lead.get('overall_score', 0):.1f}/10",
-            "Events": ", ".join(event['event_name'] for event in lead.get('events', [])[:2]),
-            "Associations": ", ".join(assoc['association_name'] for assoc in lead.get('associations', [])[:2]),
+            "Events": ", ".join(events_table[i]['event_name'] for i in leads.member_ids(lead, 'events')[:2]),
+            "Associations": ", ".join(associations_table[i]['association_name'] for i in leads.member_ids(lead, 'associations')[:2]),
             "Decision Makers": len(lead.get('stakeholders', []))
         })
     
     lead_df = pd.DataFrame(lead_table_data)
     st.dataframe(lead_df, hide_index=True)
     
+    # Bulk send goes through the pooled, rate-limited sender in one call
+    if st.button(f"Send Outreach to All {total_stakeholders} Decision Makers", key="send_filtered"):
+        send_outreach([
+            stakeholder
+            for lead in filtered_leads
+            for stakeholder in leads.expand(lead).get('stakeholders', [])
+        ])
+    
     # Lead details
     st.markdown("## Lead Details")
     
@@ -178,6 +238,7 @@ def dashboard():
         selected_lead = next((lead for lead in filtered_leads if lead['name'] == selected_lead_name), None)
         
         if selected_lead:
+            selected_lead = leads.expand(selected_lead)
             st.markdown(f"### {selected_lead['name']}")
             
             # Company information
@@ -262,11 +323,10 @@ def dashboard():
                         email_message = stakeholder.get('outreach_message', 'No outreach message available.')
                         st.text_area("Email Message", email_message, height=300)
                         
-                        # Add a button to "send" the email (mock functionality)
                         col1, col2, col3 = st.columns([1, 1, 2])
                         with col1:
                             if st.button(f"Send Email", key=f"send_{stakeholder['name']}"):
-                                st.success(f"Email sent to {stakeholder['name']}!")
+                                send_outreach([stakeholder])
                         with col2:
                             if st.button(f"Edit Message", key=f"edit_{stakeholder['name']}"):
                                 st.info("Message editor would open here.")
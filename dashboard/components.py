@@ -7,6 +7,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.email_sender import EmailSender
+
 def render_score_gauge(score: float, title: str = "Score") -> None:
     """
     Render a gauge chart for a score.
@@ -142,12 +144,13 @@ def render_stakeholders_table(stakeholders: list) -> None:
     stakeholder_df = pd.DataFrame(stakeholder_data)
     st.dataframe(stakeholder_df, hide_index=True)
 
-def render_email_preview(stakeholder: dict) -> None:
+def render_email_preview(stakeholder: dict, sender: EmailSender = None) -> None:
     """
     Render an email preview for a stakeholder.
     
     Args:
         stakeholder: Stakeholder dictionary with outreach information
+        sender: Email sender used by the Send button (None if sending is not configured)
     """
     with st.container():
         st.markdown("### Email Preview")
@@ -169,7 +172,16 @@ def render_email_preview(stakeholder: dict) -> None:
         col1, col2, col3 = st.columns([1, 1, 2])
         with col1:
             if st.button("Send", key=f"send_email_{stakeholder['name']}"):
-                st.success("Email sent successfully!")
+                if sender is None:
+                    st.warning("Email sending is not configured.")
+                else:
+                    summary = sender.send([stakeholder])
+                    if summary['sent']:
+                        st.success("Email sent successfully!")
+                    elif summary['failed']:
+                        st.error("Email could not be delivered; it is kept in the dead-letter queue.")
+                    else:
+                        st.info("Email not sent: no address or message, or it was already sent.")
         with col2:
             if st.button("Save Draft", key=f"save_draft_{stakeholder['name']}"):
                 st.info("Draft saved successfully!")
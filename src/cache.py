@@ -0,0 +1,179 @@
+"""
+Persistent Cache Module for DuPont Tedlar Lead Generation
+
+This module provides a small SQLite-backed key/value cache with
+least-recently-used eviction, used to persist results of paid external
+calls (enrichment lookups, LLM generations) across pipeline runs.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Recency updates are buffered in memory and written in one transaction once
+# this many keys are pending (or on the next write, or on close)
+TOUCH_FLUSH_THRESHOLD = 1000
+
+class PersistentCache:
+    """SQLite-backed JSON cache with size-bounded LRU eviction."""
+
+    def __init__(self, path: str, max_entries: int = 100000, table: str = 'cache'):
+        """
+        Open (or create) a cache.
+
+        Args:
+            path: SQLite database file (":memory:" for a throwaway cache)
+            max_entries: Maximum number of entries kept; least recently used entries are evicted
+            table: Table name, so several caches can share one database file
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: {table}")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.table = table
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)")
+        self._conn.commit()
+
+        # Row count kept in memory so writes do not scan the table to decide on eviction
+        self._count = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        # Pending accessed_at updates from reads, by key
+        self._touched: Dict[str, float] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Any: Cached value, or default
+        """
+        with self._lock:
+            row = self._conn.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_FLUSH_THRESHOLD:
+                self._flush_touched()
+                self._conn.commit()
+            return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value, evicting old entries if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self.set_many([(key, value)])
+
+    def set_many(self, items: List[Tuple[str, Any]]) -> None:
+        """
+        Store several values in one transaction.
+
+        Args:
+            items: (key, value) pairs
+        """
+        now = time.time()
+        rows = [(key, json.dumps(value)) for key, value in items]
+        with self._lock:
+            self._flush_touched()
+            # Insert new keys first so the cursor's rowcount tells how many rows were added,
+            # then overwrite the values of keys that already existed
+            inserted = self._conn.executemany(
+                f"INSERT OR IGNORE INTO {self.table} (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                [(key, value, now, now) for key, value in rows]
+            ).rowcount
+            if inserted < len(rows):
+                self._conn.executemany(
+                    f"UPDATE {self.table} SET value = ?, accessed_at = ? WHERE key = ?",
+                    [(value, now, key) for key, value in rows]
+                )
+            self._count += inserted
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._touched.pop(key, None)
+            self._count -= self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,)).rowcount
+            self._conn.commit()
+
+    def _flush_touched(self) -> None:
+        """Write pending accessed_at updates; the caller holds the lock and commits."""
+        if self._touched:
+            self._conn.executemany(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond max_entries (caller holds the lock)."""
+        if self._count <= self.max_entries:
+            return
+        # Another connection may have written to the table; recount before deleting anything
+        self._count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        excess = self._count - self.max_entries
+        if excess > 0:
+            self._count -= self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            ).rowcount
+            logger.debug(f"Evicted {excess} entries from cache {self.path}:{self.table}")
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over all (key, value) pairs without touching recency."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT key, value FROM {self.table}").fetchall()
+        for key, value in rows:
+            yield key, json.loads(value)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute(f"SELECT 1 FROM {self.table} WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def flush(self) -> None:
+        """Write pending recency updates now."""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
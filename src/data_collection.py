@@ -17,6 +17,7 @@ from bs4 import BeautifulSoup
 import pandas as pd
 from tqdm import tqdm
 
+from src.normalized_data import save_companies_data
 from src.utils import load_config, save_json
 
 # Configure logging
@@ -304,7 +305,7 @@ class EventScraper:
         companies_file = os.path.join(output_dir, 'companies.json')
         
         save_json(self.events_data, events_file)
-        save_json(self.companies_data, companies_file)
+        save_companies_data(self.companies_data, companies_file)
         
         logger.info(f"Saved events data to {events_file}")
         logger.info(f"Saved companies data to {companies_file}")
@@ -0,0 +1,280 @@
+"""
+Email Pattern Module for DuPont Tedlar Lead Generation
+
+This module learns each company domain's email address pattern (first.last,
+flast, ...) from a few known addresses and generates addresses for every
+stakeholder at that company in bulk. Patterns are cached per domain, so
+verification costs one call per domain instead of one per contact.
+"""
+
+import logging
+import os
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.utils import load_json, save_json
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Local-part patterns; {f} and {l} are the first letters of the first and last name
+EMAIL_PATTERNS = {
+    'first.last': '{first}.{last}',
+    'flast': '{f}{last}',
+    'firstlast': '{first}{last}',
+    'first_last': '{first}_{last}',
+    'first-last': '{first}-{last}',
+    'f.last': '{f}.{last}',
+    'firstl': '{first}{l}',
+    'first': '{first}',
+    'last.first': '{last}.{first}',
+    'lastf': '{last}{f}',
+    'last': '{last}',
+}
+
+# Second-level labels under which registrations sit one level deeper (e.g. example.co.uk)
+_SECOND_LEVEL_LABELS = {'co', 'com', 'org', 'net', 'ac', 'gov', 'edu', 'ne', 'or'}
+
+# Confidence assigned to a pattern confirmed by a verification call
+VERIFIED_CONFIDENCE = 0.95
+
+def email_domain(domain: str) -> str:
+    """
+    Reduce a website domain to the registered domain used for email.
+
+    Args:
+        domain: Canonical website domain (e.g. "graphics.averydennison.com")
+
+    Returns:
+        str: Registered domain (e.g. "averydennison.com")
+    """
+    labels = domain.lower().split('.')
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+def _name_parts(name: str) -> Optional[Dict[str, str]]:
+    """Split a person's name into ASCII first/last name parts for pattern rendering."""
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+    tokens = [re.sub(r'[^a-z]', '', token) for token in ascii_name.split()]
+    tokens = [token for token in tokens if token]
+    if len(tokens) < 2:
+        return None
+
+    first, last = tokens[0], tokens[-1]
+    return {'first': first, 'last': last, 'f': first[0], 'l': last[0]}
+
+class EmailPatternEngine:
+    """Learns and caches email address patterns per company domain."""
+
+    def __init__(self, verification_threshold: float = 0.7, default_pattern: str = 'first.last',
+                 default_confidence: float = 0.3, cache_path: Optional[str] = None,
+                 verifier: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            verification_threshold: Minimum confidence for an address to count as verified
+            default_pattern: Pattern assumed for domains without known addresses
+            default_confidence: Confidence of the default pattern
+            cache_path: JSON file the learned patterns are persisted to (None keeps them in memory)
+            verifier: Optional callable that verifies one email address (e.g. an SMTP or
+                      verification-API check); called at most once per domain
+        """
+        self.verification_threshold = verification_threshold
+        self.default_pattern = default_pattern
+        self.default_confidence = default_confidence
+        self.cache_path = cache_path
+        self.verifier = verifier
+        self.patterns = {}
+
+        if cache_path and os.path.exists(cache_path):
+            self.patterns = load_json(cache_path) or {}
+
+    @classmethod
+    def from_config(cls, config: Dict, verifier: Optional[Callable[[str], bool]] = None) -> 'EmailPatternEngine':
+        """
+        Build an engine from the `data_collection` section of the configuration.
+
+        Args:
+            config: Configuration data
+            verifier: Optional single-address verification callable
+
+        Returns:
+            EmailPatternEngine: Engine using `verification_threshold` and `email_pattern_cache`
+        """
+        collection_config = config.get('data_collection', {}) or {}
+        return cls(
+            verification_threshold=collection_config.get('verification_threshold', 0.7),
+            cache_path=collection_config.get('email_pattern_cache'),
+            verifier=verifier
+        )
+
+    @staticmethod
+    def render(pattern: str, name: str, domain: str) -> Optional[str]:
+        """
+        Render an address for a person.
+
+        Args:
+            pattern: Pattern name from EMAIL_PATTERNS
+            name: Person's full name
+            domain: Email domain
+
+        Returns:
+            Optional[str]: Email address, or None if there is no domain or the name cannot be split
+        """
+        if not domain:
+            return None
+        parts = _name_parts(name)
+        if parts is None:
+            return None
+        return f"{EMAIL_PATTERNS[pattern].format(**parts)}@{domain}"
+
+    def learn(self, domain: str, known_addresses: List[Tuple[str, str]]) -> Dict:
+        """
+        Infer a domain's pattern from known (name, email) pairs and cache it.
+        Each address votes for every pattern that reproduces it; confidence is the
+        winning pattern's share of votes, discounted for small samples. Addresses
+        seen in earlier calls keep their votes, and an address is counted once
+        however often it is seen.
+
+        Args:
+            domain: Email domain
+            known_addresses: (full name, email address) pairs at the company
+
+        Returns:
+            Dict: Cached pattern entry with `pattern`, `confidence`, `samples` and the
+                  matching patterns per observed address (`observations`)
+        """
+        previous = self.patterns.get(domain)
+        observations = dict((previous or {}).get('observations') or {})
+        learned = len(observations)
+
+        for name, address in known_addresses:
+            if not address or '@' not in address:
+                continue
+            local_part, address_domain = address.lower().rsplit('@', 1)
+            parts = _name_parts(name)
+            if address_domain != domain or parts is None:
+                continue
+
+            matching = [p for p, template in EMAIL_PATTERNS.items() if template.format(**parts) == local_part]
+            if matching:
+                observations[local_part] = matching
+
+        if len(observations) == learned:
+            return self.pattern_for(domain)
+
+        votes = defaultdict(float)
+        for matching in observations.values():
+            for pattern in matching:
+                votes[pattern] += 1.0 / len(matching)
+        samples = len(observations)
+
+        # Votes stored with the entry that are not tied to an observed address
+        prior = (previous or {}).get('prior')
+        if prior:
+            votes[prior['pattern']] += prior['samples']
+            samples += prior['samples']
+
+        best = max(votes, key=votes.get)
+        entry = {
+            'pattern': best,
+            'confidence': round(votes[best] / (samples + 1), 3),
+            'samples': samples,
+            'verified': False,
+            'observations': observations
+        }
+        if prior:
+            entry['prior'] = prior
+
+        if previous and previous.get('verified') and previous['pattern'] == best:
+            entry['confidence'] = max(entry['confidence'], previous['confidence'])
+            entry['verified'] = True
+
+        self.patterns[domain] = entry
+        return entry
+
+    def pattern_for(self, domain: str) -> Dict:
+        """
+        Get the cached pattern for a domain, or the default pattern if none was learned.
+
+        Args:
+            domain: Email domain
+
+        Returns:
+            Dict: Pattern entry with `pattern`, `confidence` and `samples`
+        """
+        return self.patterns.get(domain) or {
+            'pattern': self.default_pattern,
+            'confidence': self.default_confidence,
+            'samples': 0,
+            'verified': False
+        }
+
+    def _verify_domain(self, domain: str, address: str) -> Dict:
+        """Spend one verification call to confirm a domain's pattern."""
+        entry = dict(self.pattern_for(domain))
+        try:
+            confirmed = self.verifier(address)
+        except Exception as e:
+            logger.warning(f"Email verification failed for {domain}: {e}")
+            return entry
+
+        entry['verified'] = True
+        if confirmed:
+            entry['confidence'] = max(entry['confidence'], VERIFIED_CONFIDENCE)
+        else:
+            entry['confidence'] = min(entry['confidence'], self.default_confidence)
+        self.patterns[domain] = entry
+        return entry
+
+    def generate_bulk(self, domain: str, stakeholders: List[Dict]) -> List[Dict]:
+        """
+        Fill in email addresses for every stakeholder at a company.
+        Addresses already on the company domain are kept; the rest are generated from
+        the domain's pattern. Stakeholder dicts are updated in place with `email`,
+        `email_confidence` and `email_verified`.
+
+        Args:
+            domain: Email domain
+            stakeholders: Stakeholders at the company
+
+        Returns:
+            List[Dict]: The same stakeholders
+        """
+        if not domain:
+            # Without a domain there is nothing to learn from or generate; keep what is known
+            for stakeholder in stakeholders:
+                stakeholder.setdefault('email', '')
+                stakeholder['email_confidence'] = 0.0
+                stakeholder['email_verified'] = False
+            return stakeholders
+
+        known = [(s.get('name', ''), s.get('email', '')) for s in stakeholders
+                 if (s.get('email') or '').lower().endswith(f"@{domain}")]
+        entry = self.learn(domain, known) if known else self.pattern_for(domain)
+
+        for stakeholder in stakeholders:
+            if (stakeholder.get('email') or '').lower().endswith(f"@{domain}"):
+                stakeholder['email_confidence'] = 1.0
+                stakeholder['email_verified'] = True
+                continue
+
+            address = self.render(entry['pattern'], stakeholder.get('name', ''), domain)
+
+            # One verification call confirms the pattern for the whole domain
+            if address and self.verifier and not entry.get('verified') and entry['confidence'] < self.verification_threshold:
+                entry = self._verify_domain(domain, address)
+
+            stakeholder['email'] = address or ''
+            stakeholder['email_confidence'] = entry['confidence'] if address else 0.0
+            stakeholder['email_verified'] = bool(address) and entry['confidence'] >= self.verification_threshold
+
+        return stakeholders
+
+    def save(self) -> None:
+        """Persist learned patterns to the cache file, if one is configured."""
+        if self.cache_path:
+            save_json(self.patterns, self.cache_path)
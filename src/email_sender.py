@@ -0,0 +1,596 @@
+"""
+Email Sender Module for DuPont Tedlar Lead Generation
+
+This module sends the generated outreach (each stakeholder's `subject_line`
+and `outreach_message`) over SMTP in bulk. Messages go out in batches over a
+small pool of reused SMTP connections, with a per-recipient-domain rate limit
+so no single company's mail server sees a burst. Temporary failures (4xx
+replies, dropped connections) are retried with jittered backoff; permanent
+failures, and messages that still fail after the last retry, go to a
+dead-letter queue. Every outcome is recorded in a persistent send log, so a
+message is never sent twice and dead letters can be retried later. Delivered
+recipients are added to the suppression list (src/suppression.py), and
+stakeholders already on it are not emailed.
+
+`src.mock_servers.MockSMTPServer` is a local stand-in relay for offline runs.
+"""
+
+import hashlib
+import logging
+import queue
+import smtplib
+import ssl
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from src.cache import PersistentCache
+from src.normalized_data import load_companies_data
+from src.rate_limit import TokenBucket, backoff_delay
+from src.suppression import SuppressionList
+from src.utils import load_config
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class EmailSendError(Exception):
+    """A message could not be sent and should not be retried."""
+
+class RetryableEmailSendError(EmailSendError):
+    """A temporary failure (4xx reply, dropped connection); the message may be retried."""
+
+def message_key(recipient: str, subject: str, body: str) -> str:
+    """
+    Send log key of a message, so the same outreach is never sent twice.
+
+    Args:
+        recipient: Recipient email address
+        subject: Subject line
+        body: Message body
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    return hashlib.sha256('\x1f'.join((recipient.strip().lower(), subject, body)).encode('utf-8')).hexdigest()
+
+def is_connection_error(error: Exception) -> bool:
+    """Whether an error means the SMTP connection is unusable (smtplib's errors are OSErrors too)."""
+    return isinstance(error, smtplib.SMTPServerDisconnected) or \
+        (isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException))
+
+def classify_smtp_error(error: Exception) -> EmailSendError:
+    """
+    Map an error raised while sending to a retryable or permanent send error.
+
+    Args:
+        error: Error raised while sending
+
+    Returns:
+        EmailSendError: RetryableEmailSendError for temporary failures (4xx replies, connection
+                        errors), EmailSendError for everything else
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        retryable = bool(codes) and all(400 <= code < 500 for code in codes)
+        return (RetryableEmailSendError if retryable else EmailSendError)(f"Recipient refused: {error.recipients}")
+    if isinstance(error, smtplib.SMTPResponseException):
+        retryable = 400 <= error.smtp_code < 500
+        return (RetryableEmailSendError if retryable else EmailSendError)(f"SMTP {error.smtp_code}: {error.smtp_error!r}")
+    if is_connection_error(error):
+        return RetryableEmailSendError(f"Connection failed: {error}")
+    return EmailSendError(str(error))
+
+class _PooledConnection:
+    """An SMTP connection and the number of messages sent over it."""
+
+    __slots__ = ('smtp', 'sent')
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.sent = 0
+
+class SMTPConnectionPool:
+    """Bounded pool of reusable, authenticated SMTP connections."""
+
+    def __init__(self, host: str, port: int = 587, username: Optional[str] = None, password: Optional[str] = None,
+                 use_tls: bool = True, size: int = 4, timeout: float = 30.0, max_messages_per_connection: int = 100):
+        """
+        Args:
+            host: SMTP server
+            port: SMTP port
+            username: Login user (None to send without authentication)
+            password: Login password
+            use_tls: Upgrade connections with STARTTLS
+            size: Maximum open connections
+            timeout: Socket timeout in seconds
+            max_messages_per_connection: Messages sent over a connection before it is replaced
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.connections_opened = 0
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> _PooledConnection:
+        """Open, secure and authenticate a new connection."""
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.use_tls:
+                smtp.starttls(context=ssl.create_default_context())
+                smtp.ehlo()
+            if self.username:
+                smtp.login(self.username, self.password or '')
+        except Exception:
+            smtp.close()
+            raise
+        with self._lock:
+            self.connections_opened += 1
+        return _PooledConnection(smtp)
+
+    def acquire(self) -> _PooledConnection:
+        """
+        Take a connection, reusing an idle one when there is one.
+        Blocks while `size` connections are in use.
+
+        Returns:
+            _PooledConnection: Connection to send over; hand it back with `release`
+        """
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, connection: _PooledConnection, broken: bool = False) -> None:
+        """
+        Hand a connection back.
+
+        Args:
+            connection: Connection from `acquire`
+            broken: Whether the connection failed and must be discarded
+        """
+        if broken or connection.sent >= self.max_messages_per_connection:
+            self._close(connection, polite=not broken)
+        else:
+            self._idle.put(connection)
+        self._slots.release()
+
+    @staticmethod
+    def _close(connection: _PooledConnection, polite: bool = True) -> None:
+        try:
+            if polite:
+                connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            connection.smtp.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+class SendLog:
+    """Persistent record of every message's outcome, including the dead-letter queue."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite database file for the log
+        """
+        # Never evicts: a forgotten message would be sent again, a forgotten dead letter lost
+        self.entries = PersistentCache(path, max_entries=sys.maxsize, table='sends')
+
+    def status(self, key: str) -> Optional[str]:
+        """
+        Outcome of a message.
+
+        Args:
+            key: Message key (see `message_key`)
+
+        Returns:
+            Optional[str]: "sent" or "dead", or None if it was never attempted
+        """
+        entry = self.entries.get(key)
+        return entry['status'] if entry else None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def record(self, entries: List[Tuple[str, Dict]]) -> None:
+        """
+        Record the outcomes of a batch.
+
+        Args:
+            entries: (message key, entry) pairs
+        """
+        if entries:
+            self.entries.set_many(entries)
+
+    def dead_letters(self) -> List[Dict]:
+        """
+        Messages that could not be delivered, with everything needed to send them again.
+
+        Returns:
+            List[Dict]: Outgoing messages (`key`, `recipient`, `name`, `linkedin_url`, `subject`, `body`)
+                        with `error` and `attempts`
+        """
+        return [dict(entry, key=key) for key, entry in self.entries.items() if entry.get('status') == 'dead']
+
+class EmailSender:
+    """Batched, rate-limited bulk sender with retries and a dead-letter queue."""
+
+    def __init__(self, pool: SMTPConnectionPool, from_address: str, from_name: str = '',
+                 send_log: Optional[SendLog] = None, batch_size: int = 50,
+                 domain_rate_per_minute: float = 60.0, domain_burst: float = 5.0,
+                 max_retries: int = 3, retry_base_delay: float = 1.0,
+                 suppression: Optional[SuppressionList] = None):
+        """
+        Args:
+            pool: SMTP connections to send over
+            from_address: Sender address
+            from_name: Sender display name
+            send_log: Persistent send log (None to keep no record)
+            batch_size: Messages sent over one connection before it is handed back
+            domain_rate_per_minute: Messages per minute to any one recipient domain
+            domain_burst: Messages a recipient domain may receive at once
+            max_retries: Retries of a temporarily failing message before it is dead-lettered
+            retry_base_delay: Backoff delay scale in seconds
+            suppression: Contacted identities; suppressed stakeholders are skipped and delivered ones added
+        """
+        self.pool = pool
+        self.from_address = from_address
+        self.from_name = from_name
+        self.send_log = send_log
+        self.batch_size = batch_size
+        self.domain_rate_per_minute = domain_rate_per_minute
+        self.domain_burst = domain_burst
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.suppression = suppression
+        self._domain_limiters = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['EmailSender']:
+        """
+        Build a sender from the `email` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[EmailSender]: Sender, or None if no SMTP server is configured
+        """
+        email_config = config.get('email', {}) or {}
+        if not email_config.get('smtp_host'):
+            return None
+
+        api_keys = config.get('api_keys', {}) or {}
+        pool = SMTPConnectionPool(
+            host=email_config['smtp_host'],
+            port=email_config.get('smtp_port', 587),
+            username=email_config.get('username'),
+            password=api_keys.get(email_config.get('password_key', 'smtp'), ''),
+            use_tls=email_config.get('use_tls', True),
+            size=email_config.get('pool_size', 4),
+            timeout=email_config.get('timeout', 30),
+            max_messages_per_connection=email_config.get('max_messages_per_connection', 100)
+        )
+        send_log_path = email_config.get('send_log')
+        return cls(
+            pool,
+            from_address=email_config.get('from_address', ''),
+            from_name=email_config.get('from_name', ''),
+            send_log=SendLog(send_log_path) if send_log_path else None,
+            batch_size=email_config.get('batch_size', 50),
+            domain_rate_per_minute=email_config.get('domain_rate_per_minute', 60),
+            domain_burst=email_config.get('domain_burst', 5),
+            max_retries=email_config.get('max_retries', 3),
+            retry_base_delay=email_config.get('retry_base_delay', 1.0),
+            suppression=SuppressionList.from_config(config)
+        )
+
+    def _domain_limiter(self, domain: str) -> TokenBucket:
+        """Rate limiter for a recipient domain."""
+        with self._lock:
+            limiter = self._domain_limiters.get(domain)
+            if limiter is None:
+                limiter = self._domain_limiters[domain] = TokenBucket(self.domain_rate_per_minute / 60.0, self.domain_burst)
+            return limiter
+
+    def build_message(self, outgoing: Mapping) -> EmailMessage:
+        """
+        Build the MIME message for an outgoing email.
+
+        Args:
+            outgoing: Outgoing message (`recipient`, `name`, `subject`, `body`)
+
+        Returns:
+            EmailMessage: Message ready to send
+        """
+        message = EmailMessage()
+        message['From'] = formataddr((self.from_name, self.from_address))
+        message['To'] = formataddr((outgoing.get('name', ''), outgoing['recipient']))
+        message['Subject'] = outgoing['subject']
+        message.set_content(outgoing['body'])
+        return message
+
+    def _outgoing(self, stakeholders: List[Mapping]) -> Tuple[List[Dict], int]:
+        """
+        Turn stakeholders into outgoing messages, skipping those without an address
+        or outreach, those contacted in an earlier campaign, and those whose message
+        is already in the send log (sent, or dead-lettered and left to `retry_dead_letters`).
+
+        Returns:
+            Tuple[List[Dict], int]: Outgoing messages and the number skipped
+        """
+        outgoing = []
+        skipped = 0
+        seen = set()
+        for stakeholder in stakeholders:
+            recipient = (stakeholder.get('email') or '').strip()
+            subject = stakeholder.get('subject_line')
+            body = stakeholder.get('outreach_message')
+            if not recipient or not subject or not body:
+                skipped += 1
+                continue
+            if self.suppression and self.suppression.is_suppressed(stakeholder):
+                skipped += 1
+                continue
+
+            key = message_key(recipient, subject, body)
+            if key in seen or (self.send_log is not None and key in self.send_log):
+                skipped += 1
+                continue
+            seen.add(key)
+            outgoing.append({'key': key, 'recipient': recipient, 'name': stakeholder.get('name', ''),
+                             'linkedin_url': stakeholder.get('linkedin_url', ''), 'subject': subject, 'body': body})
+        return outgoing, skipped
+
+    @staticmethod
+    def _interleave_domains(outgoing: List[Dict]) -> List[Dict]:
+        """
+        Order messages round-robin across recipient domains, so a batch rarely
+        waits on one domain's rate limit.
+        """
+        by_domain = {}
+        for message in outgoing:
+            by_domain.setdefault(message['recipient'].rpartition('@')[2].lower(), []).append(message)
+        queues = list(by_domain.values())
+        interleaved = []
+        for position in range(max((len(messages) for messages in queues), default=0)):
+            interleaved.extend(messages[position] for messages in queues if position < len(messages))
+        return interleaved
+
+    def _record(self, message: Dict, error: Optional[EmailSendError], attempt: int) -> str:
+        """
+        Decide a message's outcome and write it to the send log right away, so a
+        message that went out is never sent again even if the run is interrupted.
+
+        Args:
+            message: Outgoing message
+            error: Send error (None if sent)
+            attempt: Zero-based attempt number
+
+        Returns:
+            str: "sent", "retry" or "dead"
+        """
+        if error is None:
+            outcome = 'sent'
+        elif isinstance(error, RetryableEmailSendError) and attempt < self.max_retries:
+            return 'retry'
+        else:
+            outcome = 'dead'
+
+        entry = {'status': outcome, 'recipient': message['recipient'], 'subject': message['subject'],
+                 'attempts': attempt + 1, 'updated_at': time.time()}
+        if outcome == 'dead':
+            # Dead letters keep the text so they can be sent again later
+            entry.update(name=message['name'], linkedin_url=message['linkedin_url'],
+                         body=message['body'], error=str(error))
+        if self.send_log is not None:
+            self.send_log.record([(message['key'], entry)])
+        return outcome
+
+    def _send_batch(self, batch: List[Dict], attempt: int = 0) -> List[Tuple[Dict, str]]:
+        """
+        Send a batch over one pooled connection.
+
+        Args:
+            batch: Outgoing messages
+            attempt: Zero-based attempt number of the batch's messages
+
+        Returns:
+            List[Tuple[Dict, str]]: Each message with its outcome ("sent", "retry" or "dead")
+        """
+        try:
+            connection = self.pool.acquire()
+        except (smtplib.SMTPException, OSError) as e:
+            error = classify_smtp_error(e)
+            return [(message, self._record(message, error, attempt)) for message in batch]
+
+        results = []
+        broken = False
+        try:
+            for message in batch:
+                if broken:
+                    error = RetryableEmailSendError("Connection lost earlier in the batch")
+                    results.append((message, self._record(message, error, attempt)))
+                    continue
+
+                try:
+                    email_message = self.build_message(message)
+                except Exception as e:
+                    # Malformed text (e.g. a newline in the subject) cannot be fixed by retrying
+                    error = EmailSendError(f"Invalid message: {e}")
+                    results.append((message, self._record(message, error, attempt)))
+                    continue
+
+                self._domain_limiter(message['recipient'].rpartition('@')[2].lower()).acquire()
+                try:
+                    connection.smtp.send_message(email_message)
+                    connection.sent += 1
+                    error = None
+                except Exception as e:
+                    # Non-SMTP errors (e.g. an address that cannot be encoded) are permanent
+                    error = classify_smtp_error(e)
+                    if is_connection_error(e):
+                        broken = True
+                    else:
+                        # Clear the failed transaction before the next message
+                        try:
+                            connection.smtp.rset()
+                        except (smtplib.SMTPException, OSError):
+                            broken = True
+                results.append((message, self._record(message, error, attempt)))
+        finally:
+            self.pool.release(connection, broken=broken)
+        return results
+
+    def _deliver(self, outgoing: List[Dict]) -> Dict[str, int]:
+        """
+        Send messages in batches over the pool, retrying temporary failures.
+
+        Args:
+            outgoing: Outgoing messages
+
+        Returns:
+            Dict[str, int]: Counts of `sent` and `failed` (dead-lettered) messages
+        """
+        summary = {'sent': 0, 'failed': 0}
+        pending = self._interleave_domains(outgoing)
+        attempt = 0
+
+        with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+            while pending:
+                batches = [pending[start:start + self.batch_size] for start in range(0, len(pending), self.batch_size)]
+                retry = []
+                delivered = []
+                for results in executor.map(self._send_batch, batches, [attempt] * len(batches)):
+                    for message, outcome in results:
+                        if outcome == 'sent':
+                            summary['sent'] += 1
+                            delivered.append(message)
+                        elif outcome == 'retry':
+                            retry.append(message)
+                        else:
+                            summary['failed'] += 1
+
+                # Recipients are suppressed once per round, so the filter is saved once per round
+                if self.suppression and delivered:
+                    self.suppression.add([
+                        {'email': message['recipient'], 'linkedin_url': message['linkedin_url'], 'name': message['name']}
+                        for message in delivered
+                    ])
+
+                if retry:
+                    delay = backoff_delay(attempt, self.retry_base_delay)
+                    logger.warning(f"{len(retry)} messages failed temporarily; retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+                    time.sleep(delay)
+                    attempt += 1
+                pending = retry
+
+        return summary
+
+    def send(self, stakeholders: List[Mapping]) -> Dict[str, int]:
+        """
+        Send the outreach of a group of stakeholders.
+
+        Args:
+            stakeholders: Stakeholders with `email`, `name`, `subject_line` and `outreach_message`
+
+        Returns:
+            Dict[str, int]: Counts of `sent`, `skipped` (no address or outreach, suppressed, or attempted before)
+                            and `failed` (dead-lettered) messages
+        """
+        outgoing, skipped = self._outgoing(stakeholders)
+        summary = self._deliver(outgoing)
+        summary['skipped'] = skipped
+        logger.info(f"Sent {summary['sent']} emails ({summary['skipped']} skipped, {summary['failed']} failed)")
+        return summary
+
+    def retry_dead_letters(self) -> Dict[str, int]:
+        """
+        Send the dead-lettered messages again.
+
+        Returns:
+            Dict[str, int]: Counts of `sent` and `failed` messages
+        """
+        if self.send_log is None:
+            return {'sent': 0, 'failed': 0}
+
+        dead_letters = self.send_log.dead_letters()
+        if self.suppression:
+            # Recipients may have been contacted another way since
+            dead_letters = [
+                entry for entry in dead_letters
+                if not self.suppression.is_suppressed({'email': entry.get('recipient'), 'linkedin_url': entry.get('linkedin_url')})
+            ]
+        logger.info(f"Retrying {len(dead_letters)} dead-lettered emails")
+        return self._deliver([
+            {field: entry.get(field, '') for field in ('key', 'recipient', 'name', 'linkedin_url', 'subject', 'body')}
+            for entry in dead_letters
+        ])
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+def run_email_sender(outreach_file: str = 'data/leads_with_outreach.json', config_path: str = 'config.yaml',
+                     retry_dead: bool = False) -> Dict[str, int]:
+    """
+    Send the generated outreach for every stakeholder in an outreach file.
+
+    Args:
+        outreach_file: Path to the leads with outreach file
+        config_path: Path to the configuration file
+        retry_dead: Send the dead-lettered messages again instead
+
+    Returns:
+        Dict[str, int]: Counts of sent, skipped and failed messages
+    """
+    config = load_config(config_path)
+    sender = EmailSender.from_config(config)
+    if sender is None:
+        raise ValueError("No SMTP server configured (set email.smtp_host)")
+
+    try:
+        if retry_dead:
+            return sender.retry_dead_letters()
+        stakeholders = [
+            stakeholder
+            for lead in load_companies_data(outreach_file)
+            for stakeholder in lead.get('stakeholders', [])
+        ]
+        return sender.send(stakeholders)
+    finally:
+        sender.close()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != '--retry-dead']
+    outreach_file = args[0] if args else 'data/leads_with_outreach.json'
+
+    run_email_sender(outreach_file, retry_dead='--retry-dead' in sys.argv[1:])
@@ -0,0 +1,252 @@
+"""
+Enrichment Client Module for DuPont Tedlar Lead Generation
+
+This module provides a pluggable client layer for firmographic enrichment
+providers (ZoomInfo, Crunchbase, LinkedIn Sales Navigator, D&B Hoovers).
+Lookups are batched where a provider offers a bulk endpoint, run concurrently
+in a thread pool, limited per provider with a token bucket and retried with jitter.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import requests
+
+from src.rate_limit import TokenBucket, retry_with_jitter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Company fields that enrichment payloads may fill in
+ENRICHMENT_FIELDS = ['estimated_revenue', 'employee_count', 'description', 'website_text', 'products']
+
+# HTTP status codes that are worth retrying
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class EnrichmentError(Exception):
+    """Raised when an enrichment provider request fails."""
+
+class RetryableEnrichmentError(EnrichmentError):
+    """Raised for transient provider failures (rate limiting, server errors, timeouts)."""
+
+class EnrichmentProvider:
+    """Base class for enrichment providers."""
+
+    def __init__(self, name: str, rate_per_second: float = 5.0, burst: Optional[float] = None,
+                 batch_size: int = 1):
+        """
+        Args:
+            name: Provider name, used as the payload key
+            rate_per_second: Sustained request rate allowed by the provider
+            burst: Maximum burst of requests (defaults to the rate)
+            batch_size: Domains per request; 1 for providers without a bulk endpoint
+        """
+        self.name = name
+        self.batch_size = max(1, int(batch_size))
+        self.rate_limiter = TokenBucket(rate_per_second, burst)
+
+    def lookup(self, domains: List[str]) -> Dict[str, Dict]:
+        """
+        Look up a batch of at most `batch_size` company domains.
+
+        Args:
+            domains: Canonical company domains
+
+        Returns:
+            Dict[str, Dict]: Provider payload per domain found
+        """
+        raise NotImplementedError
+
+class HttpEnrichmentProvider(EnrichmentProvider):
+    """Enrichment provider reached over a JSON HTTP API."""
+
+    def __init__(self, name: str, base_url: str, api_key: str = '', rate_per_second: float = 5.0,
+                 burst: Optional[float] = None, batch_size: int = 1, timeout: float = 10.0):
+        """
+        Args:
+            name: Provider name, used as the payload key
+            base_url: API root; single lookups use GET {base_url}/companies/{domain}
+                      and bulk lookups use POST {base_url}/companies/bulk
+            api_key: Bearer token for the provider
+            rate_per_second: Sustained request rate allowed by the provider
+            burst: Maximum burst of requests (defaults to the rate)
+            batch_size: Domains per bulk request; 1 disables the bulk endpoint
+            timeout: Per-request timeout in seconds
+        """
+        super().__init__(name, rate_per_second, burst, batch_size)
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """Return this thread's HTTP session (sessions are not shared across threads)."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            if self.api_key:
+                session.headers['Authorization'] = f"Bearer {self.api_key}"
+            self._local.session = session
+        return session
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request and translate failures into enrichment errors."""
+        try:
+            response = self._session().request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise RetryableEnrichmentError(f"{self.name}: {e}") from e
+        except requests.RequestException as e:
+            # e.g. InvalidURL, TooManyRedirects: retrying will not help
+            raise EnrichmentError(f"{self.name}: {e}") from e
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise RetryableEnrichmentError(f"{self.name}: HTTP {response.status_code}")
+        return response
+
+    def _json(self, response: requests.Response) -> Dict:
+        """Decode a response body, translating malformed payloads into enrichment errors."""
+        try:
+            payload = response.json()
+        except ValueError as e:
+            raise EnrichmentError(f"{self.name}: invalid JSON response: {e}") from e
+        if not isinstance(payload, dict):
+            raise EnrichmentError(f"{self.name}: unexpected response payload {type(payload).__name__}")
+        return payload
+
+    def lookup(self, domains: List[str]) -> Dict[str, Dict]:
+        if self.batch_size > 1:
+            response = self._request('POST', '/companies/bulk', json={'domains': domains})
+            if not response.ok:
+                raise EnrichmentError(f"{self.name}: HTTP {response.status_code}")
+            return self._json(response).get('results', {})
+
+        results = {}
+        for domain in domains:
+            response = self._request('GET', f"/companies/{domain}")
+            if response.status_code == 404:
+                continue
+            if not response.ok:
+                raise EnrichmentError(f"{self.name}: HTTP {response.status_code}")
+            results[domain] = self._json(response)
+        return results
+
+class EnrichmentClient:
+    """Runs batched, rate-limited lookups against several providers concurrently."""
+
+    def __init__(self, providers: List[EnrichmentProvider], max_workers: int = 8, max_retries: int = 3,
+                 retry_base_delay: float = 0.5):
+        self.providers = providers
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['EnrichmentClient']:
+        """
+        Build a client from the `enrichment` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[EnrichmentClient]: Client, or None if no providers are configured
+        """
+        enrichment_config = config.get('enrichment', {}) or {}
+        api_keys = config.get('api_keys', {}) or {}
+
+        providers = []
+        for provider_config in enrichment_config.get('providers', []) or []:
+            providers.append(HttpEnrichmentProvider(
+                name=provider_config['name'],
+                base_url=provider_config['base_url'],
+                api_key=api_keys.get(provider_config.get('api_key', provider_config['name']), ''),
+                rate_per_second=provider_config.get('rate_per_second', 5.0),
+                burst=provider_config.get('burst'),
+                batch_size=provider_config.get('batch_size', 1),
+                timeout=provider_config.get('timeout', 10.0)
+            ))
+
+        if not providers:
+            return None
+
+        return cls(
+            providers,
+            max_workers=enrichment_config.get('max_workers', 8),
+            max_retries=enrichment_config.get('max_retries', 3)
+        )
+
+    def _lookup_batch(self, provider: EnrichmentProvider, domains: List[str]) -> Dict[str, Dict]:
+        """Look up one batch, waiting for the provider's rate limit before every attempt."""
+        def attempt() -> Dict[str, Dict]:
+            provider.rate_limiter.acquire()
+            return provider.lookup(domains)
+
+        return retry_with_jitter(
+            attempt,
+            max_retries=self.max_retries,
+            base_delay=self.retry_base_delay,
+            retry_on=(RetryableEnrichmentError,),
+            description=f"{provider.name} lookup of {len(domains)} domains"
+        )
+
+    def enrich(self, domains: List[str]) -> Dict[str, Dict[str, Dict]]:
+        """
+        Look up every domain with every provider.
+
+        Args:
+            domains: Canonical company domains
+
+        Returns:
+            Dict[str, Dict[str, Dict]]: Payloads per domain, keyed by provider name
+                (empty for providers without a record; absent if the lookup failed)
+        """
+        unique_domains = list(dict.fromkeys(d for d in domains if d))
+        results = {domain: {} for domain in unique_domains}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for provider in self.providers:
+                for start in range(0, len(unique_domains), provider.batch_size):
+                    batch = unique_domains[start:start + provider.batch_size]
+                    futures[executor.submit(self._lookup_batch, provider, batch)] = (provider, batch)
+
+            failed = 0
+            for future in as_completed(futures):
+                provider, batch = futures[future]
+                try:
+                    payloads = future.result()
+                except EnrichmentError as e:
+                    failed += 1
+                    logger.error(f"Enrichment batch failed: {e}")
+                    continue
+
+                # Domains the provider has no record of get an empty payload,
+                # which distinguishes them from domains whose lookup failed
+                for domain in batch:
+                    results[domain][provider.name] = payloads.get(domain) or {}
+
+        if failed:
+            logger.warning(f"{failed} of {len(futures)} enrichment batches failed")
+
+        return results
+
+    def merge_payloads(self, payloads: Dict[str, Dict]) -> Dict:
+        """
+        Merge provider payloads for one company, preferring providers in configured order.
+
+        Args:
+            payloads: Payloads keyed by provider name
+
+        Returns:
+            Dict: Company fields from ENRICHMENT_FIELDS found in any payload
+        """
+        merged = {}
+        for provider in self.providers:
+            payload = payloads.get(provider.name) or {}
+            for field in ENRICHMENT_FIELDS:
+                if field not in merged and payload.get(field) not in (None, '', []):
+                    merged[field] = payload[field]
+        return merged
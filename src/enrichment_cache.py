@@ -0,0 +1,193 @@
+"""
+Enrichment Cache Module for DuPont Tedlar Lead Generation
+
+This module persists enrichment provider payloads across pipeline runs,
+keyed by canonical company domain. Firmographics change slowly, so each
+field has its own time-to-live and only stale entries are re-queried.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+from src.cache import PersistentCache
+from src.enrichment import ENRICHMENT_FIELDS, EnrichmentClient
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+# Default time-to-live per enrichment field, in days
+DEFAULT_FIELD_TTL_DAYS = {
+    'estimated_revenue': 180,
+    'employee_count': 90,
+    'description': 30,
+    'website_text': 30,
+    'products': 60
+}
+
+class EnrichmentCache:
+    """Persistent, size-bounded cache of provider payloads keyed by company domain."""
+
+    def __init__(self, path: str, field_ttl_days: Optional[Dict[str, float]] = None,
+                 default_ttl_days: float = 60, max_entries: int = 100000):
+        """
+        Args:
+            path: SQLite database file for the cache
+            field_ttl_days: Time-to-live per enrichment field, in days
+            default_ttl_days: Time-to-live for fields without their own TTL, in days
+            max_entries: Maximum number of domains kept (least recently used are evicted)
+        """
+        self.store = PersistentCache(path, max_entries=max_entries, table='enrichment')
+        self.field_ttl_days = dict(DEFAULT_FIELD_TTL_DAYS)
+        self.field_ttl_days.update(field_ttl_days or {})
+        self.default_ttl_days = default_ttl_days
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['EnrichmentCache']:
+        """
+        Build a cache from the `enrichment.cache` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[EnrichmentCache]: Cache, or None if caching is disabled
+        """
+        cache_config = (config.get('enrichment', {}) or {}).get('cache', {}) or {}
+        if not cache_config.get('enabled', False):
+            return None
+
+        return cls(
+            cache_config.get('path', 'data/cache/enrichment.sqlite'),
+            field_ttl_days=cache_config.get('field_ttl_days'),
+            default_ttl_days=cache_config.get('default_ttl_days', 60),
+            max_entries=cache_config.get('max_entries', 100000)
+        )
+
+    def _ttl_seconds(self, field: str) -> float:
+        return self.field_ttl_days.get(field, self.default_ttl_days) * SECONDS_PER_DAY
+
+    def get(self, domain: str) -> Optional[Dict]:
+        """
+        Get the cache entry for a domain regardless of staleness.
+
+        Args:
+            domain: Canonical company domain
+
+        Returns:
+            Optional[Dict]: Entry with `payloads` and `fetched_at` per provider, or None
+        """
+        return self.store.get(domain)
+
+    def stale_fields(self, entry: Optional[Dict], providers: List[str], now: Optional[float] = None) -> List[str]:
+        """
+        List the fields of an entry that are due for a refresh.
+        A field is stale when the newest payload that provided it is older than its TTL.
+        Every field is stale when a provider has never been queried for the domain, or
+        when a provider had no record of it and the default TTL has passed since.
+
+        Args:
+            entry: Cache entry (or None)
+            providers: Names of the configured providers
+            now: Current timestamp (defaults to time.time())
+
+        Returns:
+            List[str]: Stale field names
+        """
+        if not entry or any(provider not in entry['fetched_at'] for provider in providers):
+            return list(ENRICHMENT_FIELDS)
+
+        now = time.time() if now is None else now
+        default_ttl = self.default_ttl_days * SECONDS_PER_DAY
+        for provider in providers:
+            if not entry['payloads'].get(provider) and now - entry['fetched_at'][provider] > default_ttl:
+                return list(ENRICHMENT_FIELDS)
+
+        stale = []
+        for field in ENRICHMENT_FIELDS:
+            fetched = [
+                entry['fetched_at'][provider] for provider, payload in entry['payloads'].items()
+                if payload.get(field) not in (None, '', [])
+            ]
+            if fetched and now - max(fetched) > self._ttl_seconds(field):
+                stale.append(field)
+        return stale
+
+    def put_many(self, payloads_by_domain: Dict[str, Dict[str, Dict]]) -> None:
+        """
+        Store fresh provider payloads, keeping cached payloads of providers that were not queried.
+
+        Args:
+            payloads_by_domain: Payloads per domain, keyed by provider name
+        """
+        now = time.time()
+        items = []
+        for domain, payloads in payloads_by_domain.items():
+            entry = self.store.get(domain) or {'payloads': {}, 'fetched_at': {}}
+            for provider, payload in payloads.items():
+                entry['payloads'][provider] = payload
+                entry['fetched_at'][provider] = now
+            items.append((domain, entry))
+
+        if items:
+            self.store.set_many(items)
+
+    def stale_domains(self, domains: List[str], providers: List[str]) -> List[str]:
+        """
+        Select the domains whose entries are missing or have stale fields.
+
+        Args:
+            domains: Canonical company domains
+            providers: Names of the configured providers
+
+        Returns:
+            List[str]: Domains that need a provider lookup
+        """
+        now = time.time()
+        return [domain for domain in dict.fromkeys(domains)
+                if domain and self.stale_fields(self.store.get(domain), providers, now)]
+
+    def lookup(self, client: EnrichmentClient, domains: List[str]) -> Dict[str, Dict[str, Dict]]:
+        """
+        Return payloads for all domains, querying providers only for missing or stale entries.
+
+        Args:
+            client: Enrichment client used for stale entries
+            domains: Canonical company domains
+
+        Returns:
+            Dict[str, Dict[str, Dict]]: Payloads per domain, keyed by provider name
+        """
+        self.refresh_stale(client, domains)
+
+        results = {}
+        for domain in dict.fromkeys(domains):
+            entry = self.store.get(domain)
+            results[domain] = entry['payloads'] if entry else {}
+        return results
+
+    def refresh_stale(self, client: EnrichmentClient, domains: Optional[List[str]] = None) -> int:
+        """
+        Re-query providers for stale entries in one concurrent batch.
+
+        Args:
+            client: Enrichment client used for the lookups
+            domains: Domains to consider (defaults to every cached domain)
+
+        Returns:
+            int: Number of domains refreshed
+        """
+        providers = [provider.name for provider in client.providers]
+        if domains is None:
+            domains = [domain for domain, _ in self.store.items()]
+
+        stale = self.stale_domains(domains, providers)
+        logger.info(f"Enrichment cache: {len(stale)} of {len(set(domains))} domains missing or stale")
+
+        if stale:
+            self.put_many(client.enrich(stale))
+
+        return len(stale)
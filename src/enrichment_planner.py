@@ -0,0 +1,161 @@
+"""
+Enrichment Planning Module for DuPont Tedlar Lead Generation
+
+This module decides which companies are worth paid enrichment calls. Industry
+fit and engagement are scored from scraped data alone, which bounds the best
+overall score a company can reach; companies that cannot reach the qualification
+cutoff are never enriched, and the rest are enriched in order of expected score
+until the call budget runs out. Keywords are re-detected after enrichment over
+the provider's text as well, so scraped text only informs the expected score,
+never the bound.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from src.scoring import (MAX_COMPONENT_SCORE, QUALIFICATION_THRESHOLD, SCORE_WEIGHTS, company_text,
+                         score_engagement, score_industry, score_keywords)
+from src.utils import canonical_domain
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class EnrichmentPlanner:
+    """Plans enrichment calls under a call budget using cheap score upper bounds."""
+
+    def __init__(self, qualifier, call_budget: Optional[int] = None,
+                 expected_size_score: float = 7.0, expected_keyword_score: float = 6.0,
+                 threshold: float = QUALIFICATION_THRESHOLD):
+        """
+        Args:
+            qualifier: LeadQualifier whose scoring functions and enrichment setup are used
+            call_budget: Maximum provider calls per run (None for unlimited)
+            expected_size_score: Prior size score used to rank companies before enrichment
+            expected_keyword_score: Prior keyword score for companies without scraped text
+            threshold: Qualification cutoff on the overall score
+        """
+        self.qualifier = qualifier
+        self.call_budget = call_budget
+        self.expected_size_score = expected_size_score
+        self.expected_keyword_score = expected_keyword_score
+        self.threshold = threshold
+
+    @classmethod
+    def from_config(cls, config: Dict, qualifier) -> Optional['EnrichmentPlanner']:
+        """
+        Build a planner from the `enrichment.planner` section of the configuration.
+
+        Args:
+            config: Configuration data
+            qualifier: LeadQualifier the plan is made for
+
+        Returns:
+            Optional[EnrichmentPlanner]: Planner, or None if planning is disabled
+        """
+        planner_config = (config.get('enrichment', {}) or {}).get('planner', {}) or {}
+        if not planner_config.get('enabled', False):
+            return None
+
+        return cls(
+            qualifier,
+            call_budget=planner_config.get('call_budget'),
+            expected_size_score=planner_config.get('expected_size_score', 7.0),
+            expected_keyword_score=planner_config.get('expected_keyword_score', 6.0)
+        )
+
+    def estimate(self, company: Dict) -> Dict[str, float]:
+        """
+        Bound a company's overall score using only scraped data.
+
+        Args:
+            company: Company data before enrichment
+
+        Returns:
+            Dict[str, float]: `upper_bound` and `expected_score` of the overall score
+        """
+        cheap_score = (
+            score_industry(company, self.qualifier.icp_criteria) * SCORE_WEIGHTS['industry_score'] +
+            score_engagement(company) * SCORE_WEIGHTS['engagement_score']
+        )
+
+        # Keywords are free to score when there is scraped text to scan; only the expected score uses them
+        text = company_text(company)
+        if text:
+            keywords = self.qualifier._detect_keywords(company['name'], company.get('industry', ''), text)
+            keyword_expected = score_keywords({'keywords': keywords}, self.qualifier.icp_criteria)
+        else:
+            keyword_expected = self.expected_keyword_score
+        # Enrichment can add text with more keywords, so the bound assumes the best keyword score
+        keyword_bound = MAX_COMPONENT_SCORE
+
+        return {
+            'upper_bound': (
+                cheap_score +
+                MAX_COMPONENT_SCORE * SCORE_WEIGHTS['size_score'] +
+                keyword_bound * SCORE_WEIGHTS['keyword_score']
+            ),
+            'expected_score': (
+                cheap_score +
+                self.expected_size_score * SCORE_WEIGHTS['size_score'] +
+                keyword_expected * SCORE_WEIGHTS['keyword_score']
+            )
+        }
+
+    def plan(self, companies: List[Dict]) -> Dict[str, List[str]]:
+        """
+        Decide which company domains to enrich.
+
+        Args:
+            companies: Company data before enrichment
+
+        Returns:
+            Dict[str, List[str]]: Domains to `enrich` (best first), `skipped` because they
+                cannot reach the cutoff, and `deferred` because the budget ran out
+        """
+        client = self.qualifier.enrichment_client
+        cache = self.qualifier.enrichment_cache
+        # A bulk request covers batch_size domains
+        calls_per_domain = sum(1.0 / provider.batch_size for provider in client.providers) if client else 0.0
+
+        candidates = {}
+        skipped = []
+        for company in companies:
+            domain = canonical_domain(company.get('website', ''))
+            if not domain or domain in candidates:
+                continue
+
+            estimate = self.estimate(company)
+            if estimate['upper_bound'] < self.threshold:
+                skipped.append(domain)
+            else:
+                candidates[domain] = estimate
+
+        # Domains with fresh cache entries cost no provider calls
+        stale = set(candidates)
+        if cache and client:
+            stale = set(cache.stale_domains(list(candidates), [provider.name for provider in client.providers]))
+
+        ordered = sorted(
+            candidates,
+            key=lambda d: (candidates[d]['expected_score'], candidates[d]['upper_bound']),
+            reverse=True
+        )
+
+        enrich = []
+        deferred = []
+        calls = 0.0
+        for domain in ordered:
+            cost = calls_per_domain if domain in stale else 0.0
+            if self.call_budget is not None and calls + cost > self.call_budget:
+                deferred.append(domain)
+                continue
+            calls += cost
+            enrich.append(domain)
+
+        logger.info(
+            f"Enrichment plan: {len(enrich)} companies to enrich (~{calls:.0f} provider calls), "
+            f"{len(skipped)} below the {self.threshold} cutoff, {len(deferred)} deferred by budget"
+        )
+
+        return {'enrich': enrich, 'skipped': skipped, 'deferred': deferred}
@@ -0,0 +1,103 @@
+"""
+Generation Cache Module for DuPont Tedlar Lead Generation
+
+This module caches LLM-generated outreach across pipeline runs. Entries are
+content-addressed: the key is a SHA-256 hash of the fully rendered prompt
+and the model settings, so an unchanged lead and stakeholder reuse their
+previous message, while any change to the inputs or settings produces a new
+key.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from src.cache import PersistentCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class GenerationCache:
+    """Persistent cache of generated subject lines and messages keyed by prompt and model settings."""
+
+    def __init__(self, path: str, max_entries: int = 200000, bypass: bool = False):
+        """
+        Args:
+            path: SQLite database file for the cache
+            max_entries: Maximum cached generations; least recently used entries are evicted
+            bypass: Ignore cached entries (new generations are still stored)
+        """
+        self.cache = PersistentCache(path, max_entries=max_entries, table='generations')
+        self.bypass = bypass
+
+    @classmethod
+    def from_config(cls, config: Dict, bypass: Optional[bool] = None) -> Optional['GenerationCache']:
+        """
+        Build a cache from the `llm.cache` section of the configuration.
+
+        Args:
+            config: Configuration data
+            bypass: Overrides `llm.cache.bypass` when given
+
+        Returns:
+            Optional[GenerationCache]: Cache, or None if disabled
+        """
+        cache_config = (config.get('llm', {}) or {}).get('cache', {}) or {}
+        if not cache_config.get('enabled', False):
+            return None
+        return cls(
+            cache_config.get('path', 'data/cache/generations.sqlite'),
+            max_entries=cache_config.get('max_entries', 200000),
+            bypass=cache_config.get('bypass', False) if bypass is None else bypass
+        )
+
+    @staticmethod
+    def key(prompt: str, model: str, temperature: float, max_tokens: int) -> str:
+        """
+        Content address of a generation.
+
+        Args:
+            prompt: Fully rendered prompt
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens generated
+
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        content = json.dumps([prompt, model, temperature, max_tokens], ensure_ascii=False)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: List[str]) -> List[Optional[Tuple[Optional[str], str]]]:
+        """
+        Look up generations.
+
+        Args:
+            keys: Generation keys
+
+        Returns:
+            List[Optional[Tuple[Optional[str], str]]]: (subject line, message) per key, None on a miss
+                (always None when bypassing)
+        """
+        if self.bypass:
+            return [None] * len(keys)
+
+        results = []
+        for key in keys:
+            entry = self.cache.get(key)
+            results.append((entry['subject_line'], entry['outreach_message']) if entry else None)
+        return results
+
+    def put_many(self, items: List[Tuple[str, Optional[str], str]]) -> None:
+        """
+        Store generations.
+
+        Args:
+            items: (key, subject line, message) triples
+        """
+        self.cache.set_many([
+            (key, {'subject_line': subject_line, 'outreach_message': message})
+            for key, subject_line, message in items
+        ])
@@ -0,0 +1,220 @@
+"""
+Stakeholder Identity Module for DuPont Tedlar Lead Generation
+
+This module keeps a persistent index of stakeholder identities across
+companies and pipeline runs. A person is recognized by LinkedIn URL,
+normalized email or name plus company email domain, so the same contact
+found under several exhibitor entries (subsidiaries, renamed divisions) or
+on a later run is merged, and their prior evaluation is reused.
+"""
+
+import logging
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from src.cache import PersistentCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+# Stakeholder fields kept as the identity's latest search snapshot
+SNAPSHOT_FIELDS = ['name', 'title', 'department', 'years_at_company', 'location', 'linkedin_url', 'email',
+                   'email_confidence', 'email_verified', 'relevance_score', 'source']
+
+def normalize_linkedin_url(url: str) -> str:
+    """
+    Normalize a LinkedIn profile URL to "linkedin.com/in/<handle>".
+
+    Args:
+        url: LinkedIn profile URL
+
+    Returns:
+        str: Normalized URL, or an empty string
+    """
+    url = (url or '').strip().lower()
+    if '://' in url:
+        url = url.split('://', 1)[1]
+    url = url.split('?', 1)[0].split('#', 1)[0].rstrip('/')
+    if url.startswith('www.'):
+        url = url[4:]
+    return url
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for identity matching."""
+    return (email or '').strip().lower()
+
+def normalize_name(name: str) -> str:
+    """Normalize a person's name for identity matching."""
+    return ' '.join((name or '').lower().split())
+
+def identity_keys(stakeholder: Dict, domain: str) -> List[str]:
+    """
+    Build the lookup keys of a stakeholder, strongest first.
+
+    Args:
+        stakeholder: Stakeholder data
+        domain: Company email domain
+
+    Returns:
+        List[str]: Keys for LinkedIn URL, email and name+domain (where available)
+    """
+    keys = []
+    linkedin_url = normalize_linkedin_url(stakeholder.get('linkedin_url', ''))
+    if linkedin_url:
+        keys.append(f"li:{linkedin_url}")
+    email = normalize_email(stakeholder.get('email', ''))
+    if email:
+        keys.append(f"em:{email}")
+    name = normalize_name(stakeholder.get('name', ''))
+    if name and domain:
+        keys.append(f"nd:{name}@{domain}")
+    return keys
+
+class StakeholderIdentityIndex:
+    """Persistent index of stakeholder identities and their prior evaluations."""
+
+    def __init__(self, path: str, max_entries: int = 1000000):
+        """
+        Args:
+            path: SQLite database file for the index
+            max_entries: Maximum identities (and keys) kept
+        """
+        self.keys = PersistentCache(path, max_entries=max_entries * 3, table='identity_keys')
+        self.identities = PersistentCache(path, max_entries=max_entries, table='identities')
+        self.searches = PersistentCache(path, max_entries=max_entries, table='company_searches')
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['StakeholderIdentityIndex']:
+        """
+        Build an index from the `identity_index` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[StakeholderIdentityIndex]: Index, or None if disabled
+        """
+        index_config = config.get('identity_index', {}) or {}
+        if not index_config.get('enabled', False):
+            return None
+        return cls(index_config.get('path', 'data/cache/identities.sqlite'),
+                   max_entries=index_config.get('max_entries', 1000000))
+
+    def resolve(self, stakeholder: Dict, domain: str) -> Optional[str]:
+        """
+        Find the identity of a stakeholder.
+
+        Args:
+            stakeholder: Stakeholder data
+            domain: Company email domain
+
+        Returns:
+            Optional[str]: Identity id, or None for a new person
+        """
+        linkedin_url = normalize_linkedin_url(stakeholder.get('linkedin_url', ''))
+
+        for key in identity_keys(stakeholder, domain):
+            identity_id = self.keys.get(key)
+            record = self.identities.get(identity_id) if identity_id else None
+            if record is None:
+                continue
+
+            # Two different LinkedIn profiles are two people, even with the same name or a guessed email
+            known_url = normalize_linkedin_url(record['stakeholder'].get('linkedin_url', ''))
+            if linkedin_url and known_url and linkedin_url != known_url:
+                continue
+
+            return identity_id
+        return None
+
+    def get(self, identity_id: str) -> Optional[Dict]:
+        """
+        Get an identity record.
+
+        Args:
+            identity_id: Identity id
+
+        Returns:
+            Optional[Dict]: Record with `stakeholder` snapshot, `companies` and `evaluation`
+        """
+        return self.identities.get(identity_id)
+
+    def register(self, stakeholder: Dict, domain: str, company_name: str) -> str:
+        """
+        Record a sighting of a stakeholder, merging it into an existing identity if any key matches.
+
+        Args:
+            stakeholder: Stakeholder data
+            domain: Company email domain
+            company_name: Company the stakeholder was found under
+
+        Returns:
+            str: Identity id
+        """
+        identity_id = self.resolve(stakeholder, domain)
+        now = time.time()
+
+        record = self.identities.get(identity_id) if identity_id else None
+        if record is None:
+            identity_id = uuid.uuid4().hex
+            record = {'companies': [], 'evaluation': None, 'first_seen': now}
+
+        record['stakeholder'] = {field: stakeholder[field] for field in SNAPSHOT_FIELDS if field in stakeholder}
+        record['domain'] = domain
+        record['last_seen'] = now
+        if company_name not in record['companies']:
+            record['companies'].append(company_name)
+
+        self.identities.set(identity_id, record)
+        self.keys.set_many([(key, identity_id) for key in identity_keys(stakeholder, domain)])
+        return identity_id
+
+    def store_evaluation(self, identity_id: str, evaluation: Dict) -> None:
+        """
+        Save a stakeholder's evaluation for reuse on later runs.
+
+        Args:
+            identity_id: Identity id
+            evaluation: Evaluated fields (scores, interest areas) and the title they were computed for
+        """
+        record = self.identities.get(identity_id)
+        if record is not None:
+            record['evaluation'] = evaluation
+            self.identities.set(identity_id, record)
+
+    def record_search(self, domain: str, identity_ids: List[str]) -> None:
+        """
+        Remember which identities a people search returned for a company.
+
+        Args:
+            domain: Company email domain
+            identity_ids: Identities found at the company
+        """
+        self.searches.set(domain, {'searched_at': time.time(), 'identity_ids': identity_ids})
+
+    def recent_search(self, domain: str, max_age_days: float) -> Optional[List[Dict]]:
+        """
+        Get the stakeholders of a company searched within the last max_age_days.
+
+        Args:
+            domain: Company email domain
+            max_age_days: Maximum age of the search in days
+
+        Returns:
+            Optional[List[Dict]]: Stakeholder snapshots, or None if the company needs a new search
+        """
+        search = self.searches.get(domain)
+        if not search or time.time() - search['searched_at'] > max_age_days * SECONDS_PER_DAY:
+            return None
+
+        stakeholders = []
+        for identity_id in search['identity_ids']:
+            record = self.identities.get(identity_id)
+            if record is None:
+                return None
+            stakeholders.append(dict(record['stakeholder']))
+        return stakeholders
@@ -0,0 +1,147 @@
+"""
+Interest Catalog Module for DuPont Tedlar Lead Generation
+
+This module maps a stakeholder's department and title to likely interest
+areas. The catalog is read from the `interest_areas` section of the
+configuration, so product marketing can edit it without code changes, and
+lookups are memoized per (normalized title, department).
+"""
+
+import hashlib
+import json
+import logging
+import random
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from src.title_scoring import normalize_title
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Interest areas by department, used when the configuration has none
+DEFAULT_DEPARTMENT_INTERESTS = {
+    "Product Development": [
+        "new material technologies",
+        "product performance improvements",
+        "sustainability features",
+        "protective film applications",
+        "extended product lifecycle"
+    ],
+    "R&D": [
+        "material innovation",
+        "UV resistance technologies",
+        "weatherproofing advances",
+        "durability testing",
+        "advanced polymers"
+    ],
+    "Innovation": [
+        "next-generation materials",
+        "sustainable solutions",
+        "material science breakthroughs",
+        "advanced coatings",
+        "environmental protection"
+    ],
+    "Procurement": [
+        "cost reduction",
+        "supplier reliability",
+        "long-term partnerships",
+        "material consistency",
+        "simplified supply chain"
+    ],
+    "Technical": [
+        "technical specifications",
+        "application methods",
+        "integration with existing systems",
+        "testing protocols",
+        "performance metrics"
+    ],
+    "Marketing": [
+        "market differentiation",
+        "product positioning",
+        "competitive advantages",
+        "customer satisfaction",
+        "value propositions"
+    ]
+}
+
+# Interest areas added when a title contains any of the keywords
+DEFAULT_TITLE_INTERESTS = [
+    {'keywords': ["product"], 'interests': ["product innovation", "material performance"]},
+    {'keywords': ["innovation", "r&d"], 'interests': ["cutting-edge materials", "research collaboration"]},
+    {'keywords': ["technical"], 'interests': ["technical specifications", "implementation support"]},
+    {'keywords': ["procurement", "purchasing"], 'interests': ["vendor consolidation", "quality consistency"]}
+]
+
+class InterestCatalog:
+    """Memoized lookup of stakeholder interest areas by title and department."""
+
+    def __init__(self, department_interests: Optional[Dict[str, List[str]]] = None,
+                 title_interests: Optional[List[Dict]] = None, max_interests: int = 4):
+        """
+        Args:
+            department_interests: Interest areas per department
+            title_interests: Rules with `keywords` (matched in the normalized title) and `interests`
+            max_interests: Maximum interest areas returned per stakeholder
+        """
+        self.department_interests = department_interests or DEFAULT_DEPARTMENT_INTERESTS
+        self.title_interests = [
+            ([normalize_title(keyword) for keyword in rule['keywords']], list(rule['interests']))
+            for rule in (title_interests or DEFAULT_TITLE_INTERESTS)
+        ]
+        self.max_interests = max_interests
+        self._table = {}
+
+        # Identifies the catalog contents, so results stored elsewhere can be invalidated on edits
+        self.fingerprint = hashlib.sha1(json.dumps(
+            [self.department_interests, self.title_interests, max_interests], sort_keys=True
+        ).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'InterestCatalog':
+        """
+        Build a catalog from the `interest_areas` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            InterestCatalog: Catalog, with built-in defaults for missing parts
+        """
+        catalog_config = config.get('interest_areas', {}) or {}
+        return cls(
+            department_interests=catalog_config.get('departments'),
+            title_interests=catalog_config.get('title_keywords'),
+            max_interests=catalog_config.get('max_interests', 4)
+        )
+
+    def interests_for(self, title: str, department: str) -> List[str]:
+        """
+        Get likely interest areas for a stakeholder.
+
+        Args:
+            title: Stakeholder's title
+            department: Stakeholder's department
+
+        Returns:
+            List[str]: Interest areas (a new list the caller may modify)
+        """
+        key = (normalize_title(title), department)
+        interests = self._table.get(key)
+        if interests is None:
+            interests = self._table[key] = self._build(*key)
+        return list(interests)
+
+    def _build(self, normalized_title: str, department: str) -> Tuple[str, ...]:
+        """Combine department and title interests and pick a stable subset."""
+        candidates = list(self.department_interests.get(department, []))
+        for keywords, interests in self.title_interests:
+            if any(keyword in normalized_title for keyword in keywords):
+                candidates.extend(interests)
+        candidates = list(dict.fromkeys(candidates))
+
+        # Seeded from a stable hash, so the same stakeholder gets the same subset on every run
+        # without touching the global random state
+        rng = random.Random(zlib.crc32(f"{normalized_title}|{department}".encode('utf-8')))
+        return tuple(rng.sample(candidates, min(self.max_interests, len(candidates))))
@@ -0,0 +1,182 @@
+"""
+Keyword Matching Module for DuPont Tedlar Lead Generation
+
+This module provides a multi-pattern keyword matcher (an Aho-Corasick automaton)
+that scans company website and product text for ICP keywords and their synonyms
+in a single pass, independent of the number of configured phrases.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def _is_word_char(char: str) -> bool:
+    """Characters kept by normalization; everything else is a word separator."""
+    return char.isalnum() or char == '&'
+
+def normalize_text(text: str) -> Tuple[str, List[int]]:
+    """
+    Normalize text for keyword matching.
+    Lowercases the text and collapses punctuation and whitespace runs into single spaces,
+    so "Weather-Resistant" and "weather resistant" normalize to the same string.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Tuple[str, List[int]]: Normalized text and the original offset of each normalized character
+    """
+    chars = []
+    offsets = []
+    pending_space = False
+
+    for index, char in enumerate(text):
+        if _is_word_char(char):
+            if pending_space and chars:
+                chars.append(' ')
+                offsets.append(index - 1)
+            pending_space = False
+            chars.append(char.lower())
+            offsets.append(index)
+        else:
+            pending_space = True
+
+    return ''.join(chars), offsets
+
+class KeywordMatcher:
+    """Aho-Corasick matcher for ICP keyword phrases and their synonyms."""
+
+    def __init__(self, keywords: List[str], synonyms: Optional[Dict[str, List[str]]] = None):
+        """
+        Build the automaton for a set of keywords.
+
+        Args:
+            keywords: Canonical keyword phrases
+            synonyms: Optional mapping of canonical keyword to alternative phrases
+        """
+        self.keywords = list(keywords)
+
+        # Each pattern maps back to the canonical keyword it reports
+        patterns = {}
+        for keyword in self.keywords:
+            patterns.setdefault(normalize_text(keyword)[0], keyword)
+        for keyword, alternatives in (synonyms or {}).items():
+            for alternative in alternatives:
+                patterns.setdefault(normalize_text(alternative)[0], keyword)
+        patterns.pop('', None)
+
+        self.pattern_texts = list(patterns.keys())
+        self.pattern_keywords = list(patterns.values())
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [-1]     # Pattern ending exactly at this state
+        self._dict_link = [0]   # Nearest proper suffix state that ends a pattern
+        self._depth = [0]
+
+        for pattern_id, pattern in enumerate(self.pattern_texts):
+            self._add_pattern(pattern, pattern_id)
+        self._build_links()
+
+        logger.debug(f"Built keyword matcher with {len(self.pattern_texts)} patterns and {len(self._goto)} states")
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'KeywordMatcher':
+        """
+        Build a matcher from the `icp_criteria` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            KeywordMatcher: Matcher over `keywords` and `keyword_synonyms`
+        """
+        icp_criteria = config.get('icp_criteria', {})
+        return cls(icp_criteria.get('keywords', []), icp_criteria.get('keyword_synonyms', {}))
+
+    def _add_pattern(self, pattern: str, pattern_id: int) -> None:
+        """Insert a normalized pattern into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(-1)
+                self._dict_link.append(0)
+                self._depth.append(self._depth[state] + 1)
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state] = pattern_id
+
+    def _build_links(self) -> None:
+        """Compute failure and dictionary suffix links breadth-first."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+
+                suffix = self._fail[child]
+                self._dict_link[child] = suffix if self._output[suffix] >= 0 else self._dict_link[suffix]
+                queue.append(child)
+
+    def find_all(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Find every whole-word keyword occurrence in the text in a single pass.
+
+        Args:
+            text: Raw text to scan
+
+        Returns:
+            List[Tuple[str, int, int]]: (keyword, start, end) with offsets into the original text
+        """
+        normalized, offsets = normalize_text(text)
+        matches = []
+        state = 0
+        length = len(normalized)
+
+        for index, char in enumerate(normalized):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            # Only report phrases that end on a word boundary
+            if index + 1 < length and normalized[index + 1] != ' ':
+                continue
+
+            match_state = state if self._output[state] >= 0 else self._dict_link[state]
+            while match_state:
+                start = index + 1 - self._depth[match_state]
+                if start == 0 or normalized[start - 1] == ' ':
+                    pattern_id = self._output[match_state]
+                    matches.append((self.pattern_keywords[pattern_id], offsets[start], offsets[index] + 1))
+                match_state = self._dict_link[match_state]
+
+        return matches
+
+    def scan(self, text: str) -> Dict[str, Dict]:
+        """
+        Count keyword matches in the text.
+
+        Args:
+            text: Raw text to scan
+
+        Returns:
+            Dict[str, Dict]: Per matched keyword, its `count` and list of (start, end) `positions`
+        """
+        results = {}
+        for keyword, start, end in self.find_all(text):
+            entry = results.setdefault(keyword, {'count': 0, 'positions': []})
+            entry['count'] += 1
+            entry['positions'].append((start, end))
+        return results
@@ -13,7 +13,14 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 from tqdm import tqdm
 
-from src.utils import load_config, load_json, save_json
+from src.enrichment import EnrichmentClient
+from src.enrichment_cache import EnrichmentCache
+from src.enrichment_planner import EnrichmentPlanner
+from src.keyword_matcher import KeywordMatcher
+from src.normalized_data import load_companies_data, save_companies_data
+from src.records import annotate
+from src.scoring import QUALIFICATION_THRESHOLD, company_text, overall_score, score_components
+from src.utils import canonical_domain, load_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,40 +33,65 @@ class LeadQualifier:
         self.config = config
         self.companies_data = companies_data
         self.icp_criteria = config['icp_criteria']
+        self.keyword_matcher = KeywordMatcher.from_config(config)
+        self.enrichment_client = EnrichmentClient.from_config(config)
+        self.enrichment_cache = EnrichmentCache.from_config(config) if self.enrichment_client else None
+        self.enrichment_planner = EnrichmentPlanner.from_config(config, self) if self.enrichment_client else None
         self.qualified_leads = []
         
     def enrich_company_data(self) -> List[Dict]:
         """
         Enrich company data with additional information like revenue and employee count.
-        In a production system, this would query external APIs or databases.
+        Queries the configured enrichment providers when there are any, otherwise
+        simulates the data for the prototype.
         
         Returns:
             List[Dict]: Enriched company data
         """
         logger.info("Enriching company data with size and revenue information")
         
+        # Look up all companies up front so providers can be queried in
+        # concurrent, rate-limited bulk requests instead of one call per company
+        provider_payloads = {}
+        if self.enrichment_client:
+            domains = [canonical_domain(company.get('website', '')) for company in self.companies_data]
+            if self.enrichment_planner:
+                # Spend paid calls only on companies that can still reach the cutoff
+                plan = self.enrichment_planner.plan(self.companies_data)
+                domains = plan['enrich']
+            
+            if self.enrichment_cache:
+                # Only missing or stale domains are sent to the providers
+                provider_payloads = self.enrichment_cache.lookup(self.enrichment_client, domains)
+            else:
+                provider_payloads = self.enrichment_client.enrich(domains)
+        
         enriched_companies = []
         
         for company in tqdm(self.companies_data, desc="Enriching companies"):
-            # In a real system, this would call APIs like:
-            # - LinkedIn Sales Navigator
-            # - ZoomInfo
-            # - Crunchbase
-            # - D&B Hoovers
-            # For the prototype, we'll simulate this data
-            
-            enriched_company = company.copy()
+            enriched_company = annotate(company)
             
-            # Simulated revenue and employee data
-            # In a real system, this would be fetched from external sources
-            revenue_range, employee_count = self._get_company_size_data(company['name'])
-            
-            # Add enrichment data
-            enriched_company['estimated_revenue'] = revenue_range
-            enriched_company['employee_count'] = employee_count
+            if self.enrichment_client:
+                # Data from LinkedIn Sales Navigator, ZoomInfo, Crunchbase, D&B Hoovers, ...
+                domain = canonical_domain(company.get('website', ''))
+                if domain in provider_payloads:
+                    enriched_company.update(self.enrichment_client.merge_payloads(provider_payloads[domain]))
+                else:
+                    enriched_company['enrichment_skipped'] = True
+                enriched_company.setdefault('estimated_revenue', '')
+                enriched_company.setdefault('employee_count', 0)
+            else:
+                # Simulated revenue and employee data for the prototype
+                revenue_range, employee_count = self._get_company_size_data(company['name'])
+                
+                # Add enrichment data
+                enriched_company['estimated_revenue'] = revenue_range
+                enriched_company['employee_count'] = employee_count
             
             # Add keywords detected from company website/description
-            enriched_company['keywords'] = self._detect_keywords(company['name'], company.get('industry', ''))
+            enriched_company['keywords'] = self._detect_keywords(
+                company['name'], company.get('industry', ''), company_text(enriched_company)
+            )
             
             enriched_companies.append(enriched_company)
         
@@ -114,18 +146,24 @@ class LeadQualifier:
         
         return revenue, employees
     
-    def _detect_keywords(self, company_name: str, industry: str) -> List[str]:
+    def _detect_keywords(self, company_name: str, industry: str, company_text: str = '') -> List[str]:
         """
         Detect relevant keywords for a company.
-        This is a mock function for the prototype.
+        Scans the company's text with the keyword matcher when text is available,
+        otherwise falls back to mock keywords for the prototype.
         
         Args:
             company_name: Name of the company
             industry: Industry of the company
+            company_text: Combined website and product text of the company
             
         Returns:
-            List[str]: Detected keywords
+            List[str]: Detected keywords, most frequent first
         """
+        if company_text:
+            matches = self.keyword_matcher.scan(company_text)
+            return sorted(matches, key=lambda keyword: (-matches[keyword]['count'], matches[keyword]['positions'][0]))
+        
         # Seed random with company name for consistent results
         random.seed(hash(company_name) % 1000)
         
@@ -171,21 +209,17 @@ class LeadQualifier:
         
         for company in tqdm(self.companies_data, desc="Scoring companies"):
             # Calculate scores for different criteria
-            industry_score = self._score_industry(company)
-            size_score = self._score_company_size(company)
-            keyword_score = self._score_keywords(company)
-            engagement_score = self._score_engagement(company)
+            component_scores = self.score_components(company)
+            industry_score = component_scores['industry_score']
+            size_score = component_scores['size_score']
+            keyword_score = component_scores['keyword_score']
+            engagement_score = component_scores['engagement_score']
             
             # Calculate overall score (weighted average)
-            overall_score = (
-                industry_score * 0.35 +
-                size_score * 0.25 +
-                keyword_score * 0.20 +
-                engagement_score * 0.20
-            )
+            lead_score = overall_score(component_scores)
             
             # Determine if the lead is qualified (score >= 7.0)
-            is_qualified = overall_score >= 7.0
+            is_qualified = lead_score >= QUALIFICATION_THRESHOLD
             
             # Generate qualification rationale
             rationale = self._generate_qualification_rationale(
@@ -196,18 +230,18 @@ class LeadQualifier:
                     'size_score': size_score,
                     'keyword_score': keyword_score,
                     'engagement_score': engagement_score,
-                    'overall_score': overall_score
+                    'overall_score': lead_score
                 }
             )
             
             # Add scores and qualification status to company data
-            scored_company = company.copy()
+            scored_company = annotate(company)
             scored_company.update({
                 'industry_score': round(industry_score, 2),
                 'size_score': round(size_score, 2),
                 'keyword_score': round(keyword_score, 2),
                 'engagement_score': round(engagement_score, 2),
-                'overall_score': round(overall_score, 2),
+                'overall_score': round(lead_score, 2),
                 'is_qualified': is_qualified,
                 'qualification_rationale': rationale
             })
@@ -223,168 +257,17 @@ class LeadQualifier:
         
         return qualified_leads
     
-    def _score_industry(self, company: Dict) -> float:
-        """
-        Score a company based on industry fit.
-        
-        Args:
-            company: Company data
-            
-        Returns:
-            float: Industry fit score (0-10)
-        """
-        target_industries = self.icp_criteria['industries']
-        company_industry = company.get('industry', '')
-        
-        # Exact match
-        if company_industry in target_industries:
-            return 10.0
-        
-        # Partial match (check if any target industry is part of the company industry)
-        for target in target_industries:
-            if target.lower() in company_industry.lower():
-                return 8.0
-        
-        # No match
-        return 4.0
-    
-    def _score_company_size(self, company: Dict) -> float:
-        """
-        Score a company based on size (revenue and employees).
-        
-        Args:
-            company: Company data with revenue and employee information
-            
-        Returns:
-            float: Company size score (0-10)
-        """
-        # Extract employee count
-        employee_count = company.get('employee_count', 0)
-        
-        # Extract revenue (for the prototype, we're using revenue ranges)
-        revenue_str = company.get('estimated_revenue', '')
-        
-        # Convert revenue string to approximate value in millions
-        revenue_value = 0
-        if "$10B+" in revenue_str:
-            revenue_value = 10000
-        elif "$5B - $10B" in revenue_str:
-            revenue_value = 7500
-        elif "$1B - $5B" in revenue_str:
-            revenue_value = 3000
-        elif "$500M - $1B" in revenue_str:
-            revenue_value = 750
-        elif "$100M - $500M" in revenue_str:
-            revenue_value = 300
-        elif "$50M - $100M" in revenue_str:
-            revenue_value = 75
-        elif "$10M - $50M" in revenue_str:
-            revenue_value = 30
-        
-        # Score based on employee count
-        min_employees = self.icp_criteria['company_size']['min_employees']
-        preferred_employees = self.icp_criteria['company_size']['preferred_employees']
-        
-        if employee_count >= preferred_employees:
-            employee_score = 10.0
-        elif employee_count >= min_employees:
-            # Scale between 6.0 and 9.9 based on how close to preferred
-            employee_score = 6.0 + 3.9 * (employee_count - min_employees) / (preferred_employees - min_employees)
-        else:
-            # Below minimum but not zero
-            employee_score = max(3.0, 6.0 * employee_count / min_employees)
-        
-        # Score based on revenue
-        min_revenue = self.icp_criteria['company_size']['min_revenue_usd'] / 1_000_000  # Convert to millions
-        preferred_revenue = self.icp_criteria['company_size']['preferred_revenue_usd'] / 1_000_000  # Convert to millions
-        
-        if revenue_value >= preferred_revenue:
-            revenue_score = 10.0
-        elif revenue_value >= min_revenue:
-            # Scale between 6.0 and 9.9 based on how close to preferred
-            revenue_score = 6.0 + 3.9 * (revenue_value - min_revenue) / (preferred_revenue - min_revenue)
-        else:
-            # Below minimum but not zero
-            revenue_score = max(3.0, 6.0 * revenue_value / min_revenue)
-        
-        # Combined score (weighted average)
-        combined_score = (employee_score * 0.4) + (revenue_score * 0.6)
-        
-        return combined_score
-    
-    def _score_keywords(self, company: Dict) -> float:
+    def score_components(self, company: Dict) -> Dict[str, float]:
         """
-        Score a company based on keyword relevance.
+        Calculate the unweighted ICP score components for a company.
         
         Args:
-            company: Company data with detected keywords
+            company: Enriched company data
             
         Returns:
-            float: Keyword relevance score (0-10)
-        """
-        target_keywords = set(k.lower() for k in self.icp_criteria['keywords'])
-        company_keywords = set(k.lower() for k in company.get('keywords', []))
-        
-        # Count matches
-        matches = target_keywords.intersection(company_keywords)
-        match_count = len(matches)
-        
-        # Calculate score based on number of matches
-        if match_count >= 5:
-            return 10.0
-        elif match_count >= 3:
-            return 8.0
-        elif match_count >= 1:
-            return 6.0
-        else:
-            return 4.0
-    
-    def _score_engagement(self, company: Dict) -> float:
+            Dict[str, float]: Score per component, keyed as in SCORE_WEIGHTS
         """
-        Score a company based on event and association engagement.
-        
-        Args:
-            company: Company data with event and association information
-            
-        Returns:
-            float: Engagement score (0-10)
-        """
-        events = company.get('events', [])
-        associations = company.get('associations', [])
-        
-        # Count events and association memberships
-        event_count = len(events)
-        association_count = len(associations)
-        
-        # Check for premium engagement
-        premium_engagement = False
-        for event in events:
-            if event.get('sponsorship', False):
-                premium_engagement = True
-                break
-                
-        for assoc in associations:
-            if assoc.get('membership_level', '').lower() in ['platinum', 'gold']:
-                premium_engagement = True
-                break
-            
-            if assoc.get('committee_participation', False):
-                premium_engagement = True
-                break
-        
-        # Calculate score
-        if premium_engagement and event_count >= 2 and association_count >= 1:
-            return 10.0
-        elif premium_engagement and (event_count >= 1 or association_count >= 1):
-            return 9.0
-        elif event_count >= 2 and association_count >= 1:
-            return 8.0
-        elif event_count >= 2 or association_count >= 1:
-            return 7.0
-        elif event_count >= 1 or association_count >= 1:
-            return 6.0
-        else:
-            return 4.0
+        return score_components(company, self.icp_criteria)
     
     def _generate_qualification_rationale(self, company: Dict, is_qualified: bool, scores: Dict) -> str:
         """
@@ -473,7 +356,7 @@ class LeadQualifier:
         """
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        save_json(self.qualified_leads, output_file)
+        save_companies_data(self.qualified_leads, output_file)
         
         logger.info(f"Saved {len(self.qualified_leads)} qualified leads to {output_file}")
         
@@ -492,7 +375,7 @@ def run_lead_qualification(companies_file: str, config_path: str = 'config.yaml'
         str: Path to the saved qualified leads file
     """
     config = load_config(config_path)
-    companies_data = load_json(companies_file)
+    companies_data = load_companies_data(companies_file)
     
     qualifier = LeadQualifier(config, companies_data)
     
@@ -0,0 +1,161 @@
+"""
+LLM Budget Module for DuPont Tedlar Lead Generation
+
+This module keeps LLM personalization inside per-run token and spend limits.
+Before any request is sent, each prompt's cost is estimated from its length
+and the `llm.max_tokens` completion allowance, which bounds what a completion
+can use. Stakeholders are admitted in priority order (lead schedule, then
+stakeholder score) while the estimates fit the remaining budget; the rest get
+template messages. Admitted estimates are charged to the budget up front and
+replaced by the actual usage once requests complete (never by less than the
+estimate where usage is missing), so budget left over from completions
+shorter than the allowance can admit more stakeholders in a further round.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from src.llm_client import estimate_prompt_tokens
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class GenerationBudget:
+    """Per-run token and spend limits for LLM generation."""
+
+    def __init__(self, max_tokens: Optional[int] = None, max_cost: Optional[float] = None,
+                 prompt_cost_per_1k: float = 0.0, completion_cost_per_1k: float = 0.0,
+                 completion_tokens: int = 500):
+        """
+        Args:
+            max_tokens: Prompt plus completion tokens per run (None for unlimited)
+            max_cost: Spend per run in dollars (None for unlimited)
+            prompt_cost_per_1k: Price per 1,000 prompt tokens
+            completion_cost_per_1k: Price per 1,000 completion tokens
+            completion_tokens: Completion tokens assumed per prompt before it runs (`llm.max_tokens`)
+        """
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.prompt_cost_per_1k = prompt_cost_per_1k
+        self.completion_cost_per_1k = completion_cost_per_1k
+        self.completion_tokens = completion_tokens
+        self.spent = {'tokens': 0, 'cost': 0.0}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['GenerationBudget']:
+        """
+        Build a budget from the `llm.budget` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[GenerationBudget]: Budget, or None if no limit is configured
+        """
+        llm_config = config.get('llm', {}) or {}
+        budget_config = llm_config.get('budget', {}) or {}
+        if budget_config.get('max_tokens') is None and budget_config.get('max_cost') is None:
+            return None
+
+        return cls(
+            max_tokens=budget_config.get('max_tokens'),
+            max_cost=budget_config.get('max_cost'),
+            prompt_cost_per_1k=budget_config.get('prompt_cost_per_1k', 0.0),
+            completion_cost_per_1k=budget_config.get('completion_cost_per_1k', 0.0),
+            completion_tokens=llm_config.get('max_tokens', 500)
+        )
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """
+        Price of a request.
+
+        Args:
+            prompt_tokens: Prompt tokens
+            completion_tokens: Completion tokens
+
+        Returns:
+            float: Cost in dollars
+        """
+        return (prompt_tokens * self.prompt_cost_per_1k + completion_tokens * self.completion_cost_per_1k) / 1000.0
+
+    def estimate(self, prompt: str) -> Tuple[int, float]:
+        """
+        Pre-flight estimate of what generating for a prompt uses at most.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Tuple[int, float]: Tokens and cost
+        """
+        prompt_tokens = estimate_prompt_tokens(prompt)
+        return prompt_tokens + self.completion_tokens, self.cost(prompt_tokens, self.completion_tokens)
+
+    def record(self, prompt_tokens: int, completion_tokens: int) -> None:
+        """
+        Record actual usage reported by the API.
+
+        Args:
+            prompt_tokens: Prompt tokens used
+            completion_tokens: Completion tokens used
+        """
+        self.spent['tokens'] += prompt_tokens + completion_tokens
+        self.spent['cost'] += self.cost(prompt_tokens, completion_tokens)
+
+    def settle(self, prompts: List[str], failed: List[str], prompt_tokens: int, completion_tokens: int) -> None:
+        """
+        Replace the estimates `plan` charged for a round of requests with their actual usage.
+        Requests without reported usage keep their estimate: failed or timed-out requests may
+        still be billed, and if the API reports no usage at all the whole round stays at its estimate.
+
+        Args:
+            prompts: Prompts admitted for the round
+            failed: Those of them that produced no completion
+            prompt_tokens: Prompt tokens the API reported for the round
+            completion_tokens: Completion tokens the API reported for the round
+        """
+        estimates = [self.estimate(prompt) for prompt in prompts]
+        self.spent['tokens'] -= sum(tokens for tokens, _ in estimates)
+        self.spent['cost'] -= sum(cost for _, cost in estimates)
+
+        if prompt_tokens + completion_tokens == 0:
+            unreported = prompts
+        else:
+            self.record(prompt_tokens, completion_tokens)
+            unreported = failed
+        for prompt in unreported:
+            tokens, cost = self.estimate(prompt)
+            self.spent['tokens'] += tokens
+            self.spent['cost'] += cost
+
+    def plan(self, requests: List[Tuple[int, str]]) -> Tuple[List[int], List[int]]:
+        """
+        Admit requests, in the given (priority) order, while their estimates fit the remaining budget.
+        A request that does not fit is deferred, but smaller ones after it may still be admitted.
+        The admitted estimates are charged to the budget until `settle` replaces them with actual usage.
+
+        Args:
+            requests: (request id, prompt) pairs, highest priority first
+
+        Returns:
+            Tuple[List[int], List[int]]: Admitted and deferred request ids, each in the given order
+        """
+        tokens = self.spent['tokens']
+        cost = self.spent['cost']
+
+        admitted = []
+        deferred = []
+        for request_id, prompt in requests:
+            request_tokens, request_cost = self.estimate(prompt)
+            if (self.max_tokens is not None and tokens + request_tokens > self.max_tokens) or \
+                    (self.max_cost is not None and cost + request_cost > self.max_cost):
+                deferred.append(request_id)
+                continue
+            tokens += request_tokens
+            cost += request_cost
+            admitted.append(request_id)
+
+        self.spent['tokens'] = tokens
+        self.spent['cost'] = cost
+        return admitted, deferred
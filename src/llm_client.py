@@ -0,0 +1,277 @@
+"""
+LLM Client Module for DuPont Tedlar Lead Generation
+
+This module generates outreach text through an OpenAI-compatible API.
+Prompts are grouped into batches and sent concurrently from an asyncio event
+loop, with a bounded number of requests in flight, per-request timeouts and
+jittered retries. Results come back in prompt order; prompts whose requests
+failed for good come back as None so the caller can fall back to templates.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from src.rate_limit import TokenBucket, backoff_delay
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# HTTP status codes that are worth retrying
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Rough characters per token of English text, for estimates made before a request
+CHARS_PER_TOKEN = 4
+
+def estimate_prompt_tokens(prompt: str) -> int:
+    """
+    Estimate the number of tokens in a prompt without a tokenizer.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        int: Estimated token count
+    """
+    return math.ceil(len(prompt) / CHARS_PER_TOKEN)
+
+class LLMError(Exception):
+    """Raised when an LLM request fails."""
+
+class RetryableLLMError(LLMError):
+    """Raised for transient LLM failures (rate limiting, server errors, timeouts)."""
+
+class AsyncLLMClient:
+    """Batched, concurrent client for an OpenAI-compatible completion API."""
+
+    def __init__(self, base_url: str, api_key: str = '', model: str = 'gpt-4', temperature: float = 0.7,
+                 max_tokens: int = 500, max_concurrency: int = 8, batch_size: int = 1,
+                 max_retries: int = 3, retry_base_delay: float = 0.5, timeout: float = 60.0,
+                 tokens_per_minute: Optional[float] = None):
+        """
+        Args:
+            base_url: API root; single prompts use POST {base_url}/v1/chat/completions and
+                      batches use POST {base_url}/v1/completions with a list of prompts
+            api_key: Bearer token for the API
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens generated per prompt
+            max_concurrency: Requests in flight at once
+            batch_size: Prompts per request
+            max_retries: Retries per request
+            retry_base_delay: Backoff delay scale in seconds
+            timeout: HTTP connect and read timeout per request in seconds
+            tokens_per_minute: Throttle requests to this many estimated tokens (prompt plus
+                               `max_tokens` per prompt) per minute (None for no limit)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.batch_size = max(1, int(batch_size))
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.timeout = timeout
+        self.token_bucket = TokenBucket(tokens_per_minute / 60.0, tokens_per_minute) if tokens_per_minute else None
+        self.usage = {'requests': 0, 'prompt_tokens': 0, 'cached_prompt_tokens': 0, 'completion_tokens': 0}
+        self._usage_lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['AsyncLLMClient']:
+        """
+        Build a client from the `llm` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[AsyncLLMClient]: Client, or None if no `base_url` is configured
+        """
+        llm_config = config.get('llm', {}) or {}
+        if not llm_config.get('base_url'):
+            return None
+
+        api_keys = config.get('api_keys', {}) or {}
+        return cls(
+            base_url=llm_config['base_url'],
+            api_key=api_keys.get(llm_config.get('api_key', 'openai'), ''),
+            model=llm_config.get('model', 'gpt-4'),
+            temperature=llm_config.get('temperature', 0.7),
+            max_tokens=llm_config.get('max_tokens', 500),
+            max_concurrency=llm_config.get('max_concurrency', 8),
+            batch_size=llm_config.get('batch_size', 1),
+            max_retries=llm_config.get('max_retries', 3),
+            timeout=llm_config.get('timeout', 60.0),
+            tokens_per_minute=llm_config.get('tokens_per_minute')
+        )
+
+    def _session(self) -> requests.Session:
+        """Return this thread's HTTP session (sessions are not shared across threads)."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            if self.api_key:
+                session.headers['Authorization'] = f"Bearer {self.api_key}"
+            self._local.session = session
+        return session
+
+    def _post(self, path: str, body: Dict) -> Dict:
+        """Send one blocking API request."""
+        try:
+            response = self._session().post(f"{self.base_url}{path}", json=body, timeout=self.timeout)
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            raise RetryableLLMError(str(e)) from e
+        except requests.RequestException as e:
+            # e.g. TooManyRedirects, InvalidURL: retrying will not help
+            raise LLMError(str(e)) from e
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise RetryableLLMError(f"HTTP {response.status_code}")
+        if not response.ok:
+            raise LLMError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+        try:
+            payload = response.json()
+        except ValueError as e:
+            raise LLMError(f"Invalid JSON response: {e}") from e
+        if not isinstance(payload, dict):
+            raise LLMError(f"Unexpected response payload {type(payload).__name__}")
+        usage = payload.get('usage') or {}
+        with self._usage_lock:
+            self.usage['requests'] += 1
+            self.usage['prompt_tokens'] += usage.get('prompt_tokens', 0)
+            # Prompt tokens served from the provider's prompt cache (billed at a discount)
+            self.usage['cached_prompt_tokens'] += (usage.get('prompt_tokens_details') or {}).get('cached_tokens', 0)
+            self.usage['completion_tokens'] += usage.get('completion_tokens', 0)
+        return payload
+
+    def complete_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Complete a batch of prompts in one blocking request.
+
+        Args:
+            prompts: Prompts to complete
+
+        Returns:
+            List[str]: Completions, in prompt order
+        """
+        settings = {'model': self.model, 'temperature': self.temperature, 'max_tokens': self.max_tokens}
+
+        if len(prompts) == 1:
+            payload = self._post('/v1/chat/completions', {
+                **settings, 'messages': [{'role': 'user', 'content': prompts[0]}]
+            })
+            return [payload['choices'][0]['message']['content']]
+
+        payload = self._post('/v1/completions', {**settings, 'prompt': prompts})
+        texts = [None] * len(prompts)
+        for choice in payload.get('choices', []):
+            texts[choice['index']] = choice['text']
+        if any(text is None for text in texts):
+            raise LLMError(f"Incomplete batch response: {texts.count(None)} of {len(prompts)} prompts missing")
+        return texts
+
+    def estimate_tokens(self, prompts: List[str]) -> int:
+        """
+        Upper estimate of the tokens a request uses: estimated prompt tokens plus `max_tokens` per prompt.
+
+        Args:
+            prompts: Prompts in the request
+
+        Returns:
+            int: Estimated tokens
+        """
+        return sum(estimate_prompt_tokens(prompt) for prompt in prompts) + self.max_tokens * len(prompts)
+
+    async def _throttle(self, tokens: int) -> None:
+        """Wait until the tokens-per-minute limit allows a request of the given size."""
+        if self.token_bucket is None:
+            return
+        # A request larger than a minute's allowance waits for a full bucket
+        tokens = min(tokens, self.token_bucket.capacity)
+        while not self.token_bucket.try_acquire(tokens):
+            await asyncio.sleep(self.token_bucket.wait_time(tokens))
+
+    async def _complete_batch_with_retries(self, prompts: List[str], semaphore: asyncio.Semaphore,
+                                           executor: ThreadPoolExecutor) -> List[Optional[str]]:
+        """Complete one batch, retrying transient failures; a failed batch yields None per prompt."""
+        loop = asyncio.get_running_loop()
+        tokens = self.estimate_tokens(prompts)
+
+        for attempt in range(self.max_retries + 1):
+            await self._throttle(tokens)
+            async with semaphore:
+                try:
+                    # The request's own HTTP timeout bounds the call; cancelling the await instead
+                    # would free the semaphore while the worker thread is still blocked on the socket
+                    return await loop.run_in_executor(executor, self.complete_batch, prompts)
+                except RetryableLLMError as e:
+                    error = str(e)
+                except (LLMError, AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
+                    # Non-retryable errors, including malformed responses
+                    logger.error(f"LLM request for {len(prompts)} prompts failed: {e!r}")
+                    return [None] * len(prompts)
+
+            if attempt < self.max_retries:
+                delay = backoff_delay(attempt, self.retry_base_delay)
+                logger.warning(f"LLM request failed ({error}); retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+        logger.error(f"LLM request for {len(prompts)} prompts failed after {self.max_retries} retries: {error}")
+        return [None] * len(prompts)
+
+    async def generate_async(self, prompts: List[str]) -> List[Optional[str]]:
+        """
+        Complete prompts concurrently in batches.
+
+        Args:
+            prompts: Prompts to complete
+
+        Returns:
+            List[Optional[str]]: Completions in prompt order (None where generation failed)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [prompts[start:start + self.batch_size] for start in range(0, len(prompts), self.batch_size)]
+
+        # Blocking requests run on a dedicated pool sized to the concurrency limit
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            results = await asyncio.gather(*(
+                self._complete_batch_with_retries(batch, semaphore, executor) for batch in batches
+            ))
+
+        return [text for batch in results for text in batch]
+
+    def generate(self, prompts: List[str]) -> List[Optional[str]]:
+        """
+        Complete prompts concurrently in batches (blocking wrapper around generate_async).
+
+        Callers already inside an event loop should await generate_async instead; if they call
+        this method, it runs the requests on a separate thread with its own loop and blocks
+        the calling loop until they finish.
+
+        Args:
+            prompts: Prompts to complete
+
+        Returns:
+            List[Optional[str]]: Completions in prompt order (None where generation failed)
+        """
+        if not prompts:
+            return []
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.generate_async(prompts))
+
+        # asyncio.run cannot be nested in a running loop
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, self.generate_async(prompts)).result()
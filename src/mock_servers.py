@@ -0,0 +1,444 @@
+"""
+Local Mock Servers for DuPont Tedlar Lead Generation
+
+This module provides local stand-ins for the external services the pipeline
+talks to, so the API clients can be exercised offline. Each server binds to
+127.0.0.1 on a free port, runs in a background thread and can be used as a
+context manager:
+
+    with MockEnrichmentServer() as server:
+        provider = HttpEnrichmentProvider('zoominfo', server.base_url, batch_size=25)
+
+MockSMTPServer speaks enough SMTP for smtplib (no TLS or authentication).
+"""
+
+import hashlib
+import json
+import logging
+import random
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def _stable_int(value: str) -> int:
+    """Deterministic integer derived from a string (unlike hash(), stable across processes)."""
+    return int(hashlib.md5(value.encode('utf-8')).hexdigest()[:8], 16)
+
+class _JsonRequestHandler(BaseHTTPRequestHandler):
+    """Request handler that dispatches JSON requests to the owning mock server."""
+
+    server_version = 'TedlarMock/1.0'
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.server.mock.__class__.__name__}: {format % args}")
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length) or b'null') if length else None
+
+        status, payload = self.server.mock.handle(method, self.path, body, dict(self.headers))
+
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+class MockHttpServer:
+    """Base class for local JSON HTTP stand-ins."""
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        """
+        Args:
+            latency: Seconds to sleep before answering each request
+            failure_rate: Fraction of requests answered with HTTP 503 to exercise retries
+            seed: Seed for the failure injection
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockHttpServer':
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _JsonRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"{self.__class__.__name__} listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'MockHttpServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(self, method: str, path: str, body, headers: Dict) -> Tuple[int, object]:
+        """Count the request, apply latency and failure injection, then route it."""
+        with self._lock:
+            self.request_count += 1
+            fail = self._random.random() < self.failure_rate
+
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            return 503, {'error': 'service unavailable'}
+
+        return self.route(method, path.split('?', 1)[0], body)
+
+    def route(self, method: str, path: str, body) -> Tuple[int, object]:
+        raise NotImplementedError
+
+class MockEnrichmentServer(MockHttpServer):
+    """Stand-in for a firmographic enrichment provider (ZoomInfo, Crunchbase, D&B, ...)."""
+
+    REVENUE_RANGES = ["$10M - $50M", "$50M - $100M", "$100M - $500M", "$500M - $1B", "$1B - $5B", "$5B - $10B", "$10B+"]
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0,
+                 unknown_domains: Optional[set] = None):
+        """
+        Args:
+            latency: Seconds to sleep before answering each request
+            failure_rate: Fraction of requests answered with HTTP 503
+            seed: Seed for the failure injection
+            unknown_domains: Domains the provider has no record of
+        """
+        super().__init__(latency, failure_rate, seed)
+        self.unknown_domains = set(unknown_domains or ())
+
+    def company_payload(self, domain: str) -> Dict:
+        """Deterministic firmographic payload for a domain."""
+        value = _stable_int(domain)
+        return {
+            'domain': domain,
+            'estimated_revenue': self.REVENUE_RANGES[value % len(self.REVENUE_RANGES)],
+            'employee_count': 200 + value % 20000,
+            'description': f"{domain} manufactures weather-resistant graphics with UV protection and protective films."
+        }
+
+    def route(self, method: str, path: str, body) -> Tuple[int, object]:
+        if method == 'POST' and path == '/companies/bulk':
+            domains = (body or {}).get('domains', [])
+            return 200, {'results': {
+                domain: self.company_payload(domain) for domain in domains if domain not in self.unknown_domains
+            }}
+
+        if method == 'GET' and path.startswith('/companies/'):
+            domain = path[len('/companies/'):]
+            if domain in self.unknown_domains:
+                return 404, {'error': 'not found'}
+            return 200, self.company_payload(domain)
+
+        return 404, {'error': f"no route for {method} {path}"}
+
+class MockPeopleSearchServer(MockHttpServer):
+    """Stand-in for a people-search provider (LinkedIn Sales Navigator, Clay)."""
+
+    FIRST_NAMES = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+                   "William", "Elizabeth", "David", "Susan", "Richard", "Jessica", "Joseph", "Sarah"]
+    LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+                  "Rodriguez", "Martinez", "Wilson", "Anderson", "Taylor", "Moore", "Jackson", "Lee"]
+    TITLES = ["VP of Product Development", "Director of Innovation", "Director of Procurement",
+              "Chief Technology Officer", "Head of R&D", "Product Manager", "Purchasing Manager",
+              "Technical Director", "Senior Product Manager", "VP Sales", "Marketing Manager",
+              "Production Supervisor", "Materials Engineer", "Director of Operations"]
+    DEPARTMENTS = ["Product Development", "R&D", "Innovation", "Procurement", "Technical", "Marketing"]
+    LOCATIONS = ["New York, NY", "Chicago, IL", "Boston, MA", "Austin, TX", "Seattle, WA", "Atlanta, GA"]
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0,
+                 employees_per_company: int = 12):
+        """
+        Args:
+            latency: Seconds to sleep before answering each request
+            failure_rate: Fraction of requests answered with HTTP 503
+            seed: Seed for the failure injection
+            employees_per_company: Employees known for every company
+        """
+        super().__init__(latency, failure_rate, seed)
+        self.employees_per_company = employees_per_company
+
+    def employees(self, domain: str) -> list:
+        """Deterministic employee list for a company domain."""
+        people = []
+        for i in range(self.employees_per_company):
+            value = _stable_int(f"{domain}:{i}")
+            first_name = self.FIRST_NAMES[value % len(self.FIRST_NAMES)]
+            last_name = self.LAST_NAMES[(value // 7) % len(self.LAST_NAMES)]
+            people.append({
+                'company_domain': domain,
+                'name': f"{first_name} {last_name}",
+                'title': self.TITLES[(value // 49) % len(self.TITLES)],
+                'department': self.DEPARTMENTS[(value // 11) % len(self.DEPARTMENTS)],
+                'location': self.LOCATIONS[(value // 13) % len(self.LOCATIONS)],
+                'years_at_company': 1 + value % 15,
+                'linkedin_url': f"https://www.linkedin.com/in/{first_name.lower()}-{last_name.lower()}-{value % 900000 + 100000}"
+            })
+        return people
+
+    @staticmethod
+    def _title_matches(title: str, wanted_titles: list) -> bool:
+        """Loose title filter: any significant word of a wanted title appears in the title."""
+        title_words = set(title.lower().split())
+        for wanted in wanted_titles:
+            if title_words & {word for word in wanted.lower().split() if len(word) > 3}:
+                return True
+        return not wanted_titles
+
+    def route(self, method: str, path: str, body) -> Tuple[int, object]:
+        if method != 'POST' or path != '/people/search':
+            return 404, {'error': f"no route for {method} {path}"}
+
+        body = body or {}
+        titles = body.get('titles', [])
+        limit = int(body.get('limit', 50))
+        offset = int(body.get('cursor') or 0)
+
+        matches = [
+            person
+            for domain in body.get('companies', [])
+            for person in self.employees(domain)
+            if self._title_matches(person['title'], titles)
+        ]
+
+        page = matches[offset:offset + limit]
+        next_offset = offset + limit
+        return 200, {
+            'results': page,
+            'next_cursor': str(next_offset) if next_offset < len(matches) else None
+        }
+
+class MockLLMServer(MockHttpServer):
+    """Stand-in for an OpenAI-compatible completion API."""
+
+    OPENINGS = ["I hope this note finds you well.", "I wanted to reach out with a quick idea.",
+                "Thanks for taking a moment to read this."]
+
+    @staticmethod
+    def _prompt_field(prompt: str, field: str) -> str:
+        """Value of a "Field: value" line in the prompt, or an empty string."""
+        for line in prompt.splitlines():
+            line = line.strip()
+            if line.startswith(f"{field}:"):
+                return line[len(field) + 1:].strip()
+        return ''
+
+    def completion(self, prompt: str) -> str:
+        """Deterministic outreach email for a prompt."""
+        company = self._prompt_field(prompt, 'Company') or 'your company'
+        recipient = self._prompt_field(prompt, 'Recipient') or 'there'
+        industry = self._prompt_field(prompt, 'Industry') or 'graphics'
+        interests = self._prompt_field(prompt, 'Interest areas')
+        opening = self.OPENINGS[_stable_int(prompt) % len(self.OPENINGS)]
+        focus = f" Your focus on {interests.split(',')[0].strip()} caught my attention." if interests else ''
+
+        return (
+            f"Subject: Longer-lasting {industry} for {company}\n\n"
+            f"Hi {recipient.split()[0]},\n\n"
+            f"{opening}{focus} DuPont Tedlar protective films add UV and weather resistance "
+            f"that keeps {company}'s graphics vivid for years longer.\n\n"
+            f"Would you be open to a 15-minute call next week?\n\n"
+            f"Best regards,\nSarah Miller\nDuPont Tedlar"
+        )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._seen_prefixes = set()
+
+    def _cached_length(self, prompt: str) -> int:
+        """
+        Length of the longest prompt prefix (ending at a paragraph break) seen in an
+        earlier request, imitating the prompt caching of hosted APIs.
+        """
+        boundaries = [i for i in range(len(prompt)) if prompt.startswith('\n\n', i)]
+        with self._lock:
+            cached = max((i for i in boundaries if prompt[:i] in self._seen_prefixes), default=0)
+            self._seen_prefixes.update(prompt[:i] for i in boundaries)
+        return cached
+
+    def _usage(self, prompts: list, completions: list) -> Dict:
+        prompt_tokens = sum(len(prompt) // 4 for prompt in prompts)
+        cached_tokens = sum(self._cached_length(prompt) // 4 for prompt in prompts)
+        completion_tokens = sum(len(text) // 4 for text in completions)
+        return {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+                'prompt_tokens_details': {'cached_tokens': cached_tokens}}
+
+    def route(self, method: str, path: str, body) -> Tuple[int, object]:
+        body = body or {}
+
+        if method == 'POST' and path == '/v1/chat/completions':
+            prompt = '\n'.join(message.get('content', '') for message in body.get('messages', []))
+            text = self.completion(prompt)
+            return 200, {
+                'model': body.get('model'),
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+                'usage': self._usage([prompt], [text])
+            }
+
+        if method == 'POST' and path == '/v1/completions':
+            prompts = body.get('prompt', [])
+            if isinstance(prompts, str):
+                prompts = [prompts]
+            texts = [self.completion(prompt) for prompt in prompts]
+            return 200, {
+                'model': body.get('model'),
+                'choices': [{'index': i, 'text': text, 'finish_reason': 'stop'} for i, text in enumerate(texts)],
+                'usage': self._usage(prompts, texts)
+            }
+
+        return 404, {'error': f"no route for {method} {path}"}
+
+class _SMTPRequestHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP session (EHLO, MAIL, RCPT, DATA, RSET, NOOP, QUIT) for the owning mock server."""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode('utf-8') + b'\r\n')
+
+    def handle(self) -> None:
+        mock = self.server.mock
+        with mock._lock:
+            mock.connection_count += 1
+
+        self._reply('220 localhost TedlarMock SMTP ready')
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command[:4].upper()
+
+            if verb in ('EHLO', 'HELO'):
+                self._reply('250-localhost' if verb == 'EHLO' else '250 localhost')
+                if verb == 'EHLO':
+                    self._reply('250 8BITMIME')
+            elif verb == 'MAIL':
+                sender, recipients = command[10:].strip().strip('<>'), []
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                recipient = command[8:].strip().strip('<>')
+                reply = mock.accept_recipient(recipient)
+                self._reply(reply)
+                if reply.startswith('250'):
+                    recipients.append(recipient)
+            elif verb == 'DATA':
+                if not recipients:
+                    self._reply('503 No valid recipients')
+                    continue
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                for data_line in iter(self.rfile.readline, b''):
+                    if data_line in (b'.\r\n', b'.\n'):
+                        break
+                    lines.append(data_line[1:] if data_line.startswith(b'..') else data_line)
+                mock.deliver(sender, recipients, b''.join(lines))
+                sender, recipients = None, []
+                self._reply('250 OK queued')
+            elif verb == 'RSET':
+                sender, recipients = None, []
+                self._reply('250 OK')
+            elif verb == 'NOOP':
+                self._reply('250 OK')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+class MockSMTPServer:
+    """
+    Stand-in for an SMTP relay. Delivered messages are kept in `messages`;
+    recipients at `reject_domains` are refused permanently (550) and a fraction
+    of the others temporarily (451) to exercise retries.
+    """
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int = 0,
+                 reject_domains: Optional[List[str]] = None):
+        """
+        Args:
+            latency: Seconds to sleep before accepting each message
+            failure_rate: Fraction of recipients answered with a temporary failure (451)
+            seed: Seed for the failure injection
+            reject_domains: Recipient domains refused with a permanent failure (550)
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.reject_domains = set(reject_domains or [])
+        self.messages = []
+        self.connection_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> 'MockSMTPServer':
+        self._server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _SMTPRequestHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"{self.__class__.__name__} listening on {self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'MockSMTPServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def accept_recipient(self, recipient: str) -> str:
+        """SMTP reply to RCPT TO, applying the rejection and failure injection."""
+        if recipient.rpartition('@')[2].lower() in self.reject_domains:
+            return '550 5.1.1 Mailbox unavailable'
+        with self._lock:
+            fail = self._random.random() < self.failure_rate
+        return '451 4.7.1 Try again later' if fail else '250 OK'
+
+    def deliver(self, sender: str, recipients: List[str], data: bytes) -> None:
+        """Keep a delivered message."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.messages.append({'from': sender, 'to': list(recipients), 'data': data.decode('utf-8', 'replace')})
@@ -0,0 +1,218 @@
+"""
+Record Types Module for DuPont Tedlar Lead Generation
+
+This module provides compact, slotted record classes for the data the
+pipeline produces: companies with their event participations and
+association memberships and their stakeholders. A slotted record stores its
+fields in fixed slots instead of a per-object dict with repeated key strings,
+which matters when holding hundreds of thousands of companies in memory.
+Records convert to and from the pipeline's JSON dicts; fields a record type
+does not know are kept in `extra`. The conversion functions are generated per
+record type, but converting still comes on top of the JSON encoding: a JSON
+round trip of records takes about 1.8 times as long as one of plain dicts
+(see `benchmarks.record_memory`), in exchange for about half the memory.
+
+The pipeline stages themselves still pass dicts between each other (and to
+the dashboard); records are for tools that load whole company files at once,
+such as `benchmarks.record_memory`.
+"""
+
+import logging
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, Dict, List, Mapping, Optional
+
+from src.normalized_data import load_companies_data, save_companies_data
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class _Record:
+    """JSON conversion shared by the record types."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> '_Record':
+        """
+        Build a record from a pipeline dict.
+
+        Args:
+            data: Record data as produced by the pipeline stages
+
+        Returns:
+            _Record: Record; unknown keys are kept in `extra`
+
+        Raises:
+            TypeError: If a required field is missing
+        """
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a pipeline dict.
+        Optional fields that were never set (None) are left out.
+
+        Returns:
+            Dict[str, Any]: Record data
+        """
+        raise NotImplementedError
+
+def _compile_converters(cls, nested: Dict[str, type]) -> Dict[str, Any]:
+    """
+    Generate from_dict/to_dict for one record type, unrolled over its fields.
+    A generic loop over the fields costs a lookup, a test and a call per field and
+    record; the generated functions pass each field to the dataclass constructor
+    positionally and read each slot by name.
+    """
+    record_fields = [field for field in fields(cls) if field.name != 'extra']
+    required = [field.name for field in record_fields
+                if field.default is MISSING and field.default_factory is MISSING]
+    optional = [field.name for field in record_fields if field.name not in required]
+    namespace = {'cls': cls, 'known': frozenset(field.name for field in record_fields)}
+    for key, nested_type in nested.items():
+        namespace[f"{key}_from_dict"] = nested_type.from_dict
+
+    def read(key: str) -> str:
+        lookup = f"data[{key!r}]" if key in required else f"get({key!r})"
+        if key in nested:
+            return f"(None if (value := {lookup}) is None else [{key}_from_dict(item) for item in value])"
+        return lookup
+
+    from_lines = [
+        "def from_dict(_cls, data):",
+        "    extra = None if data.keys() <= known else {k: v for k, v in data.items() if k not in known}",
+        "    get = data.get",
+        "    try:",
+        f"        return cls({', '.join(read(field.name) for field in record_fields)}, extra)",
+        "    except KeyError as e:",
+        "        raise TypeError(f'{cls.__name__} is missing required field {e.args[0]!r}') from None",
+    ]
+
+    def write(key: str) -> str:
+        return f"[item.to_dict() for item in value]" if key in nested else "value"
+
+    to_lines = ["def to_dict(self):", "    data = {}"]
+    for key in required:
+        if key in nested:
+            to_lines += [f"    value = self.{key}",
+                         f"    data[{key!r}] = None if value is None else {write(key)}"]
+        else:
+            to_lines.append(f"    data[{key!r}] = self.{key}")
+    for key in optional:
+        to_lines += [f"    value = self.{key}",
+                     "    if value is not None:",
+                     f"        data[{key!r}] = {write(key)}"]
+    to_lines += ["    if self.extra:", "        data.update(self.extra)", "    return data"]
+
+    source = "\n".join(from_lines) + "\n\n" + "\n".join(to_lines) + "\n"
+    exec(compile(source, f"<record {cls.__name__}>", 'exec'), namespace)
+    return namespace
+
+def _record_type(nested: Optional[Dict[str, type]] = None):
+    """Class decorator giving a slotted dataclass generated from_dict/to_dict (see _Record)."""
+    def decorate(cls):
+        namespace = _compile_converters(cls, nested or {})
+        from_dict, to_dict = namespace['from_dict'], namespace['to_dict']
+        from_dict.__doc__ = _Record.from_dict.__doc__
+        to_dict.__doc__ = _Record.to_dict.__doc__
+        cls.from_dict = classmethod(from_dict)
+        cls.to_dict = to_dict
+        return cls
+    return decorate
+
+@_record_type()
+@dataclass(slots=True)
+class Event(_Record):
+    """A company's participation in an industry event."""
+
+    event_name: str
+    event_date: str
+    booth_number: str
+    sponsorship: bool
+    extra: Optional[Dict[str, Any]] = None
+
+@_record_type()
+@dataclass(slots=True)
+class Association(_Record):
+    """A company's membership in an industry association."""
+
+    association_name: str
+    membership_level: str
+    years_member: int
+    committee_participation: bool
+    extra: Optional[Dict[str, Any]] = None
+
+@_record_type()
+@dataclass(slots=True)
+class Stakeholder(_Record):
+    """A decision-maker at a company, with evaluation and outreach fields once those stages ran."""
+
+    name: str
+    title: str
+    department: str
+    years_at_company: Optional[int]
+    location: str
+    linkedin_url: str
+    relevance_score: Optional[float] = None
+    email: Optional[str] = None
+    email_confidence: Optional[float] = None
+    email_verified: Optional[bool] = None
+    source: Optional[str] = None
+    identity_id: Optional[str] = None
+    also_listed_under: Optional[List[str]] = None
+    title_match_score: Optional[float] = None
+    seniority_score: Optional[float] = None
+    overall_score: Optional[float] = None
+    interest_areas: Optional[List[str]] = None
+    outreach_message: Optional[str] = None
+    subject_line: Optional[str] = None
+    outreach: Optional[Dict[str, Any]] = None
+    extra: Optional[Dict[str, Any]] = None
+
+@_record_type(nested={'events': Event, 'associations': Association, 'stakeholders': Stakeholder})
+@dataclass(slots=True)
+class Company(_Record):
+    """A company, with enrichment, qualification and stakeholder fields once those stages ran."""
+
+    name: str
+    website: str
+    industry: str
+    events: Optional[List[Event]] = None
+    associations: Optional[List[Association]] = None
+    estimated_revenue: Optional[str] = None
+    employee_count: Optional[int] = None
+    enrichment_skipped: Optional[bool] = None
+    keywords: Optional[List[str]] = None
+    industry_score: Optional[float] = None
+    size_score: Optional[float] = None
+    keyword_score: Optional[float] = None
+    engagement_score: Optional[float] = None
+    overall_score: Optional[float] = None
+    is_qualified: Optional[bool] = None
+    qualification_rationale: Optional[str] = None
+    stakeholders: Optional[List[Stakeholder]] = None
+    outreach_params: Optional[Dict[str, str]] = None
+    extra: Optional[Dict[str, Any]] = None
+
+def load_companies(input_file: str) -> List[Company]:
+    """
+    Load companies from any pipeline output file as records.
+
+    Args:
+        input_file: Path to a companies, qualified leads, stakeholders or outreach file
+
+    Returns:
+        List[Company]: Company records
+    """
+    return [Company.from_dict(company) for company in load_companies_data(input_file)]
+
+def save_companies(companies: List[Company], output_file: str) -> None:
+    """
+    Save company records as a normalized company file.
+
+    Args:
+        companies: Company records
+        output_file: Path to save the data
+    """
+    save_companies_data((company.to_dict() for company in companies), output_file)
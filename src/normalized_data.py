@@ -0,0 +1,305 @@
+"""
+Normalized Data Module for DuPont Tedlar Lead Generation
+
+Company files repeat the same event and association details (names, dates)
+in every company that attends or belongs to them. This module stores them
+once: events and associations go into tables with integer ids, and each
+company keeps compact membership columns (ids plus per-membership
+attributes such as booth number, sponsorship or membership level).
+
+On disk a normalized company file is an envelope:
+
+    {"format": "tedlar-companies", "version": 2,
+     "events": [{"event_name": ..., "event_date": ...}, ...],
+     "associations": [{"association_name": ...}, ...],
+     "companies": [{"name": ..., "event_memberships": {"ids": [0, 3], "booth_number": [...], ...},
+                    "association_memberships": {"ids": [...], "membership_level": [...], ...}, ...}]}
+
+Version 2 files may also carry an `outreach` section with the template texts
+and generated texts that stakeholders' outreach references point to (see
+src/outreach_store.py); subject lines and messages are rendered again when a
+company is expanded.
+
+Loaders accept both this envelope and the original list of companies.
+"""
+
+import logging
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.outreach_store import OutreachStore
+from src.records import flatten
+from src.utils import load_json, save_json
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FILE_FORMAT = 'tedlar-companies'
+FILE_VERSION = 2  # 2: optional `outreach` section
+
+# (company field, membership field, table name, fields identifying a table entry)
+MEMBERSHIPS = [
+    ('events', 'event_memberships', 'events', ('event_name', 'event_date')),
+    ('associations', 'association_memberships', 'associations', ('association_name',)),
+]
+
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated values share one object in memory."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+class ReferenceTable:
+    """Entities (events or associations) shared by many companies, addressed by integer id."""
+
+    def __init__(self, key_fields: Tuple[str, ...], rows: Optional[List[Dict]] = None):
+        """
+        Args:
+            key_fields: Fields identifying an entry (e.g. event name and date)
+            rows: Existing entries, in id order
+        """
+        self.key_fields = key_fields
+        self.rows = []
+        self._ids = {}
+        for row in rows or []:
+            self.add(row)
+
+    def add(self, entry: Mapping) -> int:
+        """
+        Get the id of an entry, adding it to the table if it is new.
+
+        Args:
+            entry: Mapping with (at least) the key fields
+
+        Returns:
+            int: Entry id
+        """
+        key = tuple(_intern(entry.get(field)) for field in self.key_fields)
+        entry_id = self._ids.get(key)
+        if entry_id is None:
+            entry_id = self._ids[key] = len(self.rows)
+            self.rows.append(dict(zip(self.key_fields, key)))
+        return entry_id
+
+    def ids_where(self, field: str, values: Iterable) -> Set[int]:
+        """
+        Find the ids of entries whose field has one of the given values.
+
+        Args:
+            field: Key field (e.g. "event_name")
+            values: Accepted values
+
+        Returns:
+            Set[int]: Matching ids
+        """
+        values = set(values)
+        return {entry_id for entry_id, row in enumerate(self.rows) if row.get(field) in values}
+
+    def __getitem__(self, entry_id: int) -> Dict:
+        return self.rows[entry_id]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+class NormalizedCompanies:
+    """Companies with their event and association memberships stored as ids into shared tables."""
+
+    def __init__(self, tables: Optional[Dict[str, ReferenceTable]] = None, companies: Optional[List[Dict]] = None,
+                 outreach: Optional[OutreachStore] = None):
+        """
+        Args:
+            tables: Reference tables by name ("events", "associations")
+            companies: Normalized company records
+            outreach: Templates and texts referenced by stakeholders' stored outreach
+        """
+        self.tables = tables or {table: ReferenceTable(key_fields) for _, _, table, key_fields in MEMBERSHIPS}
+        self.companies = companies or []
+        self.outreach = outreach if outreach is not None else OutreachStore()
+
+    @classmethod
+    def from_companies(cls, companies: Iterable[Mapping], outreach: Optional[OutreachStore] = None) -> 'NormalizedCompanies':
+        """
+        Normalize companies in the pipeline's dict shape.
+
+        Args:
+            companies: Companies with `events` and `associations` lists
+            outreach: Templates used to render the stakeholders' outreach; rendered text
+                      that cannot be stored as a template reference is stored as a blob
+
+        Returns:
+            NormalizedCompanies: Normalized companies
+        """
+        normalized = cls(outreach=outreach)
+        normalized.companies = [normalized.add_company(company) for company in companies]
+        return normalized
+
+    def add_company(self, company: Mapping) -> Dict:
+        """
+        Normalize one company, adding its events and associations to the tables.
+        Membership fields take the place of `events` and `associations` in key order.
+
+        Args:
+            company: Company in the pipeline's dict shape
+
+        Returns:
+            Dict: Normalized company record
+        """
+        record = {}
+        for key, value in flatten(company).items():
+            if key == 'stakeholders' and value:
+                lead_params = company.get('outreach_params')
+                record[key] = [self.outreach.compact(stakeholder, lead_params) for stakeholder in value]
+                continue
+            membership = next((m for m in MEMBERSHIPS if m[0] == key), None)
+            if membership is None:
+                record[key] = value
+                continue
+
+            _, membership_field, table, key_fields = membership
+            columns = {'ids': []}
+            for position, entry in enumerate(value or []):
+                columns['ids'].append(self.tables[table].add(entry))
+                for field in entry:
+                    if field not in key_fields:
+                        # Columns start when first seen; earlier memberships lacked the attribute
+                        columns.setdefault(field, [None] * position)
+                for field, column in columns.items():
+                    if field != 'ids':
+                        column.append(entry.get(field))
+            record[membership_field] = columns
+        return record
+
+    def expand(self, record: Mapping) -> Dict:
+        """
+        Rebuild a company in the pipeline's dict shape from a normalized record,
+        rendering its stakeholders' stored outreach.
+
+        Args:
+            record: Normalized company record
+
+        Returns:
+            Dict: Company with `events` and `associations` lists
+        """
+        company = {}
+        for key, value in record.items():
+            if key == 'stakeholders' and value:
+                lead_params = record.get('outreach_params')
+                company[key] = [self.outreach.expand(stakeholder, lead_params) for stakeholder in value]
+                continue
+            membership = next((m for m in MEMBERSHIPS if m[1] == key), None)
+            if membership is None:
+                company[key] = value
+                continue
+
+            company_field, _, table, _ = membership
+            rows = self.tables[table]
+            attributes = [(field, column) for field, column in value.items() if field != 'ids']
+            entries = []
+            for position, entry_id in enumerate(value['ids']):
+                entry = dict(rows[entry_id])
+                for field, column in attributes:
+                    if column[position] is not None:
+                        entry[field] = column[position]
+                entries.append(entry)
+            company[company_field] = entries
+        return company
+
+    def expand_all(self) -> List[Dict]:
+        """Rebuild every company in the pipeline's dict shape."""
+        return [self.expand(record) for record in self.companies]
+
+    def member_ids(self, record: Mapping, table: str) -> List[int]:
+        """
+        Get the ids of a company's events or associations.
+
+        Args:
+            record: Normalized company record
+            table: "events" or "associations"
+
+        Returns:
+            List[int]: Entry ids
+        """
+        membership_field = next(m[1] for m in MEMBERSHIPS if m[2] == table)
+        return (record.get(membership_field) or {}).get('ids', [])
+
+    def to_envelope(self) -> Dict:
+        """Build the on-disk representation."""
+        envelope = {'format': FILE_FORMAT, 'version': FILE_VERSION}
+        for _, _, table, _ in MEMBERSHIPS:
+            envelope[table] = self.tables[table].rows
+        if self.outreach:
+            envelope['outreach'] = self.outreach.to_dict()
+        envelope['companies'] = self.companies
+        return envelope
+
+    @classmethod
+    def from_envelope(cls, envelope: Mapping) -> 'NormalizedCompanies':
+        """
+        Read the on-disk representation, interning table strings and membership attributes.
+
+        Args:
+            envelope: Parsed normalized company file
+
+        Returns:
+            NormalizedCompanies: Normalized companies
+        """
+        if envelope.get('version', FILE_VERSION) > FILE_VERSION:
+            raise ValueError(f"Unsupported company file version: {envelope.get('version')}")
+
+        tables = {
+            table: ReferenceTable(key_fields, envelope.get(table, []))
+            for _, _, table, key_fields in MEMBERSHIPS
+        }
+        companies = envelope.get('companies', [])
+        for record in companies:
+            for _, membership_field, _, _ in MEMBERSHIPS:
+                for field, column in (record.get(membership_field) or {}).items():
+                    if field != 'ids':
+                        column[:] = [_intern(value) for value in column]
+        return cls(tables, companies, OutreachStore.from_dict(envelope.get('outreach')))
+
+def is_normalized(data: Any) -> bool:
+    """Whether parsed file data is a normalized company envelope."""
+    return isinstance(data, Mapping) and data.get('format') == FILE_FORMAT
+
+def load_normalized_companies(input_file: str) -> NormalizedCompanies:
+    """
+    Load a company file in normalized form, normalizing a legacy list on the fly.
+
+    Args:
+        input_file: Path to a companies, qualified leads, stakeholders or outreach file
+
+    Returns:
+        NormalizedCompanies: Normalized companies
+    """
+    data = load_json(input_file)
+    if is_normalized(data):
+        return NormalizedCompanies.from_envelope(data)
+    return NormalizedCompanies.from_companies(data or [])
+
+def load_companies_data(input_file: str) -> List[Dict]:
+    """
+    Load a company file in the pipeline's dict shape.
+    Accepts both normalized envelopes and legacy lists of companies.
+
+    Args:
+        input_file: Path to a companies, qualified leads, stakeholders or outreach file
+
+    Returns:
+        List[Dict]: Companies with `events` and `associations` lists
+    """
+    data = load_json(input_file)
+    if is_normalized(data):
+        return NormalizedCompanies.from_envelope(data).expand_all()
+    return data
+
+def save_companies_data(companies: Iterable[Mapping], output_file: str, outreach: Optional[OutreachStore] = None) -> None:
+    """
+    Save companies as a normalized company file, written as compact JSON.
+
+    Args:
+        companies: Companies in the pipeline's dict shape
+        output_file: Path to save the data
+        outreach: Templates used to render the stakeholders' outreach
+    """
+    save_json(NormalizedCompanies.from_companies(companies, outreach).to_envelope(), output_file, indent=None)
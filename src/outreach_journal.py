@@ -0,0 +1,121 @@
+"""
+Outreach Journal Module for DuPont Tedlar Lead Generation
+
+This module records personalization results while a run is in progress.
+Each lead is appended to a JSON Lines file as soon as its outreach is
+generated and flushed to disk with fsync, so a crash loses at most the lead
+being written, a later run can resume where the previous one stopped, and
+the dashboard can show the leads finished so far. The journal is removed
+once the complete outreach file has been saved.
+"""
+
+import json
+import logging
+import os
+from typing import Dict, List, Mapping, Optional
+
+from src.records import json_default
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class OutreachJournal:
+    """Append-only, per-lead log of generated outreach."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: JSON Lines file for the journal
+        """
+        self.path = path
+        self._file = None
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['OutreachJournal']:
+        """
+        Build a journal from the `personalization.journal` setting.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[OutreachJournal]: Journal, or None if journaling is disabled
+        """
+        path = (config.get('personalization', {}) or {}).get('journal')
+        return cls(path) if path else None
+
+    def read(self) -> List[Dict]:
+        """
+        Read the leads recorded so far. A line cut short by a crash or by a
+        write still in progress is skipped.
+
+        Returns:
+            List[Dict]: Leads in the order they were recorded
+        """
+        return read_journal(self.path)
+
+    def open(self, resume: bool = False) -> None:
+        """
+        Open the journal for appending.
+
+        Args:
+            resume: Keep the leads already recorded (otherwise the journal starts empty)
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume and os.path.exists(self.path):
+            # Drop a partial last line so the next record starts on a line of its own
+            with open(self.path, 'rb+') as f:
+                content = f.read()
+                if content and not content.endswith(b'\n'):
+                    f.truncate(content.rfind(b'\n') + 1)
+
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+
+    def append(self, lead: Mapping) -> None:
+        """
+        Record a lead durably.
+
+        Args:
+            lead: Lead with its stakeholders' outreach
+        """
+        self._file.write(json.dumps(lead, default=json_default) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal (after the complete output has been saved)."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def read_journal(path: str) -> List[Dict]:
+    """
+    Read the leads recorded in an outreach journal.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        List[Dict]: Leads in the order they were recorded (empty if there is no journal)
+    """
+    if not os.path.exists(path):
+        return []
+
+    leads = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                leads.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping incomplete journal entry in {path}")
+    return leads
@@ -0,0 +1,180 @@
+"""
+Outreach Store Module for DuPont Tedlar Lead Generation
+
+Outreach files used to hold a fully rendered subject line and message for
+every stakeholder, although most of each message is shared template text.
+This module stores outreach compactly instead: template-rendered parts are
+saved as the template id plus the few parameters that differ between
+stakeholders (company-level parameters are kept once per company in
+`outreach_params`), and other text (LLM generations, edited messages) is
+saved once in a content-addressed blob table, keyed by its SHA-256 hash.
+
+A stored stakeholder carries an `outreach` reference such as
+
+    {"subject_template": "solutions", "message_template": "sarah-durability",
+     "params": {"stakeholder_name": ..., "stakeholder_title": ...}}
+    {"subject_blob": "<sha256>", "message_blob": "<sha256>"}
+
+and its `subject_line` and `outreach_message` are rendered again on load.
+"""
+
+import hashlib
+import logging
+from typing import Dict, Mapping, Optional
+
+from src.records import flatten
+from src.templates import CompiledTemplate
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# (stakeholder field, template kind)
+OUTREACH_PARTS = [('outreach_message', 'message'), ('subject_line', 'subject')]
+
+class OutreachStore:
+    """Template texts and generated texts referenced by compactly stored outreach."""
+
+    def __init__(self, templates: Optional[Dict[str, Dict[str, str]]] = None, blobs: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            templates: Template texts by kind ("message", "subject") and template id
+            blobs: Texts by SHA-256 hex digest
+        """
+        self.templates = {kind: dict((templates or {}).get(kind, {})) for _, kind in OUTREACH_PARTS}
+        self.blobs = blobs or {}
+        self._compiled = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.blobs) or any(self.templates.values())
+
+    def add_template(self, kind: str, template: CompiledTemplate) -> None:
+        """
+        Record a template used to render outreach.
+
+        Args:
+            kind: "message" or "subject"
+            template: Compiled template
+        """
+        if template.id not in self.templates[kind]:
+            self.templates[kind][template.id] = template.text
+            self._compiled[kind, template.id] = template
+
+    def add_blob(self, text: str) -> str:
+        """
+        Store a text once.
+
+        Args:
+            text: Text to store
+
+        Returns:
+            str: Content address (SHA-256 hex digest)
+        """
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        self.blobs.setdefault(digest, text)
+        return digest
+
+    def _template(self, kind: str, template_id: str) -> Optional[CompiledTemplate]:
+        """Compiled template by kind and id, or None if the store does not have it."""
+        template = self._compiled.get((kind, template_id))
+        if template is None and template_id in self.templates[kind]:
+            template = self._compiled[kind, template_id] = CompiledTemplate(template_id, self.templates[kind][template_id])
+        return template
+
+    def compact(self, stakeholder: Mapping, lead_params: Optional[Mapping] = None) -> Mapping:
+        """
+        Replace a stakeholder's rendered outreach with a reference.
+        A template reference is only kept if re-rendering it reproduces the text exactly;
+        anything else is stored as a blob.
+
+        Args:
+            stakeholder: Stakeholder with `subject_line`/`outreach_message` and, if they were
+                         rendered from templates, an `outreach` record of the templates and parameters
+            lead_params: The company's `outreach_params`
+
+        Returns:
+            Mapping: Stakeholder record to store (unchanged if it has no outreach)
+        """
+        if not any(field in stakeholder for field, _ in OUTREACH_PARTS):
+            return stakeholder
+
+        provenance = stakeholder.get('outreach') or {}
+        params = {**(lead_params or {}), **provenance.get('params', {})}
+        reference = {}
+        for field, kind in OUTREACH_PARTS:
+            text = stakeholder.get(field)
+            if text is None:
+                continue
+            template = self._template(kind, provenance.get(f"{kind}_template"))
+            try:
+                reproducible = template is not None and template.render(params) == text
+            except KeyError:
+                reproducible = False
+            if reproducible:
+                reference[f"{kind}_template"] = template.id
+            else:
+                reference[f"{kind}_blob"] = self.add_blob(text)
+
+        if provenance.get('params') and any(key.endswith('_template') for key in reference):
+            reference['params'] = provenance['params']
+
+        record = flatten(stakeholder)
+        for key in ('outreach', 'outreach_message', 'subject_line'):
+            record.pop(key, None)
+        record['outreach'] = reference
+        return record
+
+    def expand(self, record: Mapping, lead_params: Optional[Mapping] = None) -> Mapping:
+        """
+        Render a stored stakeholder's outreach again.
+
+        Args:
+            record: Stakeholder record as stored
+            lead_params: The company's `outreach_params`
+
+        Returns:
+            Mapping: Stakeholder with `outreach_message` and `subject_line`; the `outreach`
+                     record keeps the template ids and parameters (unchanged if the record
+                     has no stored outreach)
+        """
+        reference = record.get('outreach')
+        if not reference or not any(key.endswith(('_template', '_blob')) for key in reference):
+            return record
+
+        stakeholder = {key: value for key, value in record.items() if key != 'outreach'}
+        params = None
+        for field, kind in OUTREACH_PARTS:
+            blob = reference.get(f"{kind}_blob")
+            template_id = reference.get(f"{kind}_template")
+            if blob is not None:
+                stakeholder[field] = self.blobs[blob]
+            elif template_id is not None:
+                if params is None:
+                    params = {**(lead_params or {}), **reference.get('params', {})}
+                template = self._template(kind, template_id)
+                if template is None:
+                    raise ValueError(f"Outreach references unknown {kind} template {template_id!r}")
+                stakeholder[field] = template.render(params)
+
+        provenance = {key: value for key, value in reference.items() if not key.endswith('_blob')}
+        if provenance:
+            stakeholder['outreach'] = provenance
+        return stakeholder
+
+    def to_dict(self) -> Dict:
+        """Build the on-disk representation."""
+        return {'templates': self.templates, 'blobs': self.blobs}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Mapping]) -> 'OutreachStore':
+        """
+        Read the on-disk representation.
+
+        Args:
+            data: Parsed `outreach` section of a company file (None if the file has none)
+
+        Returns:
+            OutreachStore: Store
+        """
+        data = data or {}
+        return cls(data.get('templates'), data.get('blobs'))
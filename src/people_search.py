@@ -0,0 +1,242 @@
+"""
+People Search Client Module for DuPont Tedlar Lead Generation
+
+This module queries people-search providers (LinkedIn Sales Navigator, Clay)
+for decision-makers at qualified companies. Companies are searched in batched
+multi-company queries filtered by the configured decision-maker titles, result
+pages are followed by cursor, and batches run concurrently behind one shared
+rate limiter.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import requests
+
+from src.rate_limit import TokenBucket, retry_with_jitter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# HTTP status codes that are worth retrying
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class PeopleSearchError(Exception):
+    """Raised when a people-search request fails."""
+
+class RetryablePeopleSearchError(PeopleSearchError):
+    """Raised for transient people-search failures (rate limiting, server errors, timeouts)."""
+
+class PeopleSearchProvider:
+    """People-search provider reached over a JSON HTTP API."""
+
+    def __init__(self, name: str, base_url: str, api_key: str = '', batch_size: int = 10,
+                 page_size: int = 50, timeout: float = 15.0):
+        """
+        Args:
+            name: Provider name
+            base_url: API root; searches use POST {base_url}/people/search
+            api_key: Bearer token for the provider
+            batch_size: Companies per search query
+            page_size: Results requested per page
+            timeout: Per-request timeout in seconds
+        """
+        self.name = name
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.batch_size = max(1, int(batch_size))
+        self.page_size = max(1, int(page_size))
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """Return this thread's HTTP session (sessions are not shared across threads)."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            if self.api_key:
+                session.headers['Authorization'] = f"Bearer {self.api_key}"
+            self._local.session = session
+        return session
+
+    def search_page(self, domains: List[str], titles: List[str], cursor: Optional[str] = None) -> Dict:
+        """
+        Fetch one page of people at the given companies.
+
+        Args:
+            domains: Canonical company domains
+            titles: Decision-maker titles to filter by
+            cursor: Cursor from the previous page (None for the first page)
+
+        Returns:
+            Dict: `results` (people, each with a `company_domain`) and `next_cursor`
+        """
+        body = {'companies': domains, 'titles': titles, 'limit': self.page_size}
+        if cursor:
+            body['cursor'] = cursor
+
+        try:
+            response = self._session().post(f"{self.base_url}/people/search", json=body, timeout=self.timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise RetryablePeopleSearchError(f"{self.name}: {e}") from e
+        except requests.RequestException as e:
+            # e.g. InvalidURL, TooManyRedirects: retrying will not help
+            raise PeopleSearchError(f"{self.name}: {e}") from e
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise RetryablePeopleSearchError(f"{self.name}: HTTP {response.status_code}")
+        if not response.ok:
+            raise PeopleSearchError(f"{self.name}: HTTP {response.status_code}")
+
+        try:
+            page = response.json()
+        except ValueError as e:
+            raise PeopleSearchError(f"{self.name}: invalid JSON response: {e}") from e
+        if not isinstance(page, dict):
+            raise PeopleSearchError(f"{self.name}: unexpected response payload {type(page).__name__}")
+        return page
+
+class PeopleSearchClient:
+    """Runs batched, paginated people searches concurrently behind a shared rate limit."""
+
+    def __init__(self, providers: List[PeopleSearchProvider], titles: List[str],
+                 rate_limiter: Optional[TokenBucket] = None, max_workers: int = 8,
+                 max_retries: int = 3, retry_base_delay: float = 0.5):
+        """
+        Args:
+            providers: Providers to query, in order of preference
+            titles: Decision-maker titles to filter by
+            rate_limiter: Limiter shared by every request of every provider
+            max_workers: Concurrent search batches
+            max_retries: Retries per page request
+            retry_base_delay: Backoff delay scale in seconds
+        """
+        self.providers = providers
+        self.titles = titles
+        self.rate_limiter = rate_limiter or TokenBucket(5.0)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['PeopleSearchClient']:
+        """
+        Build a client from the `people_search` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[PeopleSearchClient]: Client, or None if no providers are configured
+        """
+        search_config = config.get('people_search', {}) or {}
+        api_keys = config.get('api_keys', {}) or {}
+
+        providers = []
+        for provider_config in search_config.get('providers', []) or []:
+            providers.append(PeopleSearchProvider(
+                name=provider_config['name'],
+                base_url=provider_config['base_url'],
+                api_key=api_keys.get(provider_config.get('api_key', provider_config['name']), ''),
+                batch_size=provider_config.get('batch_size', 10),
+                page_size=provider_config.get('page_size', 50),
+                timeout=provider_config.get('timeout', 15.0)
+            ))
+
+        if not providers:
+            return None
+
+        return cls(
+            providers,
+            titles=config['icp_criteria']['decision_makers']['titles'],
+            rate_limiter=TokenBucket(search_config.get('rate_per_second', 5.0), search_config.get('burst')),
+            max_workers=search_config.get('max_workers', 8),
+            max_retries=search_config.get('max_retries', 3)
+        )
+
+    def _search_batch(self, provider: PeopleSearchProvider, domains: List[str]) -> List[Dict]:
+        """Follow the result cursor of one batched query to the last page."""
+        people = []
+        cursor = None
+        seen_cursors = set()
+
+        while True:
+            def fetch_page(cursor=cursor) -> Dict:
+                self.rate_limiter.acquire()
+                return provider.search_page(domains, self.titles, cursor)
+
+            page = retry_with_jitter(
+                fetch_page,
+                max_retries=self.max_retries,
+                base_delay=self.retry_base_delay,
+                retry_on=(RetryablePeopleSearchError,),
+                description=f"{provider.name} people search for {len(domains)} companies"
+            )
+
+            people.extend(page.get('results', []))
+            cursor = page.get('next_cursor')
+            if not cursor:
+                return people
+            if cursor in seen_cursors:
+                logger.warning(f"{provider.name} returned cursor {cursor!r} again; stopping pagination")
+                return people
+            seen_cursors.add(cursor)
+
+    def search(self, domains: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Find decision-makers at every company with every provider.
+
+        Args:
+            domains: Canonical company domains, most urgent first
+
+        Returns:
+            Dict[str, List[Dict]]: People per domain, deduplicated by LinkedIn URL
+        """
+        unique_domains = list(dict.fromkeys(d for d in domains if d))
+        results = {domain: [] for domain in unique_domains}
+        seen = {domain: set() for domain in unique_domains}
+
+        jobs = [
+            (start, provider, unique_domains[start:start + provider.batch_size])
+            for provider in self.providers
+            for start in range(0, len(unique_domains), provider.batch_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Domains early in the list (the most urgent leads) are searched first with every provider
+            submitted = [None] * len(jobs)
+            for i in sorted(range(len(jobs)), key=lambda i: jobs[i][0]):
+                _, provider, batch = jobs[i]
+                submitted[i] = executor.submit(self._search_batch, provider, batch)
+            futures = {future: (provider, batch) for future, (_, provider, batch) in zip(submitted, jobs)}
+
+            # Collect per batch so results can be merged in provider order
+            batch_results = {}
+            for future in as_completed(futures):
+                provider, batch = futures[future]
+                try:
+                    batch_results[future] = future.result()
+                except PeopleSearchError as e:
+                    logger.error(f"People search batch failed: {e}")
+
+        failed = len(futures) - len(batch_results)
+        if failed:
+            logger.warning(f"{failed} of {len(futures)} people search batches failed")
+
+        for future in futures:
+            provider = futures[future][0]
+            for person in batch_results.get(future, []):
+                domain = person.get('company_domain')
+                if domain not in results:
+                    continue
+
+                key = person.get('linkedin_url') or (person.get('name', '').lower(), person.get('title', '').lower())
+                if key in seen[domain]:
+                    continue
+                seen[domain].add(key)
+                results[domain].append(dict(person, source=provider.name))
+
+        return results
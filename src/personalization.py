@@ -13,110 +13,372 @@ from typing import Dict, List, Optional, Tuple, Any
 import pandas as pd
 from tqdm import tqdm
 
-from src.utils import load_config, load_json, save_json
+from src.generation_cache import GenerationCache
+from src.llm_budget import GenerationBudget
+from src.llm_client import AsyncLLMClient
+from src.normalized_data import load_companies_data, save_companies_data
+from src.outreach_journal import OutreachJournal
+from src.outreach_store import OutreachStore
+from src.records import annotate
+from src.scheduling import DeadlineScheduler
+from src.suppression import SuppressionList
+from src.templates import TemplateRegistry, stable_hash
+from src.utils import load_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Leading part of every LLM prompt
+PROMPT_INSTRUCTIONS = """Generate a personalized email outreach message from a DuPont Tedlar sales representative to a potential lead.
+
+Keep the message brief (3-4 paragraphs), personalized, and focused on how DuPont Tedlar's protective films
+can benefit their signage and graphics applications with superior weather resistance, UV protection, and durability.
+
+Mention any relevant events or associations they're part of. Be conversational, not pushy.
+Start with a line of the form "Subject: <subject line>", followed by a blank line and the message.
+The company and the recipient are described below."""
+
 class PersonalizationEngine:
     """Generates personalized outreach messages for stakeholders."""
     
-    def __init__(self, config: Dict, leads_with_stakeholders: List[Dict]):
+    def __init__(self, config: Dict, leads_with_stakeholders: List[Dict], bypass_cache: Optional[bool] = None,
+                 resume: Optional[bool] = None):
         self.config = config
         self.leads_with_stakeholders = leads_with_stakeholders
         
-        # In a production environment, this would use the OpenAI API
-        # For the prototype, we'll use templates with variable substitution
+        # Messages come from the configured LLM API when there is one,
+        # otherwise (and as a fallback) from templates with variable substitution
         self.llm_config = config.get('llm', {})
+        self.llm_client = AsyncLLMClient.from_config(config)
+        self.generation_cache = GenerationCache.from_config(config, bypass=bypass_cache) if self.llm_client else None
+        self.budget = GenerationBudget.from_config(config) if self.llm_client else None
+        self.templates = TemplateRegistry.from_config(config)
+        # Templates behind the rendered outreach, so it can be saved as template references
+        self.outreach_store = OutreachStore()
+        
+        # Finished leads are journaled as they complete, so an interrupted run can resume
+        personalization_config = config.get('personalization', {}) or {}
+        self.journal = OutreachJournal.from_config(config)
+        self.chunk_size = personalization_config.get('chunk_size', 10)
+        self.resume = personalization_config.get('resume', False) if resume is None else resume
+        # Leads with the nearest event deadlines are generated first; late ones are reported
+        self.scheduler = DeadlineScheduler.from_config(config)
+        self.deadline_misses = []
+        # Stakeholders contacted in earlier campaigns get no outreach
+        self.suppression = SuppressionList.from_config(config)
         self.leads_with_outreach = []
     
     def generate_outreach_messages(self) -> List[Dict]:
         """
         Generate personalized outreach messages for stakeholders.
+        Leads are generated in chunks, earliest event deadline first (highest score
+        first without a scheduler), and each finished lead is recorded in the journal;
+        when resuming, leads already recorded are reused.
         
         Returns:
             List[Dict]: Leads with personalized outreach messages
         """
         logger.info("Generating personalized outreach messages for stakeholders")
         
+        leads = self.leads_with_stakeholders
+        leads_with_outreach = [None] * len(leads)
+        
+        if self.journal:
+            if self.resume:
+                recorded = {lead['name']: lead for lead in self.journal.read()}
+                for position, lead in enumerate(leads):
+                    if lead['name'] in recorded:
+                        leads_with_outreach[position] = self._restore_lead(recorded[lead['name']])
+                logger.info(f"Resuming: {len(leads) - leads_with_outreach.count(None)} of {len(leads)} leads already generated")
+            self.journal.open(resume=self.resume)
+        
+        pending = [position for position, lead in enumerate(leads_with_outreach) if lead is None]
+        if self.scheduler:
+            pending = [pending[i] for i in self.scheduler.order([leads[position] for position in pending])]
+        else:
+            pending.sort(key=lambda position: leads[position].get('overall_score', 0), reverse=True)
+        chunk_size = self.chunk_size or max(1, len(pending))
+        completed = {}
+        
+        try:
+            with tqdm(total=len(pending), desc="Generating outreach messages") as progress:
+                for start in range(0, len(pending), chunk_size):
+                    chunk = pending[start:start + chunk_size]
+                    for position, lead_with_outreach in zip(chunk, self._generate_leads([leads[i] for i in chunk])):
+                        leads_with_outreach[position] = lead_with_outreach
+                        if self.journal:
+                            self.journal.append(lead_with_outreach)
+                        if self.scheduler:
+                            completed[position] = self.scheduler.now()
+                    progress.update(len(chunk))
+        finally:
+            if self.journal:
+                self.journal.close()
+        
+        if self.scheduler:
+            self.deadline_misses = self.scheduler.report_misses(leads, completed)
+        
+        self.leads_with_outreach = leads_with_outreach
+        logger.info(f"Generated outreach messages for stakeholders at {len(leads_with_outreach)} companies")
+        
+        return leads_with_outreach
+    
+    def _generate_leads(self, leads: List[Dict]) -> List[Dict]:
+        """
+        Generate outreach for the stakeholders of a group of leads.
+        
+        Args:
+            leads: Leads with stakeholders
+            
+        Returns:
+            List[Dict]: Leads with personalized outreach messages, in the given order
+        """
+        if self.suppression:
+            leads = [self._without_suppressed(lead) for lead in leads]
+        
+        # Company-level context is built once per lead and shared by its stakeholders
+        contexts = [self._build_lead_context(lead) for lead in leads]
+        
+        # Generate the group's LLM messages up front in concurrent, batched requests
+        generated = []
+        if self.llm_client:
+            pairs = [
+                (rank, context, stakeholder)
+                for rank, context in enumerate(contexts)
+                for stakeholder in leads[rank]['stakeholders']
+            ]
+            # Leads arrive in schedule order, so earlier leads take priority
+            generated = self._generate_with_llm(
+                [self._build_prompt(context, stakeholder) for _, context, stakeholder in pairs],
+                [(-rank, stakeholder.get('overall_score', 0)) for rank, _, stakeholder in pairs]
+            )
+        generated_messages = iter(generated)
+        
         leads_with_outreach = []
         
-        for lead in tqdm(self.leads_with_stakeholders, desc="Generating outreach messages"):
-            lead_with_outreach = lead.copy()
+        for lead, context in zip(leads, contexts):
+            lead_with_outreach = annotate(lead)
             stakeholders_with_outreach = []
+            lead_fields = set()
             
             for stakeholder in lead['stakeholders']:
-                stakeholder_with_outreach = stakeholder.copy()
+                stakeholder_with_outreach = annotate(stakeholder)
+                subject_line, outreach_message = next(generated_messages, (None, None))
                 
-                # Generate personalized outreach message
-                outreach_message = self._generate_message(lead, stakeholder)
+                # Fill in anything the LLM did not produce from templates
+                if subject_line is None or outreach_message is None:
+                    subject_line, outreach_message, provenance = self._generate_from_templates(
+                        context, stakeholder, subject_line, outreach_message
+                    )
+                    lead_fields.update(provenance.pop('lead_fields'))
+                    stakeholder_with_outreach['outreach'] = provenance
                 stakeholder_with_outreach['outreach_message'] = outreach_message
-                
-                # Generate subject line
-                subject_line = self._generate_subject_line(lead, stakeholder)
                 stakeholder_with_outreach['subject_line'] = subject_line
                 
                 stakeholders_with_outreach.append(stakeholder_with_outreach)
             
+            # Company-level template parameters are kept once per lead
+            if lead_fields:
+                lead_with_outreach['outreach_params'] = {
+                    field: value for field, value in context['params'].items() if field in lead_fields
+                }
             lead_with_outreach['stakeholders'] = stakeholders_with_outreach
             leads_with_outreach.append(lead_with_outreach)
         
-        self.leads_with_outreach = leads_with_outreach
-        logger.info(f"Generated outreach messages for stakeholders at {len(leads_with_outreach)} companies")
-        
         return leads_with_outreach
     
-    def _generate_message(self, lead: Dict, stakeholder: Dict) -> str:
+    def _without_suppressed(self, lead: Dict) -> Dict:
         """
-        Generate a personalized outreach message for a stakeholder.
-        In a production system, this would use the OpenAI API.
+        Drop a lead's stakeholders that were contacted in earlier campaigns.
         
         Args:
-            lead: Company data
-            stakeholder: Stakeholder data
+            lead: Lead with stakeholders
             
         Returns:
-            str: Personalized outreach message
+            Dict: The lead, or a copy without its suppressed stakeholders
         """
-        # In a production system, we would use a prompt like this with OpenAI:
+        stakeholders, dropped = self.suppression.filter(lead['stakeholders'])
+        if not dropped:
+            return lead
+        logger.info(f"Skipping {dropped} stakeholders at {lead['name']} contacted in earlier campaigns")
+        lead = annotate(lead)
+        lead['stakeholders'] = stakeholders
+        return lead
+    
+    def _restore_lead(self, lead: Dict) -> Dict:
         """
-        prompt = f'''
-        Generate a personalized email outreach message from a DuPont Tedlar sales representative to a potential lead.
+        Take over a lead recorded in the journal by an earlier run.
         
-        Company: {lead['name']}
-        Industry: {lead['industry']}
-        Recipient: {stakeholder['name']}
-        Title: {stakeholder['title']}
-        Interest areas: {', '.join(stakeholder.get('interest_areas', []))}
+        Args:
+            lead: Recorded lead
+            
+        Returns:
+            Dict: The lead, with the templates its outreach came from registered for saving
+        """
+        for stakeholder in lead.get('stakeholders', []):
+            provenance = stakeholder.get('outreach') or {}
+            for kind, template_set in (('subject', self.templates.subjects), ('message', self.templates.messages)):
+                template = template_set.by_id.get(provenance.get(f"{kind}_template"))
+                if template:
+                    self.outreach_store.add_template(kind, template)
+        return lead
+    
+    def _generate_with_llm(self, prompts: List[str],
+                           priorities: List[Tuple[float, float]]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Generate outreach messages with the LLM for many stakeholders at once.
+        Requests go out highest priority first; with a budget configured, stakeholders
+        whose messages do not fit in it are left to the templates.
         
-        Qualification rationale:
-        {lead.get('qualification_rationale', '')}
+        Args:
+            prompts: Prompt per stakeholder
+            priorities: (lead priority, stakeholder score) per stakeholder; leads earlier in the schedule have higher lead priority
+            
+        Returns:
+            List[Tuple[Optional[str], Optional[str]]]: (subject line, message) per prompt, in order;
+                None where generation failed or no subject line was produced
+        """
+        results = [None] * len(prompts)
         
-        Keep the message brief (3-4 paragraphs), personalized, and focused on how DuPont Tedlar's protective films
-        can benefit their signage and graphics applications with superior weather resistance, UV protection, and durability.
+        # Unchanged prompts reuse their cached generation
+        if self.generation_cache:
+            keys = [
+                GenerationCache.key(prompt, self.llm_client.model, self.llm_client.temperature, self.llm_client.max_tokens)
+                for prompt in prompts
+            ]
+            results = self.generation_cache.get_many(keys)
+            logger.info(f"Generation cache: {sum(1 for r in results if r)} of {len(prompts)} messages reused")
         
-        Mention any relevant events or associations they're part of. Be conversational, not pushy.
-        '''
+        missing = [i for i, result in enumerate(results) if result is None]
+        missing.sort(key=lambda i: priorities[i], reverse=True)
         
-        # Call OpenAI API
-        response = openai.ChatCompletion.create(
-            model=self.llm_config.get('model', 'gpt-4'),
-            messages=[{'role': 'user', 'content': prompt}],
-            temperature=self.llm_config.get('temperature', 0.7),
-            max_tokens=self.llm_config.get('max_tokens', 500)
-        )
+        # Budget left over when completions come in under their estimates admits more stakeholders
+        pending = missing
+        completions = {}
+        while pending:
+            if self.budget:
+                admitted, pending = self.budget.plan([(i, prompts[i]) for i in pending])
+            else:
+                admitted, pending = pending, []
+            if not admitted:
+                break
+            
+            usage_before = dict(self.llm_client.usage)
+            completions.update(zip(admitted, self.llm_client.generate([prompts[i] for i in admitted])))
+            if self.budget:
+                self.budget.settle(
+                    [prompts[i] for i in admitted],
+                    [prompts[i] for i in admitted if not completions[i]],
+                    self.llm_client.usage['prompt_tokens'] - usage_before['prompt_tokens'],
+                    self.llm_client.usage['completion_tokens'] - usage_before['completion_tokens']
+                )
         
-        return response.choices[0].message.content
+        generated = []
+        for i, text in completions.items():
+            if text:
+                results[i] = self._parse_generated(text)
+                generated.append(i)
+        
+        failed = len(completions) - len(generated)
+        if failed:
+            logger.warning(f"LLM generation failed for {failed} of {len(prompts)} stakeholders; using templates")
+        if pending:
+            logger.warning(f"LLM budget exhausted: {len(pending)} of {len(prompts)} stakeholders get template messages")
+        if missing:
+            logger.info(f"LLM usage: {self.llm_client.usage}")
+        if self.budget:
+            logger.info(f"LLM budget spent: {self.budget.spent['tokens']} tokens, ${self.budget.spent['cost']:.2f}")
+        
+        if self.generation_cache and generated:
+            self.generation_cache.put_many([(keys[i], results[i][0], results[i][1]) for i in generated])
+        
+        return [result or (None, None) for result in results]
+    
+    def _build_lead_context(self, lead: Dict) -> Dict:
         """
+        Build the company-level context shared by all of a lead's stakeholders.
         
-        # For the prototype, we'll use a template-based approach
-        company_name = lead['name']
-        stakeholder_name = stakeholder['name']
-        stakeholder_title = stakeholder['title']
-        company_industry = lead.get('industry', 'signage and graphics')
+        Args:
+            lead: Company data
+            
+        Returns:
+            Dict: Template parameters that depend only on the company (`params`) and,
+                  in LLM mode, the prompt prefix shared by the company's stakeholders (`prompt_prefix`)
+        """
+        context = {
+            'params': {
+                'company_name': lead['name'],
+                'company_industry': lead.get('industry', 'signage and graphics'),
+                'industry': lead.get('industry', 'Graphics & Signage'),
+                'engagement_context': self._engagement_context(lead),
+                'rationale': lead.get('qualification_rationale', '')
+            }
+        }
+        if self.llm_client:
+            context['prompt_prefix'] = self._build_prompt_prefix(lead)
+        return context
+    
+    def _build_prompt_prefix(self, lead: Dict) -> str:
+        """
+        Build the part of the LLM prompt shared by all of a company's stakeholders.
+        The instructions come first and the company context second, so prompts share
+        the longest possible prefix and providers with prompt caching bill it only once.
+        
+        Args:
+            lead: Company data
+            
+        Returns:
+            str: Prompt prefix
+        """
+        events = ', '.join(event['event_name'] for event in lead.get('events', [])) or 'none known'
+        associations = ', '.join(assoc['association_name'] for assoc in lead.get('associations', [])) or 'none known'
+        
+        return f"""{PROMPT_INSTRUCTIONS}
+
+Company: {lead['name']}
+Industry: {lead.get('industry', '')}
+Events: {events}
+Associations: {associations}
+
+Qualification rationale:
+{lead.get('qualification_rationale', '')}
+
+"""
+    
+    def _build_prompt(self, context: Dict, stakeholder: Dict) -> str:
+        """
+        Build the LLM prompt for a stakeholder's outreach message.
         
-        # Get interests if available
+        Args:
+            context: Lead context from _build_lead_context
+            stakeholder: Stakeholder data
+            
+        Returns:
+            str: Prompt
+        """
+        return f"""{context['prompt_prefix']}Recipient: {stakeholder['name']}
+Title: {stakeholder['title']}
+Interest areas: {', '.join(stakeholder.get('interest_areas', []))}"""
+    
+    def _parse_generated(self, text: str) -> Tuple[Optional[str], str]:
+        """
+        Split an LLM completion into subject line and message.
+        
+        Args:
+            text: Completion text
+            
+        Returns:
+            Tuple[Optional[str], str]: Subject line (None if the completion has none) and message
+        """
+        text = text.strip()
+        first_line, _, rest = text.partition('\n')
+        if first_line.lower().startswith('subject:') and rest.strip():
+            return first_line[len('subject:'):].strip(), rest.strip()
+        return None, text
+    
+    def _interest_text(self, stakeholder: Dict) -> str:
+        """Sentence on the stakeholder's top interest areas (empty if none are known)."""
         interests = stakeholder.get('interest_areas', [])
         interest_text = ""
         if interests:
@@ -124,6 +386,11 @@ class PersonalizationEngine:
             if len(interests) > 1:
                 interest_text += f" and {interests[1]}"
             interest_text += " aligns with our mission."
+        return interest_text
+    
+    def _engagement_context(self, lead: Dict) -> str:
+        """Sentences on the company's events and associations (empty if none are known)."""
+        company_name = lead['name']
         
         # Get events information
         events = lead.get('events', [])
@@ -148,79 +415,57 @@ class PersonalizationEngine:
         elif associations_text:
             engagement_context = associations_text
         
-        # Rationale text
-        rationale = lead.get('qualification_rationale', '')
-        
-        # Generate message templates
-        templates = [
-            f"""Hi {stakeholder_name},
-
-I hope this email finds you well. My name is Sarah from DuPont Tedlar, and I'm reaching out because we've developed protective film solutions that have been helping companies like {company_name} improve durability and weather resistance in their {company_industry} applications.
-
-{engagement_context} {interest_text} Our Tedlar® protective films offer superior UV protection and weather resistance that can extend the life of your graphics products by up to 7 years compared to unprotected materials.
-
-Would you be available for a 15-minute call next week to discuss how our solutions might benefit your specific applications? I'm happy to share some case studies from companies with similar requirements.
-
-Best regards,
-Sarah Miller
-Senior Account Manager
-DuPont Tedlar
-sarah.miller@dupont.com
-(302) 555-1234""",
-
-            f"""Hello {stakeholder_name},
-
-I'm Michael from DuPont Tedlar's Graphics & Signage team. I've been following {company_name}'s innovative work in the {company_industry} space and wanted to connect.
-
-{engagement_context} Given your role as {stakeholder_title}, I thought you might be interested in our latest Tedlar® protective film technology that has been helping industry leaders achieve 5x longer outdoor durability with enhanced color stability.
-
-Our team has recently completed testing showing significant performance improvements over traditional laminates in harsh weather conditions. I'd be happy to share these results and discuss how they might apply to your specific products.
-
-Do you have 15 minutes for a quick call next Tuesday or Wednesday?
-
-Regards,
-Michael Johnson
-Technical Solutions Manager
-DuPont Tedlar
-m.johnson@dupont.com
-(302) 555-4321"""
-        ]
-        
-        # Select a template
-        template_index = hash(stakeholder_name) % len(templates)
-        message = templates[template_index]
-        
-        return message
+        return engagement_context
     
-    def _generate_subject_line(self, lead: Dict, stakeholder: Dict) -> str:
+    def _generate_from_templates(self, context: Dict, stakeholder: Dict, subject_line: Optional[str] = None,
+                                 outreach_message: Optional[str] = None) -> Tuple[str, str, Dict]:
         """
-        Generate a subject line for the outreach message.
+        Generate a subject line and personalized outreach message from templates.
+        Used when no LLM is configured or LLM generation failed; only the parts
+        that are missing are rendered.
         
         Args:
-            lead: Company data
+            context: Lead context from _build_lead_context
             stakeholder: Stakeholder data
+            subject_line: Subject line that is already known
+            outreach_message: Message that is already known
             
         Returns:
-            str: Email subject line
+            Tuple[str, str, Dict]: Subject line, message and the templates they were rendered from
+                                   (`subject_template`, `message_template`), the stakeholder-level
+                                   parameters (`params`) and the company-level fields used (`lead_fields`)
         """
-        company_name = lead['name']
-        industry = lead.get('industry', 'Graphics & Signage')
-        
-        # Subject line templates
-        templates = [
-            f"DuPont Tedlar solutions for {company_name}'s {industry} applications",
-            f"Enhanced durability for {company_name}'s {industry} products",
-            f"Protective film technology for {company_name} | DuPont Tedlar",
-            f"Improving {industry} longevity with DuPont Tedlar",
-            f"Weather-resistant solutions for {company_name} | Quick discussion?",
-            f"DuPont Tedlar: Extending the life of {industry} applications"
-        ]
-        
-        # Select a template
-        template_index = hash(stakeholder['name']) % len(templates)
-        subject_line = templates[template_index]
-        
-        return subject_line
+        selector = stable_hash(stakeholder['name'])
+        subject_template = self.templates.subjects.choose(selector) if subject_line is None else None
+        message_template = self.templates.messages.choose(selector) if outreach_message is None else None
+        
+        params = dict(context['params'])
+        params['stakeholder_name'] = stakeholder['name']
+        params['stakeholder_title'] = stakeholder['title']
+        # The interest sentence is only built when a chosen variant uses it
+        if (subject_template and 'interest_text' in subject_template.fields) or \
+                (message_template and 'interest_text' in message_template.fields):
+            params['interest_text'] = self._interest_text(stakeholder)
+        
+        provenance = {}
+        fields = set()
+        if subject_template:
+            subject_line = subject_template.render(params)
+            self.outreach_store.add_template('subject', subject_template)
+            provenance['subject_template'] = subject_template.id
+            fields |= subject_template.fields
+        if message_template:
+            outreach_message = message_template.render(params)
+            self.outreach_store.add_template('message', message_template)
+            provenance['message_template'] = message_template.id
+            fields |= message_template.fields
+        
+        lead_params = context['params']
+        provenance['params'] = {
+            field: value for field, value in params.items() if field in fields and field not in lead_params
+        }
+        provenance['lead_fields'] = fields.intersection(lead_params)
+        return subject_line, outreach_message, provenance
     
     def save_outreach_data(self, output_file: str = 'data/leads_with_outreach.json') -> str:
         """
@@ -234,28 +479,38 @@ m.johnson@dupont.com
         """
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        save_json(self.leads_with_outreach, output_file)
+        # Template-rendered outreach is stored as template ids and parameters
+        save_companies_data(self.leads_with_outreach, output_file, outreach=self.outreach_store)
+        
+        # The complete output replaces the journal
+        if self.journal:
+            self.journal.remove()
         
         logger.info(f"Saved outreach data for {len(self.leads_with_outreach)} leads to {output_file}")
         
         return output_file
 
 
-def run_personalization_engine(leads_with_stakeholders_file: str, config_path: str = 'config.yaml') -> str:
+def run_personalization_engine(leads_with_stakeholders_file: str, config_path: str = 'config.yaml',
+                               bypass_cache: Optional[bool] = None, resume: Optional[bool] = None) -> str:
     """
     Run the personalization engine.
     
     Args:
         leads_with_stakeholders_file: Path to the leads with stakeholders data file
         config_path: Path to the configuration file
+        bypass_cache: Regenerate messages instead of reusing cached generations
+                      (defaults to `llm.cache.bypass`)
+        resume: Reuse the leads an interrupted run recorded in the journal
+                (defaults to `personalization.resume`)
         
     Returns:
         str: Path to the saved outreach data file
     """
     config = load_config(config_path)
-    leads_with_stakeholders = load_json(leads_with_stakeholders_file)
+    leads_with_stakeholders = load_companies_data(leads_with_stakeholders_file)
     
-    engine = PersonalizationEngine(config, leads_with_stakeholders)
+    engine = PersonalizationEngine(config, leads_with_stakeholders, bypass_cache=bypass_cache, resume=resume)
     
     # Generate outreach messages
     engine.generate_outreach_messages()
@@ -264,12 +519,45 @@ def run_personalization_engine(leads_with_stakeholders_file: str, config_path: s
     return engine.save_outreach_data()
 
 
+def export_outreach(outreach_file: str = 'data/leads_with_outreach.json',
+                    output_file: str = 'data/outreach_export.csv') -> str:
+    """
+    Export outreach as a CSV file with one row per stakeholder, rendering the
+    stored template references into full subject lines and messages.
+    
+    Args:
+        outreach_file: Path to the outreach data file
+        output_file: Path to save the CSV file
+        
+    Returns:
+        str: Path to the saved CSV file
+    """
+    rows = []
+    for lead in load_companies_data(outreach_file):
+        for stakeholder in lead.get('stakeholders', []):
+            rows.append({
+                'company': lead['name'],
+                'name': stakeholder['name'],
+                'title': stakeholder.get('title', ''),
+                'email': stakeholder.get('email', ''),
+                'subject_line': stakeholder.get('subject_line', ''),
+                'outreach_message': stakeholder.get('outreach_message', '')
+            })
+    
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    pd.DataFrame(rows).to_csv(output_file, index=False)
+    logger.info(f"Exported outreach for {len(rows)} stakeholders to {output_file}")
+    
+    return output_file
+
+
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
-        leads_with_stakeholders_file = sys.argv[1]
+    args = [arg for arg in sys.argv[1:] if arg != '--resume']
+    if args:
+        leads_with_stakeholders_file = args[0]
     else:
         leads_with_stakeholders_file = 'data/stakeholders.json'
     
-    run_personalization_engine(leads_with_stakeholders_file)
\ No newline at end of file
+    run_personalization_engine(leads_with_stakeholders_file, resume=True if '--resume' in sys.argv[1:] else None)
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Rate Limiting Utilities for DuPont Tedlar Lead Generation
+
+This module provides a thread-safe token bucket and retry helpers with
+jittered exponential backoff, shared by all external API clients.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Jitter source of its own, so seeding or reseeding the global random module elsewhere
+# cannot synchronize the backoff of clients retrying at the same time
+_jitter = random.Random()
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Create a token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size), defaults to max(1, rate)
+        """
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accumulated since the last update (caller holds the lock)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens without waiting.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            bool: Whether the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """
+        Seconds until the requested tokens would be available.
+
+        Args:
+            tokens: Number of tokens needed
+
+        Returns:
+            float: Wait time in seconds (0 if available now)
+        """
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: Whether the tokens were taken before the timeout
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket with capacity {self.capacity}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+
+            time.sleep(wait)
+
+def backoff_delay(attempt: int, base_delay: float = 0.5, max_delay: float = 30.0) -> float:
+    """
+    Compute a "full jitter" exponential backoff delay.
+
+    Args:
+        attempt: Zero-based retry attempt number
+        base_delay: Delay scale in seconds
+        max_delay: Upper bound on the delay in seconds
+
+    Returns:
+        float: Delay in seconds, uniformly drawn from [0, min(max_delay, base_delay * 2**attempt)]
+    """
+    return _jitter.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+def retry_with_jitter(func: Callable[[], T],
+                      max_retries: int = 3,
+                      base_delay: float = 0.5,
+                      max_delay: float = 30.0,
+                      retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+                      description: str = 'request') -> T:
+    """
+    Call a function, retrying failures with jittered exponential backoff.
+
+    Args:
+        func: Function to call
+        max_retries: Number of retries after the first attempt
+        base_delay: Backoff delay scale in seconds
+        max_delay: Upper bound on a single backoff delay in seconds
+        retry_on: Exception types that trigger a retry
+        description: Description used in log messages
+
+    Returns:
+        The function's return value
+    """
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except retry_on as e:
+            if attempt >= max_retries:
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.warning(f"{description} failed ({e}); retry {attempt + 1}/{max_retries} in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,69 @@
+"""
+Record Annotation Module for DuPont Tedlar Lead Generation
+
+Pipeline stages add fields to company and stakeholder records (enrichment
+data, scores, stakeholders, outreach messages). Instead of copying a record
+at every stage, a stage annotates it: its outputs go into a new overlay
+layer on top of the shared base record, which is never copied or modified.
+Annotated records are ordinary mappings and are flattened when saved.
+"""
+
+import logging
+from collections import ChainMap
+from collections.abc import Mapping
+from typing import Any, Dict
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def annotate(record: Mapping) -> ChainMap:
+    """
+    Get a writable view of a record for a pipeline stage.
+
+    Reads fall through to the record; writes (item assignment, `update`,
+    `setdefault`) go to a new, initially empty layer, so the record itself is
+    shared rather than copied.
+
+    Args:
+        record: Base record (a dict or a previously annotated record)
+
+    Returns:
+        ChainMap: Annotated view of the record
+    """
+    if isinstance(record, ChainMap):
+        return record.new_child()
+    return ChainMap({}, record)
+
+def flatten(record: Mapping) -> Dict:
+    """
+    Merge an annotated record into a plain dict.
+    Keys keep the order of the base record, followed by keys added by later stages.
+
+    Args:
+        record: Record or annotated record
+
+    Returns:
+        Dict: Plain dict with the record's current values
+    """
+    if isinstance(record, ChainMap):
+        # Merge whole layers, base first, rather than looking up key by key through the chain
+        flat = {}
+        for layer in reversed(record.maps):
+            flat.update(layer)
+        return flat
+    return dict(record)
+
+def json_default(obj: Any) -> Any:
+    """
+    `default` hook for json.dump that serializes annotated records as plain objects.
+
+    Args:
+        obj: Object the json module cannot serialize by itself
+
+    Returns:
+        Any: JSON-serializable replacement
+    """
+    if isinstance(obj, Mapping):
+        return flatten(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
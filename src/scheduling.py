@@ -0,0 +1,172 @@
+"""
+Deadline Scheduling Module for DuPont Tedlar Lead Generation
+
+Outreach is worth most before a lead's next trade show. This module gives
+each lead a deadline (its next event date minus a lead time) and orders work
+earliest deadline first: leads whose deadline falls within the scheduling
+horizon come first, most urgent first and higher `overall_score` first among
+equal deadlines, followed by the remaining leads by `overall_score`. Because
+stages process leads in this order under limited concurrency, the most
+urgent leads finish first; leads finished after their deadline are reported
+as misses.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Mapping, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def parse_event_date(value: Optional[str]) -> Optional[date]:
+    """
+    Parse an event date.
+
+    Args:
+        value: ISO date (YYYY-MM-DD)
+
+    Returns:
+        Optional[date]: Date, or None if missing or malformed
+    """
+    try:
+        return date.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+class DeadlineScheduler:
+    """Earliest-deadline-first ordering of leads by their next event."""
+
+    def __init__(self, lead_time_days: int = 14, horizon_days: int = 90, as_of: Optional[date] = None):
+        """
+        Args:
+            lead_time_days: Outreach should be ready this many days before a lead's next event
+            horizon_days: Leads with a deadline within this many days are scheduled by deadline
+            as_of: Date to schedule from (None for today)
+        """
+        self.lead_time_days = lead_time_days
+        self.horizon_days = horizon_days
+        self.as_of = as_of
+        # Wall-clock start of the scheduled work, so completion times can be measured from the schedule date
+        self._started = datetime.now()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['DeadlineScheduler']:
+        """
+        Build a scheduler from the `scheduling` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[DeadlineScheduler]: Scheduler, or None if disabled
+        """
+        scheduling_config = config.get('scheduling', {}) or {}
+        if not scheduling_config.get('enabled', False):
+            return None
+
+        as_of = scheduling_config.get('as_of')
+        if isinstance(as_of, str):
+            as_of = date.fromisoformat(as_of)
+        return cls(
+            lead_time_days=scheduling_config.get('lead_time_days', 14),
+            horizon_days=scheduling_config.get('horizon_days', 90),
+            as_of=as_of
+        )
+
+    def now(self) -> datetime:
+        """Current time on the schedule's clock (shifted to `as_of` when one is set)."""
+        current = datetime.now()
+        if self.as_of is None:
+            return current
+        return datetime.combine(self.as_of, self._started.time()) + (current - self._started)
+
+    def next_event(self, lead: Mapping) -> Optional[date]:
+        """
+        Date of the lead's next event that has not yet taken place.
+
+        Args:
+            lead: Company data with `events`
+
+        Returns:
+            Optional[date]: Event date, or None if no event is upcoming
+        """
+        today = self.now().date()
+        upcoming = [
+            event_date for event_date in (parse_event_date(event.get('event_date')) for event in lead.get('events') or [])
+            if event_date is not None and event_date >= today
+        ]
+        return min(upcoming, default=None)
+
+    def deadline(self, lead: Mapping) -> Optional[date]:
+        """
+        Date by which the lead's outreach should be ready.
+
+        Args:
+            lead: Company data with `events`
+
+        Returns:
+            Optional[date]: Deadline, or None if the lead has no upcoming event
+        """
+        next_event = self.next_event(lead)
+        return next_event - timedelta(days=self.lead_time_days) if next_event else None
+
+    def order(self, leads: List[Mapping]) -> List[int]:
+        """
+        Order leads for processing.
+
+        Args:
+            leads: Company data with `events` and `overall_score`
+
+        Returns:
+            List[int]: Positions into `leads`, in processing order
+        """
+        today = self.now().date()
+        horizon = today + timedelta(days=self.horizon_days)
+        deadlines = [self.deadline(lead) for lead in leads]
+
+        urgent = [i for i, deadline in enumerate(deadlines) if deadline is not None and deadline <= horizon]
+        urgent.sort(key=lambda i: (deadlines[i], -leads[i].get('overall_score', 0)))
+        urgent_set = set(urgent)
+        rest = sorted(
+            (i for i in range(len(leads)) if i not in urgent_set),
+            key=lambda i: leads[i].get('overall_score', 0),
+            reverse=True
+        )
+
+        overdue = sum(1 for i in urgent if deadlines[i] < today)
+        logger.info(
+            f"Schedule: {len(urgent)} leads with a deadline in the next {self.horizon_days} days "
+            f"({overdue} already past), {sum(1 for d in deadlines if d is None)} without an upcoming event"
+        )
+        return urgent + rest
+
+    def report_misses(self, leads: List[Mapping], completed: Dict[int, datetime]) -> List[Dict]:
+        """
+        Find and log leads whose work finished after their deadline.
+
+        Args:
+            leads: Company data with `events`
+            completed: Completion time (from `now()`) per position into `leads`
+
+        Returns:
+            List[Dict]: Misses with `name`, `deadline`, `next_event` and `completed` (ISO dates)
+        """
+        misses = []
+        for position, completed_at in completed.items():
+            lead = leads[position]
+            deadline = self.deadline(lead)
+            if deadline is not None and completed_at.date() > deadline:
+                misses.append({
+                    'name': lead['name'],
+                    'deadline': deadline.isoformat(),
+                    'next_event': self.next_event(lead).isoformat(),
+                    'completed': completed_at.date().isoformat()
+                })
+
+        if misses:
+            logger.warning(
+                f"{len(misses)} leads missed their outreach deadline: " +
+                ", ".join(f"{miss['name']} (due {miss['deadline']}, event {miss['next_event']})" for miss in misses)
+            )
+        return misses
@@ -0,0 +1,243 @@
+"""
+Scoring Module for DuPont Tedlar Lead Generation
+
+This module holds the ICP scoring rules: the score components a company is
+rated on, their weights in the overall lead score and the qualification cutoff.
+Lead qualification scores companies with them, and the enrichment planner
+bounds scores with them before any paid call is made.
+"""
+
+from typing import Dict
+
+# Weights of each score component in the overall lead score
+SCORE_WEIGHTS = {
+    'industry_score': 0.35,
+    'size_score': 0.25,
+    'keyword_score': 0.20,
+    'engagement_score': 0.20
+}
+
+# Minimum overall score for a company to count as a qualified lead
+QUALIFICATION_THRESHOLD = 7.0
+
+# Highest value any score component can take
+MAX_COMPONENT_SCORE = 10.0
+
+# Scraped company fields scanned for ICP keywords
+COMPANY_TEXT_FIELDS = ['description', 'website_text', 'products']
+
+def overall_score(component_scores: Dict[str, float]) -> float:
+    """
+    Combine score components into the overall lead score.
+
+    Args:
+        component_scores: Score per component, keyed as in SCORE_WEIGHTS
+
+    Returns:
+        float: Weighted overall score (0-10)
+    """
+    return sum(component_scores[component] * weight for component, weight in SCORE_WEIGHTS.items())
+
+def company_text(company: Dict) -> str:
+    """
+    Combine the scraped website and product text of a company.
+
+    Args:
+        company: Company data
+
+    Returns:
+        str: Combined text (empty if nothing was scraped)
+    """
+    parts = []
+    for field in COMPANY_TEXT_FIELDS:
+        value = company.get(field)
+        if isinstance(value, list):
+            parts.extend(str(item) for item in value)
+        elif value:
+            parts.append(str(value))
+
+    return "\n".join(parts)
+
+def score_components(company: Dict, icp_criteria: Dict) -> Dict[str, float]:
+    """
+    Calculate the unweighted ICP score components for a company.
+
+    Args:
+        company: Enriched company data
+        icp_criteria: ICP criteria from the configuration
+
+    Returns:
+        Dict[str, float]: Score per component, keyed as in SCORE_WEIGHTS
+    """
+    return {
+        'industry_score': score_industry(company, icp_criteria),
+        'size_score': score_company_size(company, icp_criteria),
+        'keyword_score': score_keywords(company, icp_criteria),
+        'engagement_score': score_engagement(company)
+    }
+
+def score_industry(company: Dict, icp_criteria: Dict) -> float:
+    """
+    Score a company based on industry fit.
+
+    Args:
+        company: Company data
+        icp_criteria: ICP criteria from the configuration
+
+    Returns:
+        float: Industry fit score (0-10)
+    """
+    target_industries = icp_criteria['industries']
+    company_industry = company.get('industry', '')
+
+    # Exact match
+    if company_industry in target_industries:
+        return 10.0
+
+    # Partial match (check if any target industry is part of the company industry)
+    for target in target_industries:
+        if target.lower() in company_industry.lower():
+            return 8.0
+
+    # No match
+    return 4.0
+
+def score_company_size(company: Dict, icp_criteria: Dict) -> float:
+    """
+    Score a company based on size (revenue and employees).
+
+    Args:
+        company: Company data with revenue and employee information
+        icp_criteria: ICP criteria from the configuration
+
+    Returns:
+        float: Company size score (0-10)
+    """
+    # Extract employee count
+    employee_count = company.get('employee_count', 0)
+
+    # Extract revenue (for the prototype, we're using revenue ranges)
+    revenue_str = company.get('estimated_revenue', '')
+
+    # Convert revenue string to approximate value in millions
+    revenue_value = 0
+    if "$10B+" in revenue_str:
+        revenue_value = 10000
+    elif "$5B - $10B" in revenue_str:
+        revenue_value = 7500
+    elif "$1B - $5B" in revenue_str:
+        revenue_value = 3000
+    elif "$500M - $1B" in revenue_str:
+        revenue_value = 750
+    elif "$100M - $500M" in revenue_str:
+        revenue_value = 300
+    elif "$50M - $100M" in revenue_str:
+        revenue_value = 75
+    elif "$10M - $50M" in revenue_str:
+        revenue_value = 30
+
+    # Score based on employee count
+    min_employees = icp_criteria['company_size']['min_employees']
+    preferred_employees = icp_criteria['company_size']['preferred_employees']
+
+    if employee_count >= preferred_employees:
+        employee_score = 10.0
+    elif employee_count >= min_employees:
+        # Scale between 6.0 and 9.9 based on how close to preferred
+        employee_score = 6.0 + 3.9 * (employee_count - min_employees) / (preferred_employees - min_employees)
+    else:
+        # Below minimum but not zero
+        employee_score = max(3.0, 6.0 * employee_count / min_employees)
+
+    # Score based on revenue
+    min_revenue = icp_criteria['company_size']['min_revenue_usd'] / 1_000_000  # Convert to millions
+    preferred_revenue = icp_criteria['company_size']['preferred_revenue_usd'] / 1_000_000  # Convert to millions
+
+    if revenue_value >= preferred_revenue:
+        revenue_score = 10.0
+    elif revenue_value >= min_revenue:
+        # Scale between 6.0 and 9.9 based on how close to preferred
+        revenue_score = 6.0 + 3.9 * (revenue_value - min_revenue) / (preferred_revenue - min_revenue)
+    else:
+        # Below minimum but not zero
+        revenue_score = max(3.0, 6.0 * revenue_value / min_revenue)
+
+    # Combined score (weighted average)
+    combined_score = (employee_score * 0.4) + (revenue_score * 0.6)
+
+    return combined_score
+
+def score_keywords(company: Dict, icp_criteria: Dict) -> float:
+    """
+    Score a company based on keyword relevance.
+
+    Args:
+        company: Company data with detected keywords
+        icp_criteria: ICP criteria from the configuration
+
+    Returns:
+        float: Keyword relevance score (0-10)
+    """
+    target_keywords = set(k.lower() for k in icp_criteria['keywords'])
+    company_keywords = set(k.lower() for k in company.get('keywords', []))
+
+    # Count matches
+    matches = target_keywords.intersection(company_keywords)
+    match_count = len(matches)
+
+    # Calculate score based on number of matches
+    if match_count >= 5:
+        return 10.0
+    elif match_count >= 3:
+        return 8.0
+    elif match_count >= 1:
+        return 6.0
+    else:
+        return 4.0
+
+def score_engagement(company: Dict) -> float:
+    """
+    Score a company based on event and association engagement.
+
+    Args:
+        company: Company data with event and association information
+
+    Returns:
+        float: Engagement score (0-10)
+    """
+    events = company.get('events', [])
+    associations = company.get('associations', [])
+
+    # Count events and association memberships
+    event_count = len(events)
+    association_count = len(associations)
+
+    # Check for premium engagement
+    premium_engagement = False
+    for event in events:
+        if event.get('sponsorship', False):
+            premium_engagement = True
+            break
+
+    for assoc in associations:
+        if assoc.get('membership_level', '').lower() in ['platinum', 'gold']:
+            premium_engagement = True
+            break
+
+        if assoc.get('committee_participation', False):
+            premium_engagement = True
+            break
+
+    # Calculate score
+    if premium_engagement and event_count >= 2 and association_count >= 1:
+        return 10.0
+    elif premium_engagement and (event_count >= 1 or association_count >= 1):
+        return 9.0
+    elif event_count >= 2 and association_count >= 1:
+        return 8.0
+    elif event_count >= 2 or association_count >= 1:
+        return 7.0
+    elif event_count >= 1 or association_count >= 1:
+        return 6.0
+    else:
+        return 4.0
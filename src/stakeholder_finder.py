@@ -4,6 +4,8 @@ Stakeholder Finder Module for DuPont Tedlar Lead Generation
 This module handles identifying key decision-makers at qualified companies.
 """
 
+import hashlib
+import heapq
 import json
 import logging
 import os
@@ -13,12 +15,24 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 from tqdm import tqdm
 
-from src.utils import load_config, load_json, save_json
+from src.email_patterns import EmailPatternEngine, email_domain
+from src.identity_index import StakeholderIdentityIndex
+from src.interest_catalog import InterestCatalog
+from src.normalized_data import load_companies_data, save_companies_data
+from src.people_search import PeopleSearchClient
+from src.records import annotate
+from src.scheduling import DeadlineScheduler
+from src.suppression import SuppressionList
+from src.title_scoring import TitleScorer
+from src.utils import canonical_domain, load_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Stakeholder fields produced by evaluation and reused from the identity index
+EVALUATION_FIELDS = ['title_match_score', 'seniority_score', 'overall_score', 'interest_areas']
+
 class StakeholderFinder:
     """Identifies key decision-makers at qualified companies."""
     
@@ -26,36 +40,165 @@ class StakeholderFinder:
         self.config = config
         self.qualified_leads = qualified_leads
         self.target_titles = config['icp_criteria']['decision_makers']['titles']
+        self.people_search_client = PeopleSearchClient.from_config(config)
+        self.title_scorer = TitleScorer(self.target_titles)
+        self.interest_catalog = InterestCatalog.from_config(config)
+        self.email_engine = EmailPatternEngine.from_config(config)
+        self.identity_index = StakeholderIdentityIndex.from_config(config)
+        self.scheduler = DeadlineScheduler.from_config(config)
+        self.suppression = SuppressionList.from_config(config)
+        self.search_ttl_days = (config.get('identity_index', {}) or {}).get('search_ttl_days', 30)
+        self.max_stakeholders_per_company = config.get('data_collection', {}).get('max_stakeholders_per_company')
         self.companies_with_stakeholders = []
         
     def find_stakeholders(self) -> List[Dict]:
         """
         Find stakeholders for qualified companies.
-        In a production system, this would query LinkedIn Sales Navigator or similar.
+        Queries the configured people-search providers (LinkedIn Sales Navigator, Clay)
+        when there are any, otherwise generates mock stakeholders for the prototype.
         
         Returns:
             List[Dict]: Companies with stakeholder information
         """
         logger.info("Finding stakeholders for qualified companies")
         
+        # Search all companies up front in batched, concurrent queries, skipping
+        # companies whose stakeholders were searched recently on an earlier run
+        people_by_domain = {}
+        known_by_domain = {}
+        if self.people_search_client:
+            # Companies with the nearest event deadlines are searched first
+            order = self.scheduler.order(self.qualified_leads) if self.scheduler else range(len(self.qualified_leads))
+            domains = list(dict.fromkeys(canonical_domain(self.qualified_leads[i].get('website', '')) for i in order))
+            if self.identity_index:
+                for domain in domains:
+                    known = self.identity_index.recent_search(domain, self.search_ttl_days)
+                    if known is not None:
+                        known_by_domain[domain] = known
+                logger.info(f"Reusing recent people searches for {len(known_by_domain)} of {len(domains)} companies")
+            people_by_domain = self.people_search_client.search([d for d in domains if d not in known_by_domain])
+        
         companies_with_stakeholders = []
+        seen_identities = {}
+        suppressed = 0
         
         for company in tqdm(self.qualified_leads, desc="Finding stakeholders"):
-            # In a real system, this would call LinkedIn Sales Navigator API
-            # or similar service to find actual stakeholders
-            # For the prototype, we'll generate mock stakeholders
+            company_with_stakeholders = annotate(company)
+            domain = canonical_domain(company.get('website', ''))
+            
+            if domain in known_by_domain:
+                # Snapshots already carry their email addresses
+                stakeholders = [dict(stakeholder) for stakeholder in known_by_domain[domain]]
+                stakeholders, dropped = self._drop_suppressed(stakeholders)
+                suppressed += dropped
+            else:
+                if self.people_search_client:
+                    people, dropped = self._drop_suppressed(people_by_domain.get(domain, []))
+                    stakeholders = [self._to_stakeholder(person) for person in people]
+                else:
+                    stakeholders, dropped = self._drop_suppressed(self._mock_find_stakeholders(company['name']))
+                
+                # Addresses for the whole company come from one learned domain pattern
+                self.email_engine.generate_bulk(email_domain(domain), stakeholders)
+                
+                # People found by LinkedIn URL are dropped above, the rest once their address is known
+                stakeholders, dropped_by_email = self._drop_suppressed(stakeholders)
+                suppressed += dropped + dropped_by_email
+            
+            if self.identity_index:
+                stakeholders = self._merge_identities(company, domain, stakeholders, seen_identities,
+                                                      record_search=bool(self.people_search_client) and domain not in known_by_domain)
             
-            company_with_stakeholders = company.copy()
-            stakeholders = self._mock_find_stakeholders(company['name'])
             company_with_stakeholders['stakeholders'] = stakeholders
             
             companies_with_stakeholders.append(company_with_stakeholders)
         
+        self.email_engine.save()
+        
         self.companies_with_stakeholders = companies_with_stakeholders
+        if self.suppression:
+            logger.info(f"Skipped {suppressed} stakeholders contacted in earlier campaigns")
         logger.info(f"Found stakeholders for {len(companies_with_stakeholders)} companies")
         
         return companies_with_stakeholders
     
+    def _drop_suppressed(self, stakeholders: List[Dict]) -> Tuple[List[Dict], int]:
+        """
+        Drop people contacted in earlier campaigns, before any further work is done for them.
+        
+        Args:
+            stakeholders: People or stakeholders with `linkedin_url` and/or `email`
+            
+        Returns:
+            Tuple[List[Dict], int]: Remaining people and the number dropped
+        """
+        if not self.suppression:
+            return stakeholders, 0
+        return self.suppression.filter(stakeholders)
+    
+    def _merge_identities(self, company: Dict, domain: str, stakeholders: List[Dict],
+                          seen_identities: Dict[str, Tuple[str, Dict]], record_search: bool = False) -> List[Dict]:
+        """
+        Resolve stakeholders against the identity index and drop people already listed this run.
+        A duplicate is kept once, under the first company it was found at, and the other
+        companies are recorded in its `also_listed_under` field.
+        
+        Args:
+            company: Company the stakeholders were found at
+            domain: Canonical company domain
+            stakeholders: Stakeholders found at the company
+            seen_identities: Identity id -> (company name, stakeholder) kept this run (updated in place)
+            record_search: Whether to remember this company's search results for later runs
+            
+        Returns:
+            List[Dict]: Stakeholders not already listed, each with an `identity_id`
+        """
+        unique = []
+        identity_ids = []
+        
+        for stakeholder in stakeholders:
+            identity_id = self.identity_index.register(stakeholder, email_domain(domain), company['name'])
+            identity_ids.append(identity_id)
+            
+            if identity_id in seen_identities:
+                first_company, first = seen_identities[identity_id]
+                also_listed_under = first.setdefault('also_listed_under', [])
+                if company['name'] != first_company and company['name'] not in also_listed_under:
+                    also_listed_under.append(company['name'])
+                continue
+            
+            stakeholder['identity_id'] = identity_id
+            seen_identities[identity_id] = (company['name'], stakeholder)
+            unique.append(stakeholder)
+        
+        # Empty results are not remembered, since a failed search batch also returns none
+        if record_search and identity_ids:
+            self.identity_index.record_search(domain, list(dict.fromkeys(identity_ids)))
+        
+        return unique
+    
+    def _to_stakeholder(self, person: Dict) -> Dict:
+        """
+        Convert a people-search result into a stakeholder entry.
+        
+        Args:
+            person: Person returned by a people-search provider
+            
+        Returns:
+            Dict: Stakeholder data
+        """
+        return {
+            "name": person.get('name', ''),
+            "title": person.get('title', ''),
+            "department": person.get('department', ''),
+            "years_at_company": person.get('years_at_company'),
+            "location": person.get('location', ''),
+            "linkedin_url": person.get('linkedin_url', ''),
+            "email": person.get('email', ''),
+            "relevance_score": person.get('relevance_score', 0.0),
+            "source": person.get('source', '')
+        }
+    
     def _mock_find_stakeholders(self, company_name: str) -> List[Dict]:
         """
         Generate mock stakeholders for a company.
@@ -126,7 +269,6 @@ class StakeholderFinder:
                 "years_at_company": years_at_company,
                 "location": location,
                 "linkedin_url": linkedin_url,
-                "email": f"{first_name.lower()}.{last_name.lower()}@{company_name.lower().replace(' ', '')}.com",
                 "relevance_score": round(random.uniform(7.5, 9.8), 1)  # Only high relevance stakeholders
             }
             
@@ -140,6 +282,8 @@ class StakeholderFinder:
     def evaluate_stakeholders(self) -> List[Dict]:
         """
         Evaluate stakeholders based on their potential value to DuPont Tedlar.
+        Only the top `max_stakeholders_per_company` stakeholders of each company by
+        title pre-score are kept and fully evaluated.
         
         Returns:
             List[Dict]: Companies with evaluated stakeholders
@@ -147,20 +291,27 @@ class StakeholderFinder:
         logger.info("Evaluating stakeholders for alignment with DuPont Tedlar's ICP")
         
         companies_with_evaluated_stakeholders = []
+        reused = 0
         
         for company in tqdm(self.companies_with_stakeholders, desc="Evaluating stakeholders"):
-            company_with_evaluated = company.copy()
+            company_with_evaluated = annotate(company)
             evaluated_stakeholders = []
             
-            for stakeholder in company['stakeholders']:
-                evaluated = stakeholder.copy()
+            for stakeholder in self._select_top_stakeholders(company['stakeholders']):
+                evaluated = annotate(stakeholder)
                 
-                # Evaluate title match
-                title_match_score = self._score_title_match(stakeholder['title'])
-                evaluated['title_match_score'] = round(title_match_score, 2)
+                # Reuse the evaluation from an earlier run if nothing it depends on changed
+                evaluation_key = self._evaluation_key(stakeholder)
+                prior = self._prior_evaluation(stakeholder, evaluation_key)
+                if prior is not None:
+                    evaluated.update(prior)
+                    reused += 1
+                    evaluated_stakeholders.append(evaluated)
+                    continue
                 
-                # Evaluate stakeholder seniority
-                seniority_score = self._score_seniority(stakeholder['title'])
+                # Evaluate title match and seniority (cached per normalized title)
+                title_match_score, seniority_score = self.title_scorer.score(stakeholder['title'])
+                evaluated['title_match_score'] = round(title_match_score, 2)
                 evaluated['seniority_score'] = round(seniority_score, 2)
                 
                 # Calculate overall score
@@ -172,6 +323,11 @@ class StakeholderFinder:
                     stakeholder['title'], stakeholder['department']
                 )
                 
+                if self.identity_index and stakeholder.get('identity_id'):
+                    evaluation = {field: evaluated[field] for field in EVALUATION_FIELDS}
+                    evaluation['key'] = evaluation_key
+                    self.identity_index.store_evaluation(stakeholder['identity_id'], evaluation)
+                
                 evaluated_stakeholders.append(evaluated)
             
             # Sort stakeholders by overall score
@@ -180,53 +336,93 @@ class StakeholderFinder:
             
             companies_with_evaluated_stakeholders.append(company_with_evaluated)
         
+        cache_info = self.title_scorer.cache_info()
+        logger.info(f"Title score cache: {cache_info['hits']} hits, {cache_info['misses']} misses")
+        if self.identity_index:
+            logger.info(f"Reused prior evaluations for {reused} stakeholders")
+        
         self.companies_with_stakeholders = companies_with_evaluated_stakeholders
         return companies_with_evaluated_stakeholders
     
-    def _score_title_match(self, title: str) -> float:
+    def _prescore(self, stakeholder: Dict) -> Tuple[float, float]:
         """
-        Score how well a stakeholder's title matches the target titles.
+        Cheap ranking key for a stakeholder: the title-based overall score (cached per
+        normalized title), then the search relevance score as a tie-breaker.
         
         Args:
-            title: Stakeholder's title
+            stakeholder: Stakeholder data
             
         Returns:
-            float: Title match score (0-10)
+            Tuple[float, float]: Pre-score and relevance score
         """
-        # Convert title and target titles to lowercase for comparison
-        title_lower = title.lower()
-        
-        # Check for exact matches
-        for target_title in self.target_titles:
-            if target_title.lower() == title_lower:
-                return 10.0
+        title_match_score, seniority_score = self.title_scorer.score(stakeholder.get('title', ''))
+        return (title_match_score * 0.7) + (seniority_score * 0.3), stakeholder.get('relevance_score') or 0.0
+    
+    def _select_top_stakeholders(self, stakeholders: List[Dict]) -> List[Dict]:
+        """
+        Keep the top `max_stakeholders_per_company` stakeholders by pre-score.
+        Candidates stream through a bounded heap, so selection costs O(n log N)
+        for n candidates instead of scoring and sorting every candidate in full.
         
-        # Check for partial matches
-        for target_title in self.target_titles:
-            target_lower = target_title.lower()
+        Args:
+            stakeholders: Stakeholders found at a company
             
-            # Check for key terms in both directions
-            key_terms = target_lower.split()
-            title_terms = title_lower.split()
+        Returns:
+            List[Dict]: Selected stakeholders, best first
+        """
+        limit = self.max_stakeholders_per_company
+        if not limit or len(stakeholders) <= limit:
+            return stakeholders
+        
+        return heapq.nlargest(limit, stakeholders, key=self._prescore)
+    
+    def _evaluation_key(self, stakeholder: Dict) -> str:
+        """
+        Fingerprint the inputs of a stakeholder's evaluation (title, department, target
+        titles and interest catalog).
+        
+        Args:
+            stakeholder: Stakeholder data
             
-            matches = sum(1 for term in key_terms if term in title_lower)
+        Returns:
+            str: Evaluation key
+        """
+        inputs = [stakeholder.get('title', ''), stakeholder.get('department', ''), self.target_titles,
+                  self.interest_catalog.fingerprint]
+        return hashlib.sha1(json.dumps(inputs).encode('utf-8')).hexdigest()
+    
+    def _prior_evaluation(self, stakeholder: Dict, evaluation_key: str) -> Optional[Dict]:
+        """
+        Get a stakeholder's evaluation from an earlier run, if it is still valid.
+        
+        Args:
+            stakeholder: Stakeholder data
+            evaluation_key: Fingerprint of the current evaluation inputs
             
-            if matches / len(key_terms) >= 0.5:
-                return 8.0 + (matches / len(key_terms)) * 2.0
-        
-        # Check for role-related keywords
-        keywords = [
-            "product", "innovation", "r&d", "research", "development",
-            "procurement", "purchasing", "technical", "technology",
-            "graphics", "signage", "materials", "production"
-        ]
+        Returns:
+            Optional[Dict]: Evaluated fields, or None if the stakeholder must be evaluated
+        """
+        if not self.identity_index or not stakeholder.get('identity_id'):
+            return None
         
-        keyword_matches = sum(1 for kw in keywords if kw in title_lower)
-        if keyword_matches > 0:
-            return 5.0 + (keyword_matches / len(keywords)) * 3.0
+        record = self.identity_index.get(stakeholder['identity_id'])
+        evaluation = (record or {}).get('evaluation')
+        if not evaluation or evaluation.get('key') != evaluation_key:
+            return None
         
-        # Default score
-        return 5.0
+        return {field: evaluation[field] for field in EVALUATION_FIELDS}
+    
+    def _score_title_match(self, title: str) -> float:
+        """
+        Score how well a stakeholder's title matches the target titles.
+        
+        Args:
+            title: Stakeholder's title
+            
+        Returns:
+            float: Title match score (0-10)
+        """
+        return self.title_scorer.score(title)[0]
     
     def _score_seniority(self, title: str) -> float:
         """
@@ -238,26 +434,7 @@ class StakeholderFinder:
         Returns:
             float: Seniority score (0-10)
         """
-        title_lower = title.lower()
-        
-        # Executive level
-        if any(term in title_lower for term in ["ceo", "cto", "cio", "cfo", "president", "chief"]):
-            return 10.0
-        
-        # VP level
-        if "vp" in title_lower or "vice president" in title_lower:
-            return 9.0
-        
-        # Director level
-        if "director" in title_lower:
-            return 8.0
-        
-        # Manager level
-        if "manager" in title_lower or "head of" in title_lower:
-            return 7.0
-        
-        # Default score
-        return 6.0
+        return self.title_scorer.score(title)[1]
     
     def _generate_stakeholder_interests(self, title: str, department: str) -> List[str]:
         """
@@ -270,79 +447,7 @@ class StakeholderFinder:
         Returns:
             List[str]: Likely interest areas
         """
-        # Seed random with title and department for consistent results
-        random.seed(hash(title + department) % 1000)
-        
-        # Potential interest areas
-        potential_interests = {
-            "Product Development": [
-                "new material technologies", 
-                "product performance improvements",
-                "sustainability features",
-                "protective film applications",
-                "extended product lifecycle"
-            ],
-            "R&D": [
-                "material innovation", 
-                "UV resistance technologies",
-                "weatherproofing advances",
-                "durability testing",
-                "advanced polymers"
-            ],
-            "Innovation": [
-                "next-generation materials", 
-                "sustainable solutions",
-                "material science breakthroughs",
-                "advanced coatings",
-                "environmental protection"
-            ],
-            "Procurement": [
-                "cost reduction", 
-                "supplier reliability",
-                "long-term partnerships",
-                "material consistency",
-                "simplified supply chain"
-            ],
-            "Technical": [
-                "technical specifications", 
-                "application methods",
-                "integration with existing systems",
-                "testing protocols",
-                "performance metrics"
-            ],
-            "Marketing": [
-                "market differentiation", 
-                "product positioning",
-                "competitive advantages",
-                "customer satisfaction",
-                "value propositions"
-            ]
-        }
-        
-        # Get interests based on department
-        department_interests = potential_interests.get(department, [])
-        
-        # Add title-based interests
-        title_lower = title.lower()
-        title_interests = []
-        
-        if "product" in title_lower:
-            title_interests.extend(["product innovation", "material performance"])
-        
-        if "innovation" in title_lower or "r&d" in title_lower:
-            title_interests.extend(["cutting-edge materials", "research collaboration"])
-        
-        if "technical" in title_lower:
-            title_interests.extend(["technical specifications", "implementation support"])
-        
-        if "procurement" in title_lower or "purchasing" in title_lower:
-            title_interests.extend(["vendor consolidation", "quality consistency"])
-        
-        # Combine and select random subset of interests
-        all_interests = list(set(department_interests + title_interests))
-        num_interests = min(4, len(all_interests))
-        
-        return random.sample(all_interests, num_interests)
+        return self.interest_catalog.interests_for(title, department)
     
     def save_stakeholders(self, output_file: str = 'data/stakeholders.json') -> str:
         """
@@ -356,7 +461,7 @@ class StakeholderFinder:
         """
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        save_json(self.companies_with_stakeholders, output_file)
+        save_companies_data(self.companies_with_stakeholders, output_file)
         
         logger.info(f"Saved stakeholder data for {len(self.companies_with_stakeholders)} companies to {output_file}")
         
@@ -375,7 +480,7 @@ def run_stakeholder_finder(qualified_leads_file: str, config_path: str = 'config
         str: Path to the saved stakeholder data file
     """
     config = load_config(config_path)
-    qualified_leads = load_json(qualified_leads_file)
+    qualified_leads = load_companies_data(qualified_leads_file)
     
     finder = StakeholderFinder(config, qualified_leads)
     
@@ -0,0 +1,264 @@
+"""
+Suppression Module for DuPont Tedlar Lead Generation
+
+This module keeps the persistent set of stakeholders contacted in earlier
+campaigns, identified by email address and LinkedIn URL, so the pipeline
+does not search, score, generate for or email them again. Lookups go to a
+Bloom filter first; almost every stakeholder is not suppressed, and the
+filter answers those from memory. A positive answer is confirmed against the
+exact on-disk store (a SQLite table), so a false positive never suppresses
+anyone. The filter is saved next to the store and rebuilt from it whenever
+the two disagree.
+
+Contacts are added by the email sender as messages are delivered, and can be
+imported from earlier campaigns with `python -m src.suppression contacts.csv`.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import struct
+import sys
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from src.cache import PersistentCache
+from src.identity_index import normalize_email, normalize_linkedin_url
+from src.utils import load_config
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Bloom filter file header: capacity, bit count, hash count, items added
+BLOOM_HEADER = struct.Struct('<QQQQ')
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, using double hashing of one BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Items the filter is sized for
+            error_rate: False-positive rate at capacity
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def to_bytes(self) -> bytes:
+        """Build the on-disk representation."""
+        return BLOOM_HEADER.pack(self.capacity, self.num_bits, self.hash_count, self.count) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, error_rate: float) -> Optional['BloomFilter']:
+        """
+        Read the on-disk representation.
+
+        Args:
+            data: File contents
+            error_rate: False-positive rate the filter should have at capacity
+
+        Returns:
+            Optional[BloomFilter]: Filter, or None if the data is damaged or was sized for another error rate
+        """
+        if len(data) < BLOOM_HEADER.size:
+            return None
+        capacity, num_bits, hash_count, count = BLOOM_HEADER.unpack_from(data)
+        bloom = cls(capacity, error_rate)
+        if (num_bits, hash_count) != (bloom.num_bits, bloom.hash_count) or \
+                len(data) != BLOOM_HEADER.size + len(bloom.bits):
+            return None
+        bloom.count = count
+        bloom.bits[:] = data[BLOOM_HEADER.size:]
+        return bloom
+
+def suppression_keys(stakeholder: Mapping) -> List[str]:
+    """
+    Build the suppression keys of a stakeholder.
+
+    Args:
+        stakeholder: Stakeholder data
+
+    Returns:
+        List[str]: Keys for the email address and LinkedIn URL (where available)
+    """
+    keys = []
+    email = normalize_email(stakeholder.get('email', ''))
+    if email:
+        keys.append(f"em:{email}")
+    linkedin_url = normalize_linkedin_url(stakeholder.get('linkedin_url', ''))
+    if linkedin_url:
+        keys.append(f"li:{linkedin_url}")
+    return keys
+
+class SuppressionList:
+    """Contacted identities, answered by a Bloom filter and confirmed by an exact store."""
+
+    def __init__(self, path: str, capacity: int = 1000000, error_rate: float = 0.001):
+        """
+        Args:
+            path: SQLite database file for the exact store (the filter is saved as "<path>.bloom")
+            capacity: Identities the filter is sized for at least (it grows when the store outgrows it)
+            error_rate: Bloom filter false-positive rate
+        """
+        # Never evicts: a forgotten contact would be emailed again
+        self.store = PersistentCache(path, max_entries=sys.maxsize, table='suppressed')
+        self.bloom_path = f"{path}.bloom"
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.stats = {'checked': 0, 'suppressed': 0, 'false_positives': 0}
+        self.bloom = self._load_bloom()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['SuppressionList']:
+        """
+        Build a suppression list from the `suppression` section of the configuration.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            Optional[SuppressionList]: Suppression list, or None if disabled
+        """
+        suppression_config = config.get('suppression', {}) or {}
+        if not suppression_config.get('enabled', False):
+            return None
+        return cls(suppression_config.get('path', 'data/cache/suppression.sqlite'),
+                   capacity=suppression_config.get('capacity', 1000000),
+                   error_rate=suppression_config.get('error_rate', 0.001))
+
+    def _load_bloom(self) -> BloomFilter:
+        """Load the saved filter, rebuilding it from the store if it is missing, stale or too small."""
+        stored = len(self.store)
+
+        if os.path.exists(self.bloom_path):
+            with open(self.bloom_path, 'rb') as f:
+                bloom = BloomFilter.from_bytes(f.read(), self.error_rate)
+            if bloom is not None and bloom.count == stored and stored <= bloom.capacity:
+                return bloom
+
+        bloom = BloomFilter(max(self.capacity, 2 * stored), self.error_rate)
+        for key, _ in self.store.items():
+            bloom.add(key)
+        if stored:
+            logger.info(f"Rebuilt suppression filter from {stored} stored identities")
+        return bloom
+
+    def save(self) -> None:
+        """Write the filter next to the store."""
+        directory = os.path.dirname(self.bloom_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.bloom_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(self.bloom.to_bytes())
+        os.replace(temp_path, self.bloom_path)
+
+    def is_suppressed(self, stakeholder: Mapping) -> bool:
+        """
+        Whether a stakeholder was contacted before.
+
+        Args:
+            stakeholder: Stakeholder with `email` and/or `linkedin_url`
+
+        Returns:
+            bool: Whether any of their identities is suppressed
+        """
+        self.stats['checked'] += 1
+        for key in suppression_keys(stakeholder):
+            if key in self.bloom:
+                if key in self.store:
+                    self.stats['suppressed'] += 1
+                    return True
+                self.stats['false_positives'] += 1
+        return False
+
+    def filter(self, stakeholders: List[Mapping]) -> Tuple[List[Mapping], int]:
+        """
+        Drop suppressed stakeholders.
+
+        Args:
+            stakeholders: Stakeholders
+
+        Returns:
+            Tuple[List[Mapping], int]: Remaining stakeholders (in order) and the number dropped
+        """
+        kept = [stakeholder for stakeholder in stakeholders if not self.is_suppressed(stakeholder)]
+        return kept, len(stakeholders) - len(kept)
+
+    def add(self, stakeholders: Iterable[Mapping], reason: str = 'contacted') -> int:
+        """
+        Suppress stakeholders' identities and save the filter.
+
+        Args:
+            stakeholders: Stakeholders with `email` and/or `linkedin_url`
+            reason: Why they are suppressed (e.g. "contacted", "imported")
+
+        Returns:
+            int: Identities newly suppressed
+        """
+        entries = {}
+        for stakeholder in stakeholders:
+            for key in suppression_keys(stakeholder):
+                if key not in entries and not (key in self.bloom and key in self.store):
+                    entries[key] = {'reason': reason, 'name': stakeholder.get('name', '')}
+        if not entries:
+            return 0
+
+        self.store.set_many(list(entries.items()))
+        if len(self.store) > self.bloom.capacity:
+            # Past capacity the false-positive rate climbs; rebuild at twice the size
+            self.bloom = self._load_bloom()
+        else:
+            for key in entries:
+                self.bloom.add(key)
+        self.save()
+        return len(entries)
+
+def import_contacts(contacts_files: List[str], config_path: str = 'config.yaml') -> int:
+    """
+    Suppress the contacts of earlier campaigns.
+
+    Args:
+        contacts_files: CSV files with `email` and/or `linkedin_url` columns
+        config_path: Path to the configuration file
+
+    Returns:
+        int: Identities newly suppressed
+    """
+    config = load_config(config_path)
+    suppression = SuppressionList.from_config(config)
+    if suppression is None:
+        raise ValueError("Suppression is disabled (set suppression.enabled)")
+
+    added = 0
+    for contacts_file in contacts_files:
+        contacts = pd.read_csv(contacts_file, dtype=str).fillna('')
+        added += suppression.add(contacts.to_dict('records'), reason='imported')
+    logger.info(f"Suppressed {added} new identities from {len(contacts_files)} files")
+    return added
+
+
+if __name__ == "__main__":
+    import_contacts(sys.argv[1:])
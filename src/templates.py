@@ -0,0 +1,211 @@
+"""
+Templates Module for DuPont Tedlar Lead Generation
+
+This module holds the outreach message and subject line templates used when
+no LLM is configured (or LLM generation fails). Templates are loaded once,
+from the file named in the `templates` section of the configuration or from
+the built-in defaults below, and compiled up front: placeholders are parsed
+and checked when loading, so a typo in an edited template fails at startup
+instead of in the middle of a run.
+
+Each stakeholder gets one variant per template set, chosen by a stable hash
+of the stakeholder's name, so the same person gets the same variant in every
+run. Variants are compiled into functions that join the literal text with
+parameter values, and the caller only builds the parameters the chosen
+variants reference (see `CompiledTemplate.fields`).
+"""
+
+import logging
+import os
+import zlib
+from string import Formatter
+from typing import Dict, List, Optional
+
+import yaml
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Placeholders templates may use
+TEMPLATE_FIELDS = {
+    'stakeholder_name': "Stakeholder's full name",
+    'stakeholder_title': "Stakeholder's job title",
+    'company_name': "Company name",
+    'company_industry': "Company industry, or \"signage and graphics\" if unknown",
+    'industry': "Company industry, or \"Graphics & Signage\" if unknown",
+    'interest_text': "Sentence on the stakeholder's top interest areas (may be empty)",
+    'engagement_context': "Sentences on shared events and associations (may be empty)",
+    'rationale': "Lead qualification rationale"
+}
+
+DEFAULT_MESSAGE_TEMPLATES = [
+    {
+        'id': 'sarah-durability',
+        'text': """Hi {stakeholder_name},
+
+I hope this email finds you well. My name is Sarah from DuPont Tedlar, and I'm reaching out because we've developed protective film solutions that have been helping companies like {company_name} improve durability and weather resistance in their {company_industry} applications.
+
+{engagement_context} {interest_text} Our Tedlar® protective films offer superior UV protection and weather resistance that can extend the life of your graphics products by up to 7 years compared to unprotected materials.
+
+Would you be available for a 15-minute call next week to discuss how our solutions might benefit your specific applications? I'm happy to share some case studies from companies with similar requirements.
+
+Best regards,
+Sarah Miller
+Senior Account Manager
+DuPont Tedlar
+sarah.miller@dupont.com
+(302) 555-1234"""
+    },
+    {
+        'id': 'michael-technical',
+        'text': """Hello {stakeholder_name},
+
+I'm Michael from DuPont Tedlar's Graphics & Signage team. I've been following {company_name}'s innovative work in the {company_industry} space and wanted to connect.
+
+{engagement_context} Given your role as {stakeholder_title}, I thought you might be interested in our latest Tedlar® protective film technology that has been helping industry leaders achieve 5x longer outdoor durability with enhanced color stability.
+
+Our team has recently completed testing showing significant performance improvements over traditional laminates in harsh weather conditions. I'd be happy to share these results and discuss how they might apply to your specific products.
+
+Do you have 15 minutes for a quick call next Tuesday or Wednesday?
+
+Regards,
+Michael Johnson
+Technical Solutions Manager
+DuPont Tedlar
+m.johnson@dupont.com
+(302) 555-4321"""
+    }
+]
+
+DEFAULT_SUBJECT_TEMPLATES = [
+    {'id': 'solutions', 'text': "DuPont Tedlar solutions for {company_name}'s {industry} applications"},
+    {'id': 'durability', 'text': "Enhanced durability for {company_name}'s {industry} products"},
+    {'id': 'technology', 'text': "Protective film technology for {company_name} | DuPont Tedlar"},
+    {'id': 'longevity', 'text': "Improving {industry} longevity with DuPont Tedlar"},
+    {'id': 'discussion', 'text': "Weather-resistant solutions for {company_name} | Quick discussion?"},
+    {'id': 'lifetime', 'text': "DuPont Tedlar: Extending the life of {industry} applications"}
+]
+
+def stable_hash(value: str) -> int:
+    """Hash that is the same in every process (unlike the built-in `hash` of a string)."""
+    return zlib.crc32(value.encode('utf-8'))
+
+class CompiledTemplate:
+    """A template variant, parsed and checked once and compiled into a render function."""
+
+    __slots__ = ('id', 'text', 'fields', 'render')
+
+    def __init__(self, template_id: str, text: str):
+        """
+        Args:
+            template_id: Variant id, recorded with generated outreach
+            text: Template text with {placeholder} fields
+
+        Raises:
+            ValueError: If the text is malformed or uses unknown placeholders or format specs
+        """
+        pieces = []
+        fields = set()
+        for literal, field_name, format_spec, conversion in Formatter().parse(text):
+            if literal:
+                pieces.append(repr(literal))
+            if field_name is None:
+                continue
+            if field_name not in TEMPLATE_FIELDS:
+                raise ValueError(
+                    f"Template {template_id!r} uses unknown placeholder {{{field_name}}}; "
+                    f"available: {sorted(TEMPLATE_FIELDS)}"
+                )
+            if format_spec or conversion:
+                raise ValueError(f"Template {template_id!r}: format specs are not supported in {{{field_name}}}")
+            fields.add(field_name)
+            pieces.append(f"params[{field_name!r}]")
+
+        if not pieces:
+            pieces.append("''")
+        # The generated function only joins string literals and parameter lookups,
+        # which avoids re-parsing the template text on every render
+        source = f"def render(params):\n    return ''.join(({', '.join(pieces)},))\n"
+        namespace = {}
+        exec(compile(source, f"<template {template_id}>", 'exec'), namespace)
+
+        self.id = template_id
+        self.text = text
+        self.fields = frozenset(fields)
+        self.render = namespace['render']
+
+class TemplateSet:
+    """Variants of one kind of template (messages or subject lines)."""
+
+    def __init__(self, name: str, templates: List[Dict]):
+        """
+        Args:
+            name: Set name, for error messages
+            templates: Variants, each with `id` and `text`
+
+        Raises:
+            ValueError: If there are no variants or a variant is invalid
+        """
+        if not templates:
+            raise ValueError(f"No {name} templates configured")
+        self.name = name
+        self.variants = [
+            CompiledTemplate(str(template.get('id', f"{name}-{index}")), template['text'])
+            for index, template in enumerate(templates)
+        ]
+        self.by_id = {template.id: template for template in self.variants}
+
+    def choose(self, selector: int) -> CompiledTemplate:
+        """
+        Pick the variant for a selector; the same selector always gets the same variant.
+
+        Args:
+            selector: `stable_hash` of the selection key (stakeholder name)
+
+        Returns:
+            CompiledTemplate: Chosen variant
+        """
+        return self.variants[selector % len(self.variants)]
+
+class TemplateRegistry:
+    """Compiled outreach message and subject line templates."""
+
+    def __init__(self, messages: Optional[List[Dict]] = None, subjects: Optional[List[Dict]] = None):
+        """
+        Args:
+            messages: Message variants, each with `id` and `text`
+            subjects: Subject line variants, each with `id` and `text`
+        """
+        self.messages = TemplateSet('message', messages or DEFAULT_MESSAGE_TEMPLATES)
+        self.subjects = TemplateSet('subject', subjects or DEFAULT_SUBJECT_TEMPLATES)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'TemplateRegistry':
+        """
+        Build a registry from the `templates` section of the configuration.
+        Templates in the file named by `templates.file` take precedence over
+        `templates.messages` and `templates.subjects`; missing sets use the defaults.
+
+        Args:
+            config: Configuration data
+
+        Returns:
+            TemplateRegistry: Registry
+        """
+        templates_config = dict(config.get('templates', {}) or {})
+
+        templates_file = templates_config.get('file')
+        if templates_file:
+            if os.path.exists(templates_file):
+                with open(templates_file, 'r', encoding='utf-8') as f:
+                    templates_config.update(yaml.safe_load(f) or {})
+            else:
+                logger.warning(f"Templates file not found: {templates_file}; using built-in templates")
+
+        registry = cls(templates_config.get('messages'), templates_config.get('subjects'))
+        logger.info(
+            f"Loaded {len(registry.messages.variants)} message and "
+            f"{len(registry.subjects.variants)} subject line templates"
+        )
+        return registry
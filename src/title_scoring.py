@@ -0,0 +1,264 @@
+"""
+Title Scoring Module for DuPont Tedlar Lead Generation
+
+This module normalizes job titles (case, punctuation and abbreviations such as
+"VP" or "Dir.") and scores them against the target decision-maker titles.
+Scores are cached per normalized title, so evaluating many stakeholders costs
+about as much as evaluating their distinct titles.
+"""
+
+import logging
+import re
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Abbreviations expanded during normalization, keyed by lowercase token
+TITLE_ABBREVIATIONS = {
+    'vp': 'vice president',
+    'svp': 'senior vice president',
+    'evp': 'executive vice president',
+    'avp': 'assistant vice president',
+    'ceo': 'chief executive officer',
+    'cto': 'chief technology officer',
+    'cio': 'chief information officer',
+    'cfo': 'chief financial officer',
+    'coo': 'chief operating officer',
+    'cpo': 'chief procurement officer',
+    'dir': 'director',
+    'mgr': 'manager',
+    'mngr': 'manager',
+    'sr': 'senior',
+    'jr': 'junior',
+    'rnd': 'r&d',
+    'eng': 'engineering',
+    'mktg': 'marketing',
+    'ops': 'operations',
+    'dev': 'development',
+}
+
+# Role-related keywords that earn partial credit for titles without a target match
+ROLE_KEYWORDS = [
+    "product", "innovation", "r&d", "research", "development",
+    "procurement", "purchasing", "technical", "technology",
+    "graphics", "signage", "materials", "production"
+]
+
+# Punctuation and whitespace separate tokens; "&" is kept for "R&D"
+_TOKEN_PATTERN = re.compile(r"[a-z0-9&]+")
+
+@lru_cache(maxsize=65536)
+def normalize_title(title: str) -> str:
+    """
+    Normalize a job title for matching.
+
+    Args:
+        title: Raw job title (e.g. "Sr. VP, Product Dev.")
+
+    Returns:
+        str: Lowercase title with punctuation removed and abbreviations expanded
+             (e.g. "senior vice president product development")
+    """
+    tokens = _TOKEN_PATTERN.findall(title.lower())
+    return ' '.join(TITLE_ABBREVIATIONS.get(token, token) for token in tokens)
+
+class TitleIndex:
+    """Inverted index from normalized title terms to the target titles containing them."""
+
+    def __init__(self, target_titles: List[str], keywords: List[str] = ROLE_KEYWORDS):
+        """
+        Args:
+            target_titles: Normalized target titles, in priority order
+            keywords: Role-related keywords for partial credit
+        """
+        self.target_titles = target_titles
+        self.exact_titles = set(target_titles)
+        self.term_counts = [len(title.split()) for title in target_titles]
+        self.keywords = set(keywords)
+
+        # term -> [(target index, occurrences of the term in that target)]
+        postings = defaultdict(dict)
+        for index, title in enumerate(target_titles):
+            for term in title.split():
+                postings[term][index] = postings[term].get(index, 0) + 1
+        self.postings = {term: sorted(targets.items()) for term, targets in postings.items()}
+
+        self.max_term_length = max((len(term) for term in self.postings), default=0)
+        self.max_keyword_length = max((len(keyword) for keyword in self.keywords), default=0)
+        self._token_terms = {}
+
+    def _terms_in_token(self, token: str) -> Tuple[frozenset, frozenset]:
+        """
+        Find the index terms and keywords that occur inside a title token.
+        A term occurs in a title exactly when it is a substring of one of its tokens,
+        since terms contain no spaces; tokens are few and short, so their substrings
+        are enumerated once and memoized.
+        """
+        found = self._token_terms.get(token)
+        if found is None:
+            longest = max(self.max_term_length, self.max_keyword_length)
+            substrings = {
+                token[start:end]
+                for start in range(len(token))
+                for end in range(start + 1, min(len(token), start + longest) + 1)
+            }
+            found = (frozenset(substrings & self.postings.keys()), frozenset(substrings & self.keywords))
+            if len(self._token_terms) >= 100000:
+                self._token_terms.clear()
+            self._token_terms[token] = found
+        return found
+
+    def match(self, title: str) -> Tuple[bool, float, int]:
+        """
+        Count term overlap between a normalized title and the target titles in one pass.
+
+        Args:
+            title: Normalized title
+
+        Returns:
+            Tuple[bool, float, int]: Whether a target matches exactly; the fraction of terms
+                found for the first target (in priority order) with at least half of its terms
+                in the title, or 0.0 if none; and the number of role keywords found
+        """
+        if title in self.exact_titles:
+            return True, 1.0, 0
+
+        terms = set()
+        keywords = set()
+        for token in set(title.split()):
+            token_terms, token_keywords = self._terms_in_token(token)
+            terms |= token_terms
+            keywords |= token_keywords
+
+        overlap = defaultdict(int)
+        for term in terms:
+            for index, occurrences in self.postings[term]:
+                overlap[index] += occurrences
+
+        partial_ratio = 0.0
+        for index in sorted(overlap):
+            ratio = overlap[index] / self.term_counts[index]
+            if ratio >= 0.5:
+                partial_ratio = ratio
+                break
+
+        return False, partial_ratio, len(keywords)
+
+class TitleScorer:
+    """Scores stakeholder titles with a bounded LRU cache keyed by normalized title."""
+
+    def __init__(self, target_titles: List[str], max_cache_size: int = 10000):
+        """
+        Args:
+            target_titles: Target decision-maker titles from the ICP
+            max_cache_size: Maximum number of normalized titles kept in the cache
+        """
+        self.target_titles = [normalize_title(title) for title in target_titles]
+        self.index = TitleIndex(self.target_titles)
+        self.max_cache_size = max_cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def score(self, title: str) -> Tuple[float, float]:
+        """
+        Score a title, using the cache when its normalized form was seen before.
+
+        Args:
+            title: Raw job title
+
+        Returns:
+            Tuple[float, float]: Title match score and seniority score (0-10 each)
+        """
+        normalized = normalize_title(title)
+
+        scores = self._cache.get(normalized)
+        if scores is not None:
+            self.hits += 1
+            self._cache.move_to_end(normalized)
+            return scores
+
+        self.misses += 1
+        scores = (self._score_title_match(normalized), self._score_seniority(normalized))
+        self._cache[normalized] = scores
+        if len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+
+        return scores
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Report cache effectiveness.
+
+        Returns:
+            Dict[str, int]: Cache hits, misses, current size and maximum size
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._cache),
+            'max_size': self.max_cache_size
+        }
+
+    def _score_title_match(self, title: str) -> float:
+        """
+        Score how well a normalized title matches the target titles.
+
+        Args:
+            title: Normalized title
+
+        Returns:
+            float: Title match score (0-10)
+        """
+        exact, partial_ratio, keyword_matches = self.index.match(title)
+
+        # Check for exact matches
+        if exact:
+            return 10.0
+
+        # Check for partial matches (the first target sharing at least half its terms)
+        if partial_ratio:
+            return 8.0 + partial_ratio * 2.0
+
+        # Check for role-related keywords
+        if keyword_matches > 0:
+            return 5.0 + (keyword_matches / len(ROLE_KEYWORDS)) * 3.0
+
+        # Default score
+        return 5.0
+
+    def _score_seniority(self, title: str) -> float:
+        """
+        Score the seniority level of a normalized title.
+
+        Args:
+            title: Normalized title
+
+        Returns:
+            float: Seniority score (0-10)
+        """
+        tokens = title.split()
+        is_vice_president = 'vice president' in title
+
+        # Executive level ("vice president" is not an executive title)
+        if 'chief' in tokens or ('president' in tokens and not is_vice_president):
+            return 10.0
+
+        # VP level
+        if is_vice_president:
+            return 9.0
+
+        # Director level
+        if 'director' in tokens:
+            return 8.0
+
+        # Manager level
+        if 'manager' in tokens or 'head of' in title:
+            return 7.0
+
+        # Default score
+        return 6.0
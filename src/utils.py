@@ -5,10 +5,13 @@ Utility functions for DuPont Tedlar Lead Generation.
 import json
 import logging
 import os
+from collections.abc import Mapping
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+from src.records import json_default
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -39,19 +42,27 @@ def load_config(config_path: str) -> Dict:
         # Return empty config if loading fails
         return {}
 
-def save_json(data: Any, output_file: str) -> None:
+def save_json(data: Any, output_file: str, indent: Optional[int] = 2) -> None:
     """
     Save data to a JSON file.
     
     Args:
         data: Data to save
         output_file: Path to save the data
+        indent: Indentation for readable output (None writes compact JSON)
     """
     try:
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
         with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            if indent is None:
+                # Compact output is the one case json.dumps hands to the C encoder, which is
+                # several times faster than streaming, at the cost of holding the text in memory
+                f.write(json.dumps(data, default=json_default))
+            else:
+                # Indented output always goes through the pure-Python encoder; stream it
+                # rather than building the whole document as one string first
+                json.dump(data, f, indent=indent, default=json_default)
     except Exception as e:
         logger.error(f"Error saving data to {output_file}: {e}")
 
@@ -98,10 +109,33 @@ def validate_data(data: Any, schema_type: str) -> bool:
         return False
     
     # Check if all required fields are present
-    if isinstance(data, dict):
+    if isinstance(data, Mapping):
         return all(field in data for field in required_fields)
     elif isinstance(data, list):
         return all(all(field in item for field in required_fields) for item in data)
     else:
         logger.warning(f"Data is not a dict or list: {type(data)}")
-        return False
\ No newline at end of file
+        return False
+
+def canonical_domain(website: str) -> str:
+    """
+    Reduce a website URL to its canonical domain.
+    
+    Args:
+        website: Website URL or bare domain (e.g. "https://www.3m.com/3M/en_US/")
+        
+    Returns:
+        str: Lowercase domain without scheme, "www." prefix, port or path (e.g. "3m.com")
+    """
+    domain = (website or '').strip().lower()
+    
+    if '://' in domain:
+        domain = domain.split('://', 1)[1]
+    
+    domain = domain.split('/', 1)[0].split('?', 1)[0].split('#', 1)[0]
+    domain = domain.rsplit('@', 1)[-1].split(':', 1)[0].rstrip('.')
+    
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    
+    return domain
@@ -0,0 +1,154 @@
+"""
+What-If Scoring Module for DuPont Tedlar Lead Generation
+
+This module compares candidate ICP weightings and qualification thresholds
+against the current configuration by scoring every company under every
+candidate configuration in a single matrix operation.
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.lead_qualification import LeadQualifier
+from src.normalized_data import load_companies_data
+from src.scoring import QUALIFICATION_THRESHOLD, SCORE_WEIGHTS
+from src.utils import load_config
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Column order of the component score matrix and of every weight vector
+SCORE_COMPONENTS = list(SCORE_WEIGHTS.keys())
+
+class WhatIfAnalyzer:
+    """Scores companies under many candidate weight/threshold configurations at once."""
+
+    def __init__(self, qualifier: LeadQualifier):
+        self.qualifier = qualifier
+        self.company_names = [company['name'] for company in qualifier.companies_data]
+
+        # Component scores only depend on company data, so compute them once
+        self.component_matrix = np.array(
+            [
+                [qualifier.score_components(company)[component] for component in SCORE_COMPONENTS]
+                for company in qualifier.companies_data
+            ],
+            dtype=float
+        ).reshape(-1, len(SCORE_COMPONENTS))
+
+        self.baseline_weights = np.array([SCORE_WEIGHTS[c] for c in SCORE_COMPONENTS], dtype=float)
+        self.baseline_scores = self.component_matrix @ self.baseline_weights
+        self.baseline_ranks = self._rank(self.baseline_scores[:, np.newaxis])[:, 0]
+        self.baseline_qualified = self.baseline_scores >= QUALIFICATION_THRESHOLD
+
+    @staticmethod
+    def _rank(scores: np.ndarray) -> np.ndarray:
+        """
+        Convert a score matrix into 1-based ranks per column (highest score first).
+
+        Args:
+            scores: Score matrix of shape (companies, configurations)
+
+        Returns:
+            np.ndarray: Rank matrix with the same shape as scores
+        """
+        order = np.argsort(-scores, axis=0, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, scores.shape[0] + 1)[:, np.newaxis], axis=0)
+        return ranks
+
+    def evaluate(self,
+                 weights: Union[Sequence[Sequence[float]], np.ndarray],
+                 thresholds: Union[float, Sequence[float], np.ndarray] = QUALIFICATION_THRESHOLD,
+                 top_n: Optional[int] = None) -> List[Dict]:
+        """
+        Score every company under every candidate configuration.
+
+        Args:
+            weights: Weight matrix of shape (configurations, 4), columns ordered as SCORE_COMPONENTS
+            thresholds: Qualification threshold per configuration, or one threshold for all
+            top_n: Size of the top-ranked set compared against the baseline ranking
+                   (defaults to the number of leads qualified under the current configuration)
+
+        Returns:
+            List[Dict]: Per-configuration qualified counts, ranking overlap and rank shifts
+        """
+        weight_matrix = np.atleast_2d(np.asarray(weights, dtype=float))
+        if weight_matrix.shape[1] != len(SCORE_COMPONENTS):
+            raise ValueError(
+                f"Expected weight vectors with {len(SCORE_COMPONENTS)} components "
+                f"({', '.join(SCORE_COMPONENTS)}), got shape {weight_matrix.shape}"
+            )
+
+        num_configs = weight_matrix.shape[0]
+        threshold_vector = np.broadcast_to(np.asarray(thresholds, dtype=float), (num_configs,))
+
+        if top_n is None:
+            top_n = int(self.baseline_qualified.sum())
+
+        # (companies x 4) @ (4 x configurations) -> (companies x configurations)
+        scores = self.component_matrix @ weight_matrix.T
+        ranks = self._rank(scores)
+        qualified = scores >= threshold_vector[np.newaxis, :]
+
+        # Qualified-set overlap with the baseline (Jaccard index)
+        intersection = (qualified & self.baseline_qualified[:, np.newaxis]).sum(axis=0)
+        union = (qualified | self.baseline_qualified[:, np.newaxis]).sum(axis=0)
+        qualified_overlap = np.divide(intersection, union, out=np.ones(num_configs), where=union > 0)
+
+        # Top-N overlap with the baseline ranking
+        baseline_top = self.baseline_ranks <= top_n
+        top_overlap = ((ranks <= top_n) & baseline_top[:, np.newaxis]).sum(axis=0) / max(1, top_n)
+
+        # Positive shift means the company moved up the ranking
+        rank_shifts = self.baseline_ranks[:, np.newaxis] - ranks
+
+        results = []
+        for i in range(num_configs):
+            shifts = rank_shifts[:, i]
+            results.append({
+                'weights': dict(zip(SCORE_COMPONENTS, weight_matrix[i].tolist())),
+                'threshold': float(threshold_vector[i]),
+                'qualified_count': int(qualified[:, i].sum()),
+                'qualified_overlap': round(float(qualified_overlap[i]), 4),
+                'top_n_overlap': round(float(top_overlap[i]), 4),
+                'mean_abs_rank_shift': round(float(np.abs(shifts).mean()) if shifts.size else 0.0, 4),
+                'max_abs_rank_shift': int(np.abs(shifts).max()) if shifts.size else 0,
+                'rank_shifts': {
+                    name: int(shift) for name, shift in zip(self.company_names, shifts) if shift != 0
+                }
+            })
+
+        return results
+
+
+def run_what_if_analysis(companies_file: str,
+                         weights: Union[Sequence[Sequence[float]], np.ndarray],
+                         thresholds: Union[float, Sequence[float], np.ndarray] = QUALIFICATION_THRESHOLD,
+                         config_path: str = 'config.yaml') -> List[Dict]:
+    """
+    Run a what-if comparison of candidate scoring configurations.
+
+    Args:
+        companies_file: Path to the companies data file
+        weights: Weight matrix of shape (configurations, 4), columns ordered as SCORE_COMPONENTS
+        thresholds: Qualification threshold per configuration, or one threshold for all
+        config_path: Path to the configuration file
+
+    Returns:
+        List[Dict]: Per-configuration comparison against the current scoring
+    """
+    config = load_config(config_path)
+    companies_data = load_companies_data(companies_file)
+
+    qualifier = LeadQualifier(config, companies_data)
+    qualifier.enrich_company_data()
+
+    analyzer = WhatIfAnalyzer(qualifier)
+    results = analyzer.evaluate(weights, thresholds)
+
+    logger.info(f"Evaluated {len(results)} scoring configurations over {len(analyzer.company_names)} companies")
+    return results